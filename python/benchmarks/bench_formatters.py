@@ -0,0 +1,83 @@
+"""Cost of turning discovered tools into an LLM request's ``tools`` field.
+
+An agent sends the same handful of tools on every turn. Compares, per
+turn of 5 tools with 12-field schemas:
+
+    convert          ``_FORMAT_CONVERTERS`` building the definitions
+    json.dumps       converting and encoding the list on every turn
+    cached           ``_tools_json`` splicing memoized per-tool bytes
+
+Tool dicts are re-decoded for every turn in the "remote" rows (as a fresh
+``/getTools`` response would be) and reused in the "registry" rows. Pure
+CPU, no client or network.
+
+Sample run (Python 3.11, openai format):
+
+    convert (registry)            8.5 us/turn
+    json.dumps (registry)        95.0 us/turn
+    cached (registry)            13.8 us/turn
+    convert (remote)              8.4 us/turn
+    json.dumps (remote)         120.8 us/turn
+    cached (remote)              31.9 us/turn
+
+Every cached row includes the check of each schema against the copy
+its bytes were encoded from. Memoizing the converted dicts themselves
+would not pay: that lookup and check cost as much as the conversion.
+
+Run:
+    python benchmarks/bench_formatters.py [--turns N] [--format openai]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from typing import Any, Callable, Dict, List
+
+from fastn._formatters import _FORMAT_CONVERTERS, _tools_json
+
+
+def _tools() -> List[Dict[str, Any]]:
+    fields = {
+        f"field_{i}": {"type": "string", "description": f"Value for field {i} of the request"}
+        for i in range(12)
+    }
+    schema = {"type": "object", "properties": {"body": {
+        "type": "object", "properties": fields, "required": ["field_0"],
+    }}}
+    return [
+        {"name": f"tool_{t}", "description": f"Tool number {t}", "toolId": f"act_{t}", "inputSchema": schema}
+        for t in range(5)
+    ]
+
+
+def _time(label: str, turns: int, make: Callable[[], Any], fn: Callable[[Any], Any]) -> None:
+    inputs = [make() for _ in range(turns)]
+    start = time.perf_counter()
+    for tools in inputs:
+        fn(tools)
+    print(f"{label:<24} {(time.perf_counter() - start) / turns * 1e6:8.1f} us/turn")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--turns", type=int, default=20000)
+    parser.add_argument("--format", default="openai", choices=sorted(_FORMAT_CONVERTERS))
+    args = parser.parse_args()
+
+    fmt = args.format
+    shared = _tools()
+    payload = json.dumps(shared)
+    sources = {"registry": lambda: shared, "remote": lambda: json.loads(payload)}
+    for source, make in sources.items():
+        _time(f"convert ({source})", args.turns, make, _FORMAT_CONVERTERS[fmt])
+        _time(
+            f"json.dumps ({source})", args.turns, make,
+            lambda t: json.dumps(_FORMAT_CONVERTERS[fmt](t)).encode(),
+        )
+        _time(f"cached ({source})", args.turns, make, lambda t: _tools_json(t, fmt))
+
+
+if __name__ == "__main__":
+    main()
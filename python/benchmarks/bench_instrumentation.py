@@ -0,0 +1,77 @@
+"""Per-call overhead of request instrumentation in ``fastn._http``.
+
+Sends executeTool calls through an in-process ``httpx.MockTransport`` so the
+numbers measure client-side CPU only, with no network. Three cases:
+
+    bare httpx       ``client._http.post`` with the same headers — the floor
+    hooks disabled   ``FastnClient.execute`` with no sink (the default)
+    hooks enabled    same, with a sink that does the work verbose mode does
+
+Run:
+    python benchmarks/bench_instrumentation.py [--calls N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+
+from fastn import FastnClient
+from fastn.instrumentation import _VerboseInstrumentation
+
+_URL = "https://live.fastn.ai/api/ucl/executeTool"
+_RESPONSE = {"body": {"ok": True, "items": [{"id": i, "text": "x" * 64} for i in range(50)]}}
+_PARAMS = {"channel": "general", "text": "hello " * 40, "blocks": [{"type": "section"}] * 20}
+
+
+def _handler(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json=_RESPONSE)
+
+
+def _make_client(tmpdir: str, verbose_sink: bool) -> FastnClient:
+    fastn_dir = Path(tmpdir) / ".fastn"
+    fastn_dir.mkdir(exist_ok=True)
+    (fastn_dir / "config.json").write_text(json.dumps({"api_key": "k" * 32, "project_id": "p"}))
+    client = FastnClient(config_path=str(fastn_dir / "config.json"), max_retries=0)
+    client._http = httpx.Client(transport=httpx.MockTransport(_handler), headers=client._headers)
+    if verbose_sink:
+        client._instrumentation = _VerboseInstrumentation(lambda *args: None)
+    return client
+
+
+def _time(fn, calls: int) -> float:
+    for _ in range(min(200, calls)):
+        fn()
+    started = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - started) / calls * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=5000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        plain = _make_client(tmpdir, verbose_sink=False)
+        logged = _make_client(tmpdir, verbose_sink=True)
+        payload = {"input": {"toolId": "act_x", "parameters": _PARAMS}}
+
+        headers = dict(plain._headers)
+        bare = _time(lambda: plain._http.post(_URL, json=payload, headers=headers).json(), args.calls)
+        disabled = _time(lambda: plain.execute("act_x", _PARAMS), args.calls)
+        enabled = _time(lambda: logged.execute("act_x", _PARAMS), args.calls)
+
+    print(f"bare httpx       {bare:8.1f} us/call")
+    print(f"hooks disabled   {disabled:8.1f} us/call  (+{disabled - bare:.1f} us over bare)")
+    print(f"hooks enabled    {enabled:8.1f} us/call  (+{enabled - bare:.1f} us over bare)")
+
+
+if __name__ == "__main__":
+    main()
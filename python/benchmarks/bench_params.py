@@ -0,0 +1,105 @@
+"""Cost of routing kwargs into a tool's parameter structure.
+
+Compares the original per-call schema walk with the compiled routing plan
+``_build_params_from_schema`` now uses (``fastn._params``). Pure CPU, no
+client or network. Schemas:
+
+    single wrapper   one ``body`` object with 12 fields
+    multi wrapper    ``param``/``url``/``body`` objects plus primitives
+    wide             one ``body`` object with 200 fields (large connector schema)
+
+Run:
+    python benchmarks/bench_params.py [--calls N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import time
+from typing import Any, Dict
+
+from fastn.client import _build_params_from_schema
+
+
+def _legacy(tool_info: Dict[str, Any], kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """The schema walk every call used to do, kept here for comparison."""
+    props = tool_info.get("inputSchema", {}).get("properties", {})
+    if not props:
+        return {"body": kwargs} if kwargs else {}
+    object_groups: Dict[str, Dict[str, Any]] = {}
+    flat_fields: set = set()
+    for key, pdata in props.items():
+        if isinstance(pdata, dict) and pdata.get("type") == "object":
+            object_groups[key] = pdata.get("properties", {})
+        else:
+            flat_fields.add(key)
+    if not object_groups:
+        return kwargs
+    result: Dict[str, Any] = {}
+    used: set = set()
+    for group_key, inner_props in object_groups.items():
+        group_params = {f: kwargs[f] for f in inner_props if f in kwargs}
+        used.update(group_params)
+        if group_params:
+            result[group_key] = group_params
+    for field_name in flat_fields:
+        if field_name in kwargs:
+            result[field_name] = kwargs[field_name]
+            used.add(field_name)
+    remaining = {k: v for k, v in kwargs.items() if k not in used}
+    if remaining:
+        logging.getLogger("fastn").debug("Unknown kwargs %s", list(remaining))
+        result.setdefault(next(iter(object_groups)), {}).update(remaining)
+    return result
+
+
+def _obj(n: int, prefix: str = "f") -> Dict[str, Any]:
+    return {"type": "object", "properties": {f"{prefix}{i}": {"type": "string"} for i in range(n)}}
+
+
+_CASES = {
+    "single wrapper": (
+        {"inputSchema": {"properties": {"body": _obj(12)}}},
+        {"f0": "general", "f1": "hello", "f2": True},
+    ),
+    "multi wrapper": (
+        {"inputSchema": {"properties": {
+            "param": _obj(4, "p"), "url": _obj(3, "u"), "body": _obj(10, "b"),
+            "limit": {"type": "integer"}, "cursor": {"type": "string"},
+        }}},
+        {"p0": "x", "u1": "y", "b2": "z", "b3": 1, "limit": 50},
+    ),
+    "wide": (
+        {"inputSchema": {"properties": {"body": _obj(200)}}},
+        {"f10": 1, "f120": 2, "f199": 3},
+    ),
+}
+
+
+def _time(fn, tool_info, kwargs, calls: int) -> float:
+    for _ in range(min(1000, calls)):
+        fn(tool_info, kwargs)
+    started = time.perf_counter()
+    for _ in range(calls):
+        fn(tool_info, kwargs)
+    return (time.perf_counter() - started) / calls * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=100_000)
+    args = parser.parse_args()
+
+    print(f"{'schema':<16} {'schema walk':>12} {'compiled':>12} {'speedup':>8}")
+    for name, (tool_info, kwargs) in _CASES.items():
+        assert _legacy(tool_info, kwargs) == _build_params_from_schema(tool_info, kwargs)
+        legacy = _time(_legacy, tool_info, kwargs, args.calls)
+        compiled = _time(_build_params_from_schema, tool_info, kwargs, args.calls)
+        print(
+            f"{name:<16} {legacy:9.2f} us {compiled:9.2f} us {legacy / compiled:7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
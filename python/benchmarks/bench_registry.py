@@ -0,0 +1,154 @@
+"""Client construction cost with the shared, lazily loaded registry.
+
+Builds a synthetic registry (default 250 connectors x 20 tools with small
+schemas) and compares:
+
+    eager copy       what each client used to do: ``load_registry`` +
+                     ``load_migrations`` in ``__init__``, one copy per client
+    lazy shared      ``FastnClient(...)`` now — nothing is read until a
+                     connector or catalog method is used
+    lazy + first use construction plus ``client.slack`` (first use parses
+                     once per process, then one ``stat()`` per client)
+
+and the Python heap held by N live clients (tracemalloc) in each mode.
+It then compares a cold load of one connector from registry.json (parse
+everything) with registry.bin (map the file, decode that connector).
+
+Run:
+    python benchmarks/bench_registry.py [--clients N] [--connectors N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from fastn import FastnClient
+from fastn.config import load_migrations, load_registry, save_registry
+
+
+def _schema(i: int) -> dict:
+    return {
+        "type": "object",
+        "properties": {
+            "body": {
+                "type": "object",
+                "properties": {
+                    f"field_{j}": {"type": "string", "description": f"Field {j} of tool {i}"}
+                    for j in range(8)
+                },
+            },
+        },
+    }
+
+
+def _write_env(tmpdir: str, connectors: int, tools: int) -> str:
+    fastn_dir = Path(tmpdir) / ".fastn"
+    fastn_dir.mkdir()
+    (fastn_dir / "config.json").write_text(json.dumps({"api_key": "k" * 32, "project_id": "p"}))
+    registry = {
+        "version": "bench",
+        "connectors": {
+            ("slack" if c == 0 else f"connector_{c}"): {
+                "id": f"c{c}",
+                "tools": {
+                    f"tool_{t}": {"toolId": f"act_{c}_{t}", "inputSchema": _schema(t)}
+                    for t in range(tools)
+                },
+            }
+            for c in range(connectors)
+        },
+    }
+    save_registry(registry, fastn_dir)
+    return str(fastn_dir / "config.json")
+
+
+def _eager(config_path: str) -> FastnClient:
+    client = FastnClient(config_path=config_path)
+    fastn_dir = Path(config_path).parent
+    client._registry_data = load_registry(fastn_dir)
+    client._migrations_data = load_migrations(fastn_dir)
+    return client
+
+
+def _lazy(config_path: str) -> FastnClient:
+    return FastnClient(config_path=config_path)
+
+
+def _lazy_used(config_path: str) -> FastnClient:
+    client = FastnClient(config_path=config_path)
+    _ = client.slack
+    return client
+
+
+def _cold_one_connector(fastn_dir: Path, lazy: bool):
+    registry = load_registry(fastn_dir, lazy=lazy)
+    return registry, registry["connectors"]["slack"]
+
+
+def _cold_ms_and_heap(fastn_dir: Path, lazy: bool, n: int = 5):
+    started = time.perf_counter()
+    for _ in range(n):
+        _cold_one_connector(fastn_dir, lazy)
+    ms = (time.perf_counter() - started) / n * 1e3
+    tracemalloc.start()
+    kept = _cold_one_connector(fastn_dir, lazy)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return ms, current / 1e6
+
+
+def _per_client_us(make, config_path: str, n: int) -> float:
+    make(config_path).close()
+    started = time.perf_counter()
+    for _ in range(n):
+        make(config_path).close()
+    return (time.perf_counter() - started) / n * 1e6
+
+
+def _heap_mb(make, config_path: str, n: int) -> float:
+    tracemalloc.start()
+    clients = [make(config_path) for _ in range(n)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    for client in clients:
+        client.close()
+    return current / 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--connectors", type=int, default=250)
+    parser.add_argument("--tools", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        config_path = _write_env(tmpdir, args.connectors, args.tools)
+        size = (Path(config_path).parent / "registry.json").stat().st_size
+        print(f"registry.json: {size / 1e6:.1f} MB, {args.clients} clients")
+        print(f"{'mode':<18} {'construct':>12} {'heap':>10}")
+        for label, make in (
+            ("eager copy", _eager),
+            ("lazy shared", _lazy),
+            ("lazy + first use", _lazy_used),
+        ):
+            us = _per_client_us(make, config_path, args.clients)
+            mb = _heap_mb(make, config_path, args.clients)
+            print(f"{label:<18} {us / 1000:9.2f} ms {mb:7.1f} MB")
+
+        fastn_dir = Path(config_path).parent
+        bin_size = (fastn_dir / "registry.bin").stat().st_size
+        print(f"\ncold load of one connector (registry.bin: {bin_size / 1e6:.1f} MB)")
+        for label, lazy in (("registry.json", False), ("registry.bin", True)):
+            ms, mb = _cold_ms_and_heap(fastn_dir, lazy)
+            print(f"{label:<18} {ms:9.2f} ms {mb:7.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Recall of local tool discovery against recorded ``/getTools`` results.
+
+Two steps, so the comparison itself runs offline and is repeatable:
+
+    record   send each prompt (one per line in a text file) to the live
+             ``/getTools`` endpoint with the current ``.fastn`` credentials and
+             write ``{"prompt": ..., "tools": [tool ids...]}`` lines to JSONL
+    compare  rank the synced registry locally for every recorded prompt and
+             report, per local mode, how many of the server's tools appear in
+             the local top k (recall@k), how often the server's top tool is
+             also the local top tool, and the mean local query latency
+
+Tools are matched by ``toolId`` (falling back to ``actionId``, then name).
+Server tools missing from the local registry (connectors not synced) are
+counted separately, since no local ranking can return them.
+
+Run:
+    python benchmarks/discovery_recall.py record prompts.txt recorded.jsonl [--limit 5]
+    python benchmarks/discovery_recall.py compare recorded.jsonl [--limit 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from typing import Any, Dict, List
+
+from fastn import FastnClient
+
+
+def _tool_key(tool: Dict[str, Any]) -> str:
+    return tool.get("toolId") or tool.get("actionId") or tool.get("name", "")
+
+
+def record(client: FastnClient, prompts_path: str, out_path: str, limit: int) -> None:
+    with open(prompts_path) as f:
+        prompts = [line.strip() for line in f if line.strip()]
+    with open(out_path, "w") as out:
+        for prompt in prompts:
+            tools = client.get_tools_for(prompt, format="raw", limit=limit)
+            out.write(json.dumps({"prompt": prompt, "tools": [_tool_key(t) for t in tools]}) + "\n")
+    print(f"recorded {len(prompts)} prompts to {out_path}")
+
+
+def compare(client: FastnClient, recorded_path: str, limit: int, modes: List[str]) -> None:
+    with open(recorded_path) as f:
+        rows = [json.loads(line) for line in f if line.strip()]
+    known = {
+        _tool_key(info) or name
+        for data in client._registry.get("connectors", {}).values()
+        for name, info in (data.get("tools") or {}).items()
+    }
+    expected = sum(len(row["tools"][:limit]) for row in rows)
+    missing = sum(1 for row in rows for t in row["tools"][:limit] if t not in known)
+    print(f"{len(rows)} prompts, {expected} server tools, {missing} not in the local registry")
+    print(f"{'mode':<12} {'recall@' + str(limit):>10} {'top-1':>7} {'us/query':>9}")
+    for mode in modes:
+        client.get_tools_for("warm up", mode=mode, format="raw")  # build the index
+        found = top1 = 0
+        elapsed = 0.0
+        for row in rows:
+            server = row["tools"][:limit]
+            start = time.perf_counter()
+            local = client.get_tools_for(row["prompt"], mode=mode, format="raw", limit=limit)
+            elapsed += time.perf_counter() - start
+            keys = [_tool_key(t) for t in local]
+            found += len(set(server) & set(keys))
+            top1 += bool(server and keys and server[0] == keys[0])
+        print(
+            f"{mode:<12} {found / max(expected, 1):10.1%} {top1 / max(len(rows), 1):7.1%} "
+            f"{elapsed / max(len(rows), 1) * 1e6:9.1f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    sub = parser.add_subparsers(dest="command", required=True)
+    rec = sub.add_parser("record", help="record live /getTools results")
+    rec.add_argument("prompts")
+    rec.add_argument("out")
+    cmp_ = sub.add_parser("compare", help="compare local rankings with a recording")
+    cmp_.add_argument("recorded")
+    cmp_.add_argument("--modes", default="local,local-tfidf")
+    for p in (rec, cmp_):
+        p.add_argument("--limit", type=int, default=5)
+        p.add_argument("--config", default=None, help="path to .fastn/config.json")
+    args = parser.parse_args()
+
+    client = FastnClient(config_path=args.config)
+    if args.command == "record":
+        record(client, args.prompts, args.out, args.limit)
+    else:
+        compare(client, args.recorded, args.limit, args.modes.split(","))
+
+
+if __name__ == "__main__":
+    main()
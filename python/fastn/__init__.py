@@ -27,6 +27,13 @@ LLM agent integration:
     # Feed tools to your LLM, get back a tool call, then execute:
     result = fastn.execute(tool="send_message", params={"channel": "general", "text": "Hi"})
 
+Batch execution:
+    # Bounded concurrency, results in input order with per-call latency
+    results = fastn.execute_many(
+        [("act_slack_send_message", {"channel": c, "text": "Hi"}) for c in channels],
+        concurrency=8,
+    )
+
 CLI agent mode:
     # AI-powered tool discovery and execution from the command line
     fastn agent "Send hello to #general on Slack"
@@ -55,6 +62,13 @@ Environments (LIVE / STAGING / DEV):
 Configuration priority:
     constructor params > environment variables > .fastn/config.json
 
+Instrumentation:
+    # Hooks run only when a sink is installed — zero overhead otherwise
+    fastn = FastnClient(instrumentation=LoggingInstrumentation())
+
+Retries (429, 502-504, connection errors and timeouts; jittered, budgeted):
+    fastn = FastnClient(retry_policy=RetryPolicy(max_retries=5, max_delay=10))
+
 Environment variables:
     FASTN_API_KEY, FASTN_PROJECT_ID, FASTN_AUTH_TOKEN,
     FASTN_TENANT_ID, FASTN_STAGE
@@ -66,7 +80,13 @@ Exceptions (all inherit from FastnError):
 
 from __future__ import annotations
 
-from fastn.client import AsyncFastnClient, FastnClient
+from fastn.client import (
+    AsyncFastnClient,
+    CacheStats,
+    CompactionStats,
+    ExecuteResult,
+    FastnClient,
+)
 from fastn.exceptions import (
     APIError,
     AuthError,
@@ -80,6 +100,8 @@ from fastn.exceptions import (
     RunNotFoundError,
     ToolNotFoundError,
 )
+from fastn.instrumentation import Instrumentation, LoggingInstrumentation
+from fastn.retry import RetryPolicy
 
 __version__ = "0.3.7"
 
@@ -87,14 +109,20 @@ __all__ = [
     "APIError",
     "AsyncFastnClient",
     "AuthError",
+    "CacheStats",
+    "CompactionStats",
     "ConfigError",
     "ConnectionNotFoundError",
     "ConnectorNotFoundError",
+    "ExecuteResult",
     "FastnClient",
     "FastnError",
     "FlowNotFoundError",
+    "Instrumentation",
+    "LoggingInstrumentation",
     "OAuthError",
     "RegistryError",
+    "RetryPolicy",
     "RunNotFoundError",
     "ToolNotFoundError",
     "__version__",
@@ -0,0 +1,90 @@
+"""Per-token authentication state for the SDK clients.
+
+Everything derived from the access token — decoded JWT claims, the
+workspace and organization IDs, request headers, and when the token needs
+refreshing — is computed once into an immutable :class:`_AuthContext`.
+The client swaps in a new context when the token changes and reads the
+current one on every call, so the request path does no base64/JSON
+decoding or ISO-8601 parsing.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Dict, Mapping
+
+from fastn._constants import TOKEN_REFRESH_WINDOW
+from fastn.auth import build_headers
+from fastn.config import FastnConfig
+
+
+@dataclass(frozen=True)
+class _AuthContext:
+    """Authentication state derived from one access token.
+
+    Attributes:
+        token: The access token (empty for API-key auth).
+        claims: Decoded JWT payload, or ``{}``.
+        workspace_id: Explicit project ID, else the ``PROJECT#<id>`` role.
+        org_id: The ``ORG#<id>#admin`` role's ID, or ``""``.
+        headers: Read-only headers sent with every request.
+        refresh_at: ``time.monotonic()`` value after which a background
+            refresh should start; ``inf`` when the token cannot be refreshed.
+        expires_at: ``time.monotonic()`` value after which the token must
+            not be used (expiry minus the safety buffer).
+    """
+
+    token: str
+    claims: Mapping[str, Any]
+    workspace_id: str
+    org_id: str
+    headers: Mapping[str, str]
+    refresh_at: float
+    expires_at: float
+
+
+def _role_ids(claims: Mapping[str, Any]) -> Dict[str, str]:
+    """Pull the project and admin-org IDs out of ``realm_access.roles``."""
+    ids: Dict[str, str] = {}
+    roles = (claims.get("realm_access") or {}).get("roles") or []
+    for role in roles:
+        parts = str(role).split("#")
+        if parts[0] == "PROJECT" and len(parts) >= 2:
+            ids.setdefault("project", parts[1])
+        elif parts[0] == "ORG" and len(parts) >= 3 and parts[2].lower() == "admin":
+            ids.setdefault("org", parts[1])
+    return ids
+
+
+def _build_auth_context(config: FastnConfig) -> _AuthContext:
+    """Decode *config*'s token once and precompute everything calls need."""
+    from fastn.oauth import TOKEN_EXPIRY_BUFFER, _decode_jwt_payload, seconds_until_expiry
+
+    claims: Dict[str, Any] = {}
+    if config.auth_token:
+        try:
+            claims = _decode_jwt_payload(config.auth_token)
+        except Exception:
+            claims = {}
+    ids = _role_ids(claims)
+
+    refresh_at = expires_at = math.inf
+    if config.refresh_token and config.token_expiry:
+        # Convert the wall-clock expiry to a monotonic deadline once, so
+        # later checks are a float comparison immune to clock changes.
+        deadline = time.monotonic() + seconds_until_expiry(config.token_expiry)
+        refresh_at = deadline - TOKEN_REFRESH_WINDOW
+        expires_at = deadline - TOKEN_EXPIRY_BUFFER
+
+    return _AuthContext(
+        token=config.auth_token,
+        claims=MappingProxyType(claims),
+        workspace_id=config.project_id or ids.get("project", ""),
+        org_id=ids.get("org", ""),
+        headers=MappingProxyType(build_headers(config)),
+        refresh_at=refresh_at,
+        expires_at=expires_at,
+    )
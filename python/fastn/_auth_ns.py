@@ -5,7 +5,8 @@ from __future__ import annotations
 import json
 from typing import Any, Dict, Optional
 
-from fastn._constants import _UPDATE_RESOLVER_STEP_MUTATION, CONNECTIONS_API_URL
+from fastn._constants import CONNECTIONS_API_URL
+from fastn._queries import _UPDATE_RESOLVER_STEP_MUTATION
 from fastn._http import _api_call_sync, _api_call_async, _gql_call_sync, _gql_call_async
 
 
@@ -190,14 +191,14 @@ def _build_custom_auth_step(client_id: str, userinfo_url: str) -> Dict[str, Any]
 
 def _configure_custom_auth_sync(client: Any, userinfo_url: str) -> Dict[str, Any]:
     """Execute the updateResolverStep GraphQL mutation (sync)."""
-    client_id = client._config.resolve_project_id()
+    client_id = client._auth.workspace_id
     variables = _build_custom_auth_step(client_id, userinfo_url)
     return _gql_call_sync(client, _UPDATE_RESOLVER_STEP_MUTATION, variables)
 
 
 async def _configure_custom_auth_async(client: Any, userinfo_url: str) -> Dict[str, Any]:
     """Execute the updateResolverStep GraphQL mutation (async)."""
-    client_id = client._config.resolve_project_id()
+    client_id = client._auth.workspace_id
     variables = _build_custom_auth_step(client_id, userinfo_url)
     return await _gql_call_async(client, _UPDATE_RESOLVER_STEP_MUTATION, variables)
 
@@ -282,7 +283,8 @@ class _AuthSync:
         if tenant_id:
             payload["tenant_id"] = tenant_id
         return _api_call_sync(
-            self._client, "POST", f"{CONNECTIONS_API_URL}/status", payload
+            self._client, "POST", f"{CONNECTIONS_API_URL}/status", payload,
+            idempotent=True,
         )
 
     def configure_custom(self, userinfo_url: str) -> Dict[str, Any]:
@@ -343,7 +345,8 @@ class _AuthAsync:
         if tenant_id:
             payload["tenant_id"] = tenant_id
         return await _api_call_async(
-            self._client, "POST", f"{CONNECTIONS_API_URL}/status", payload
+            self._client, "POST", f"{CONNECTIONS_API_URL}/status", payload,
+            idempotent=True,
         )
 
     async def configure_custom(self, userinfo_url: str) -> Dict[str, Any]:
@@ -0,0 +1,164 @@
+"""Concurrent fan-out of tool executions for ``execute_many``.
+
+Calls are started lazily through a sliding window of at most
+``concurrency`` in-flight executions — worker threads over the client's
+shared connection pool (sync) or tasks on the running loop (async) — so a
+large or generator-backed batch never materializes more than that many
+requests at once. Each call goes through ``client.execute`` and therefore
+the client's retry policy and retry budget.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, Optional, Set, Tuple
+
+DEFAULT_CONCURRENCY = 8
+
+
+@dataclass
+class ExecuteResult:
+    """Outcome of one call in an ``execute_many`` batch.
+
+    Attributes:
+        index: Position of the call in the input.
+        tool: The tool ID that was executed ("" if the call spec was
+            malformed).
+        result: The tool's response, or None if the call failed.
+        error: The exception raised by the call (only with
+            ``return_exceptions=True``), else None.
+        elapsed: Wall-clock seconds for the call, including retries.
+    """
+
+    index: int
+    tool: str
+    result: Any = None
+    error: Optional[BaseException] = None
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """True if the call succeeded."""
+        return self.error is None
+
+
+def _normalize_call(call: Any) -> Tuple[str, Dict[str, Any]]:
+    """Turn a call spec into ``(tool, execute kwargs)``.
+
+    Accepts ``{"tool": ..., "params": ..., "connection_id": ...,
+    "tenant_id": ...}`` or a ``(tool, params)`` pair.
+
+    Raises:
+        ValueError: If *call* is neither.
+    """
+    if isinstance(call, dict):
+        if "tool" not in call:
+            raise ValueError(f"Call spec has no 'tool': {call!r}")
+        kwargs = {k: v for k, v in call.items() if k != "tool"}
+        kwargs.setdefault("params", {})
+        return call["tool"], kwargs
+    try:
+        tool, params = call
+    except (TypeError, ValueError):
+        raise ValueError(
+            f"Call spec must be a dict or a (tool, params) pair, got {call!r}"
+        ) from None
+    return tool, {"params": params}
+
+
+def _check_concurrency(concurrency: int) -> None:
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+
+
+def _execute_one_sync(client: Any, index: int, call: Any) -> ExecuteResult:
+    tool = ""
+    started = time.perf_counter()
+    try:
+        tool, kwargs = _normalize_call(call)
+        result = client.execute(tool, **kwargs)
+    except Exception as e:
+        return ExecuteResult(index, tool, error=e, elapsed=time.perf_counter() - started)
+    return ExecuteResult(index, tool, result, elapsed=time.perf_counter() - started)
+
+
+async def _execute_one_async(client: Any, index: int, call: Any) -> ExecuteResult:
+    tool = ""
+    started = time.perf_counter()
+    try:
+        tool, kwargs = _normalize_call(call)
+        result = await client.execute(tool, **kwargs)
+    except Exception as e:
+        return ExecuteResult(index, tool, error=e, elapsed=time.perf_counter() - started)
+    return ExecuteResult(index, tool, result, elapsed=time.perf_counter() - started)
+
+
+def _iter_execute_sync(
+    client: Any,
+    calls: Iterable[Any],
+    concurrency: int,
+    return_exceptions: bool,
+) -> Iterator[ExecuteResult]:
+    """Yield results in completion order from a bounded thread pool."""
+    _check_concurrency(concurrency)
+    queue = enumerate(calls)
+    pending: Set[Any] = set()
+
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="fastn") as pool:
+
+        def submit_next() -> None:
+            for index, call in queue:
+                pending.add(pool.submit(_execute_one_sync, client, index, call))
+                return
+
+        try:
+            for _ in range(concurrency):
+                submit_next()
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    pending.discard(future)
+                    outcome = future.result()
+                    if outcome.error is not None and not return_exceptions:
+                        raise outcome.error
+                    submit_next()
+                    yield outcome
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+async def _iter_execute_async(
+    client: Any,
+    calls: Iterable[Any],
+    concurrency: int,
+    return_exceptions: bool,
+) -> AsyncIterator[ExecuteResult]:
+    """Yield results in completion order from at most *concurrency* tasks."""
+    _check_concurrency(concurrency)
+    queue = enumerate(calls)
+    pending: Set["asyncio.Future[ExecuteResult]"] = set()
+
+    def submit_next() -> None:
+        for index, call in queue:
+            pending.add(asyncio.ensure_future(_execute_one_async(client, index, call)))
+            return
+
+    try:
+        for _ in range(concurrency):
+            submit_next()
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                pending.discard(task)
+                outcome = task.result()
+                if outcome.error is not None and not return_exceptions:
+                    raise outcome.error
+                submit_next()
+                yield outcome
+    finally:
+        for task in pending:
+            task.cancel()
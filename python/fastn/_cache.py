@@ -0,0 +1,280 @@
+"""Opt-in in-memory caches for control-plane reads and tool discovery.
+
+``_TTLCache`` is a size-bounded LRU map whose entries expire after a
+TTL. An entry may also be kept for a further ``stale_ttl`` seconds, in
+which case lookups still return it but flag it stale so the caller can
+serve it while refreshing it in the background.
+
+Control-plane namespaces call :func:`_cached_sync` / :func:`_cached_async`
+with a namespace, method name and arguments; the key adds the client's
+workspace and tenant so clients switching either never see each other's
+entries. Mutating calls drop their namespace with :func:`_invalidate`.
+Tool discovery (``get_tools_for`` / ``run``) uses a separate cache with a
+stale window: :func:`_revalidating_sync` / :func:`_revalidating_async`
+answer from a stale entry at once and refresh it in the background.
+Cached values are deep-copied on the way in and out, so callers can
+modify what they get back.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Hashable, Optional, Set, Tuple
+
+_logger = logging.getLogger("fastn")
+
+_MISSING = object()
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Counters for a client cache, from ``cache_stats()``.
+
+    Attributes:
+        hits: Lookups answered from the cache (including stale answers).
+        misses: Lookups that had to go to the network.
+        stale_hits: Hits that returned an expired entry while it was
+            refreshed in the background.
+        evictions: Entries dropped to stay within the size bound.
+        size: Entries currently held.
+        saved_seconds: Network time avoided, estimated from how long the
+            cached calls took when they were made.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    stale_hits: int = 0
+    evictions: int = 0
+    size: int = 0
+    saved_seconds: float = 0.0
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class _Entry:
+    __slots__ = ("value", "expires_at", "stale_until", "cost")
+
+    def __init__(self, value: Any, expires_at: float, stale_until: float, cost: float) -> None:
+        self.value = value
+        self.expires_at = expires_at
+        self.stale_until = stale_until
+        self.cost = cost
+
+
+class _TTLCache:
+    """Thread-safe LRU cache with per-entry TTL and an optional stale window."""
+
+    def __init__(self, maxsize: int, ttl: float, stale_ttl: float = 0.0) -> None:
+        if maxsize < 1:
+            raise ValueError(f"cache size must be at least 1, got {maxsize}")
+        if ttl <= 0:
+            raise ValueError(f"cache TTL must be positive, got {ttl}")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._stale_hits = 0
+        self._evictions = 0
+        self._saved = 0.0
+        # Bumped by discard()/clear(), so a fetch that started before an
+        # invalidation doesn't store its now-outdated result.
+        self.generation = 0
+        # Keys being refreshed in the background, and the asyncio tasks
+        # doing it (see _revalidating_sync / _revalidating_async).
+        self._refreshing: Set[Hashable] = set()
+        self.tasks: Set[Any] = set()
+
+    def lookup(self, key: Hashable) -> Tuple[Any, bool]:
+        """Return ``(value, stale)``, or ``(_MISSING, False)`` on a miss."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or now >= entry.stale_until:
+                if entry is not None:
+                    del self._entries[key]
+                self._misses += 1
+                return _MISSING, False
+            self._entries.move_to_end(key)
+            stale = now >= entry.expires_at
+            self._hits += 1
+            self._stale_hits += stale
+            self._saved += entry.cost
+            return entry.value, stale
+
+    def store(
+        self, key: Hashable, value: Any, cost: float = 0.0,
+        generation: Optional[int] = None,
+    ) -> None:
+        """Insert *value*, evicting the least recently used entries if full.
+
+        With *generation*, the value is only stored if nothing was
+        invalidated since that generation was read.
+        """
+        now = time.monotonic()
+        entry = _Entry(value, now + self.ttl, now + self.ttl + self.stale_ttl, cost)
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def claim(self, key: Hashable) -> bool:
+        """Mark *key* as being refreshed; False if a refresh is already running."""
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
+
+    def release(self, key: Hashable) -> None:
+        with self._lock:
+            self._refreshing.discard(key)
+
+    def discard(self, predicate: Callable[[Hashable], bool]) -> None:
+        """Drop every entry whose key matches *predicate*."""
+        with self._lock:
+            self.generation += 1
+            for key in [k for k in self._entries if predicate(k)]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self.generation += 1
+            self._entries.clear()
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                hits=self._hits, misses=self._misses, stale_hits=self._stale_hits,
+                evictions=self._evictions, size=len(self._entries),
+                saved_seconds=self._saved,
+            )
+
+
+def _fill_sync(cache: _TTLCache, key: Hashable, fetch: Callable[[], Any]) -> Any:
+    """Fetch, store and return the value for *key* (a cache miss)."""
+    generation, started = cache.generation, time.monotonic()
+    value = fetch()
+    cache.store(key, copy.deepcopy(value), time.monotonic() - started, generation)
+    return value
+
+
+async def _fill_async(
+    cache: _TTLCache, key: Hashable, fetch: Callable[[], Awaitable[Any]],
+) -> Any:
+    generation, started = cache.generation, time.monotonic()
+    value = await fetch()
+    cache.store(key, copy.deepcopy(value), time.monotonic() - started, generation)
+    return value
+
+
+def _key(client: Any, namespace: str, method: str, args: Tuple[Any, ...]) -> Tuple[Any, ...]:
+    return (namespace, method, client._auth.workspace_id, client._config.tenant_id, args)
+
+
+def _cached_sync(
+    client: Any, namespace: str, method: str, args: Tuple[Any, ...],
+    fetch: Callable[[], Any],
+) -> Any:
+    """Return ``fetch()``, answered from the client's response cache if enabled."""
+    cache: Optional[_TTLCache] = client._response_cache
+    if cache is None:
+        return fetch()
+    key = _key(client, namespace, method, args)
+    value, _ = cache.lookup(key)
+    if value is not _MISSING:
+        return copy.deepcopy(value)
+    return _fill_sync(cache, key, fetch)
+
+
+async def _cached_async(
+    client: Any, namespace: str, method: str, args: Tuple[Any, ...],
+    fetch: Callable[[], Awaitable[Any]],
+) -> Any:
+    """Async version of :func:`_cached_sync`."""
+    cache: Optional[_TTLCache] = client._response_cache
+    if cache is None:
+        return await fetch()
+    key = _key(client, namespace, method, args)
+    value, _ = cache.lookup(key)
+    if value is not _MISSING:
+        return copy.deepcopy(value)
+    return await _fill_async(cache, key, fetch)
+
+
+def _invalidate(client: Any, namespace: str) -> None:
+    """Drop the cached reads of *namespace* after a mutating call."""
+    cache: Optional[_TTLCache] = client._response_cache
+    if cache is not None:
+        cache.discard(lambda key: key[0] == namespace)
+
+
+# ---------------------------------------------------------------------------
+# Tool discovery (get_tools_for / run)
+# ---------------------------------------------------------------------------
+
+def _discovery_key(client: Any, prompt: str, limit: int) -> Tuple[Any, ...]:
+    """Key for a ``/getTools`` lookup: case and whitespace in *prompt* are ignored."""
+    normalized = " ".join(prompt.lower().split())
+    return (normalized, limit, client._auth.workspace_id, client._config.tenant_id)
+
+
+def _revalidating_sync(cache: _TTLCache, key: Hashable, fetch: Callable[[], Any]) -> Any:
+    """Return the cached value for *key*, refreshing a stale one on a thread.
+
+    A miss is fetched inline. At most one refresh per key runs at a time;
+    a failed refresh leaves the stale entry to be served until it expires.
+    """
+    value, stale = cache.lookup(key)
+    if value is _MISSING:
+        return _fill_sync(cache, key, fetch)
+    if stale and cache.claim(key):
+        def refresh() -> None:
+            try:
+                _fill_sync(cache, key, fetch)
+            except Exception:
+                _logger.debug("Background discovery refresh failed", exc_info=True)
+            finally:
+                cache.release(key)
+
+        threading.Thread(target=refresh, name="fastn-discovery", daemon=True).start()
+    return copy.deepcopy(value)
+
+
+async def _revalidating_async(
+    cache: _TTLCache, key: Hashable, fetch: Callable[[], Awaitable[Any]],
+) -> Any:
+    """Async version of :func:`_revalidating_sync`; the refresh is a task."""
+    value, stale = cache.lookup(key)
+    if value is _MISSING:
+        return await _fill_async(cache, key, fetch)
+    if stale and cache.claim(key):
+        async def refresh() -> None:
+            try:
+                await _fill_async(cache, key, fetch)
+            except Exception:
+                _logger.debug("Background discovery refresh failed", exc_info=True)
+            finally:
+                cache.release(key)
+
+        task = asyncio.ensure_future(refresh())
+        # Hold a reference until it finishes; the loop only keeps a weak one.
+        cache.tasks.add(task)
+        task.add_done_callback(cache.tasks.discard)
+    return copy.deepcopy(value)
@@ -2,12 +2,25 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List
+import asyncio
+import time
+from typing import Any, AsyncGenerator, AsyncIterator, Dict, Iterator, List, Optional
 
-from fastn._constants import SEARCH_CONNECTORS_QUERY
+from fastn._constants import CONNECTOR_LIST_STALE_TTL, CONNECTOR_LIST_TTL
 from fastn._http import _gql_call_async
+from fastn._pages import (
+    DEFAULT_PAGE_SIZE,
+    Page,
+    _check_page_size,
+    _iter_pages_async,
+    _next_offset,
+    _search_query,
+)
+from fastn._queries import SEARCH_CONNECTORS_QUERY
 from fastn.exceptions import ConnectorNotFoundError, ToolNotFoundError
 
+_LIST_PAGE_SIZE = 500
+
 
 class _ConnectorCatalog:
     """Control plane: list and inspect available connectors and their tools.
@@ -15,20 +28,39 @@ class _ConnectorCatalog:
     Accessed as ``fastn.connectors.*``.
     """
 
-    def __init__(self, registry: Dict[str, Any]) -> None:
-        self._registry = registry
+    def __init__(self, client: Any) -> None:
+        self._client = client
+
+    @property
+    def _registry(self) -> Dict[str, Any]:
+        # Read through the client so the registry loads lazily and
+        # reload_registry() is picked up.
+        return self._client._registry
 
     def list(self) -> List[Dict[str, Any]]:
         """List all connectors (integrations like Gmail, Slack, Jira) in the registry."""
-        result = []
-        for name, data in self._registry.get("connectors", {}).items():
-            result.append({
+        return list(self.iter())
+
+    def iter(self) -> Iterator[Dict[str, Any]]:
+        """Iterate over the registry's connectors, as returned by :meth:`list`.
+
+        Summaries are produced one at a time; with ``registry.bin`` no
+        connector is decoded.
+        """
+        connectors = self._registry.get("connectors", {})
+        summary = getattr(connectors, "summary", None)
+        for name in connectors:
+            if summary is not None:
+                # registry.bin keeps these in its header — no decoding needed.
+                yield {"name": name, **summary(name)}
+                continue
+            data = connectors[name]
+            yield {
                 "name": name,
                 "display_name": data.get("display_name", name),
                 "category": data.get("category", ""),
                 "tool_count": data.get("tool_count", len(data.get("tools", {}))),
-            })
-        return result
+            }
 
     def get(self, connector_name: str) -> Dict[str, Any]:
         """Get details for a specific connector."""
@@ -99,22 +131,18 @@ class _ConnectorCatalogAsync(_ConnectorCatalog):
     from the GraphQL API instead of the local registry file.
     """
 
-    def __init__(self, client: Any, registry: Dict[str, Any]) -> None:
-        super().__init__(registry)
-        self._client = client
-
-    async def _fetch_scope(
-        self, scope_id: str, is_community: bool = False,
-    ) -> List[Dict[str, Any]]:
-        """Fetch connectors for a single scope (workspace or community)."""
+    async def _fetch_scope_page(
+        self, scope_id: str, is_community: bool, offset: int, page_size: int,
+    ) -> Page:
+        """Fetch one page of connectors for a scope (workspace or community)."""
         variables = {
             "input": {
                 "clientId": scope_id,
-                "first": 500,
+                "first": page_size,
                 "connectorId": scope_id,
-                "query": '{"input":{"limit":500,"offset":0,"sort":"asc","query":"","filter":{}}}',
+                "query": _search_query(page_size, offset, "asc"),
                 "isCommunity": is_community,
-                "offset": 0,
+                "offset": offset,
             }
         }
         data = await _gql_call_async(
@@ -132,9 +160,65 @@ class _ConnectorCatalogAsync(_ConnectorCatalog):
                 "display_name": name,
                 "id": node.get("id", ""),
             })
-        return results
+        next_offset = _next_offset(search_result.get("pageInfo"), offset, len(edges), page_size)
+        return results, next_offset
+
+    def _iter_scope(
+        self, scope_id: str, is_community: bool = False, page_size: int = _LIST_PAGE_SIZE,
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """Page through the connectors of a single scope."""
+        return _iter_pages_async(
+            lambda offset: self._fetch_scope_page(scope_id, is_community, offset, page_size)
+        )
+
+    async def _fetch_scope(
+        self, scope_id: str, is_community: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """Fetch all connectors for a single scope (workspace or community)."""
+        return [c async for c in self._iter_scope(scope_id, is_community)]
+
+    def __init__(self, client: Any) -> None:
+        super().__init__(client)
+        self._listing: Optional[List[Dict[str, Any]]] = None
+        self._listed_at = 0.0
+        self._refresh: Optional[asyncio.Future] = None
+
+    async def _fetch_all(self) -> List[Dict[str, Any]]:
+        """Fetch both scopes concurrently and merge them, workspace first."""
+        await self._client._ensure_fresh_token_async()
+        project_id = self._client._auth.workspace_id
+        workspace, community = await asyncio.gather(
+            self._fetch_scope(project_id),
+            self._fetch_scope("community", is_community=True),
+            return_exceptions=True,
+        )
+        if isinstance(workspace, BaseException):
+            raise workspace
+        if isinstance(community, BaseException):
+            community = []
 
-    async def list(self) -> List[Dict[str, Any]]:
+        seen = {c["name"] for c in workspace}
+        merged = list(workspace)
+        for connector in community:
+            if connector["name"] not in seen:
+                seen.add(connector["name"])
+                merged.append(connector)
+        self._listing = merged
+        self._listed_at = time.monotonic()
+        return merged
+
+    def _refreshing(self) -> asyncio.Future:
+        """The in-flight listing fetch on this loop, starting one if needed."""
+        loop = asyncio.get_running_loop()
+        task = self._refresh
+        if task is None or task.done() or task.get_loop() is not loop:
+            task = self._refresh = loop.create_task(self._fetch_all())
+            # A failed background refresh keeps the stale listing; mark the
+            # exception retrieved so it is not logged.
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        return task
+
+    async def list(self, refresh: bool = False) -> List[Dict[str, Any]]:
         """List all connectors: workspace + community catalog (async).
 
         Fetches from two sources (matching the CLI ``fastn connector sync`` pattern):
@@ -142,25 +226,59 @@ class _ConnectorCatalogAsync(_ConnectorCatalog):
         2. Community — the full 200+ public connector catalog
 
         Workspace connectors take priority over community duplicates.
+
+        Both scopes are fetched concurrently and the merged listing is kept
+        for ``CONNECTOR_LIST_TTL`` seconds. After that the cached listing is
+        still returned immediately while it is refreshed in the background,
+        up to ``CONNECTOR_LIST_STALE_TTL`` seconds old.
+
+        Args:
+            refresh: Ignore the cached listing and fetch it again.
+        """
+        age = time.monotonic() - self._listed_at
+        listing = self._listing
+        if refresh:
+            listing = await self._fetch_all()
+        elif listing is None or age >= CONNECTOR_LIST_STALE_TTL:
+            # Concurrent callers share one fetch; shield it from their
+            # cancellation.
+            listing = await asyncio.shield(self._refreshing())
+        elif age >= CONNECTOR_LIST_TTL:
+            self._refreshing()
+        return [dict(c) for c in listing]
+
+    async def iter(  # type: ignore[override]
+        self, page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over workspace, then community connectors (async).
+
+        Pages through each scope, fetching the next page while the current
+        one is consumed. Only connector names are kept (to skip community
+        duplicates of workspace connectors), not whole pages. Community
+        errors end the iteration quietly, as in :meth:`list`.
         """
-        self._client._ensure_fresh_token()
-        project_id = self._client._config.resolve_project_id()
+        _check_page_size(page_size)
+        await self._client._ensure_fresh_token_async()
+        project_id = self._client._auth.workspace_id
+        seen = set()
 
         # 1. Workspace connectors
-        workspace = await self._fetch_scope(project_id)
+        workspace = self._iter_scope(project_id, page_size=page_size)
+        try:
+            async for connector in workspace:
+                seen.add(connector["name"])
+                yield connector
+        finally:
+            await workspace.aclose()
 
-        # 2. Community connectors
+        # 2. Community connectors — workspace takes priority
+        community = self._iter_scope("community", is_community=True, page_size=page_size)
         try:
-            community = await self._fetch_scope("community", is_community=True)
+            async for connector in community:
+                if connector["name"] not in seen:
+                    seen.add(connector["name"])
+                    yield connector
         except Exception:
-            community = []
-
-        # Merge: workspace takes priority
-        seen = {c["name"] for c in workspace}
-        merged = list(workspace)
-        for c in community:
-            if c["name"] not in seen:
-                merged.append(c)
-                seen.add(c["name"])
-
-        return merged
+            return
+        finally:
+            await community.aclose()
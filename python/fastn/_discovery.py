@@ -0,0 +1,231 @@
+"""Offline tool discovery: rank the synced registry's tools against a prompt.
+
+``get_tools_for(prompt, mode="local")`` answers from an inverted index over
+``registry.json`` instead of the remote ``/getTools`` endpoint. Each tool
+becomes one document made of its name (weighted x3), its connector's name
+and display name (x2), its description and its input parameter names.
+Text is split on case changes and punctuation, lowercased, stripped of
+common stop words and plural ``s``.
+
+Two rankings are available:
+
+    bm25          Okapi BM25 over the posting lists (pure Python; default).
+    tfidf         TF-IDF cosine similarity, vectorized with NumPy
+                  (``pip install 'fastn-ai[search]'``).
+
+The index is built on the first local query after the registry is loaded
+(or reloaded) and reused until the next reload. Results have the same
+shape as ``connectors.get_tools()``.
+"""
+
+from __future__ import annotations
+
+import heapq
+import math
+import re
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+_BM25_K1 = 1.2
+_BM25_B = 0.75
+
+_NAME_WEIGHT = 3
+_CONNECTOR_WEIGHT = 2
+
+_CAMEL = re.compile(r"([a-z0-9])([A-Z])")
+_WORD = re.compile(r"[a-z0-9]+")
+_STOP_WORDS = frozenset({
+    "a", "an", "and", "are", "as", "at", "be", "by", "do", "for", "from",
+    "get", "i", "in", "into", "is", "it", "me", "my", "of", "on", "or",
+    "please", "the", "this", "to", "using", "via", "want", "we", "with", "you",
+    "your",
+})
+
+
+def _tokenize(text: str) -> List[str]:
+    """Split *text* into normalized search terms."""
+    terms = []
+    for word in _WORD.findall(_CAMEL.sub(r"\1 \2", text).lower()):
+        if word in _STOP_WORDS:
+            continue
+        if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+            word = word[:-1]
+        terms.append(word)
+    return terms
+
+
+def _parameter_names(schema: Any, depth: int = 0) -> Iterable[str]:
+    """Property names in an input schema, including nested ``body`` fields."""
+    if not isinstance(schema, dict) or depth > 3:
+        return
+    properties = schema.get("properties")
+    if not isinstance(properties, dict):
+        return
+    for name, prop in properties.items():
+        yield name
+        yield from _parameter_names(prop, depth + 1)
+
+
+def _tool_terms(connector: str, display_name: str, tool: str, info: Dict[str, Any]) -> List[str]:
+    terms = _tokenize(tool) * _NAME_WEIGHT
+    terms += _tokenize(f"{connector} {display_name}") * _CONNECTOR_WEIGHT
+    terms += _tokenize(info.get("description", "") or "")
+    terms += _tokenize(" ".join(_parameter_names(info.get("inputSchema"))))
+    return terms
+
+
+class _LocalIndex:
+    """Inverted index over every tool in a registry."""
+
+    def __init__(self, registry: Dict[str, Any]) -> None:
+        self.tools: List[Tuple[str, str, Dict[str, Any]]] = []
+        self.postings: Dict[str, List[Tuple[int, int]]] = {}
+        lengths: List[int] = []
+        for connector, data in registry.get("connectors", {}).items():
+            display_name = data.get("display_name", "") or ""
+            for tool, info in (data.get("tools") or {}).items():
+                doc = len(self.tools)
+                self.tools.append((connector, tool, info))
+                terms = _tool_terms(connector, display_name, tool, info)
+                lengths.append(len(terms))
+                counts: Dict[str, int] = {}
+                for term in terms:
+                    counts[term] = counts.get(term, 0) + 1
+                for term, tf in counts.items():
+                    self.postings.setdefault(term, []).append((doc, tf))
+        self.lengths = lengths
+        self.avg_length = (sum(lengths) / len(lengths)) if lengths else 0.0
+        self._idf = {
+            term: math.log(1 + (len(lengths) - len(p) + 0.5) / (len(p) + 0.5))
+            for term, p in self.postings.items()
+        }
+        # Each posting's full BM25 contribution depends only on the tool, so
+        # it is computed here once; a query just sums them.
+        avg = self.avg_length or 1.0
+        self._bm25_weights: Dict[str, Tuple[Tuple[int, ...], Tuple[float, ...]]] = {}
+        for term, postings in self.postings.items():
+            idf = self._idf[term]
+            self._bm25_weights[term] = (
+                tuple(doc for doc, _ in postings),
+                tuple(
+                    idf * tf * (_BM25_K1 + 1)
+                    / (tf + _BM25_K1 * (1 - _BM25_B + _BM25_B * lengths[doc] / avg))
+                    for doc, tf in postings
+                ),
+            )
+        self._tfidf: Any = None
+
+    def __len__(self) -> int:
+        return len(self.tools)
+
+    def _bm25(self, terms: Sequence[str]) -> Dict[int, float]:
+        scores: Dict[int, float] = {}
+        for term in terms:
+            weights = self._bm25_weights.get(term)
+            if weights is None:
+                continue
+            if not scores:
+                scores = dict(zip(*weights))
+                continue
+            get = scores.get
+            for doc, weight in zip(*weights):
+                scores[doc] = get(doc, 0.0) + weight
+        return scores
+
+    def search(
+        self,
+        prompt: str,
+        limit: int,
+        connectors: Optional[Sequence[str]] = None,
+        scoring: str = "bm25",
+    ) -> List[Dict[str, Any]]:
+        """The *limit* best-matching tools for *prompt*, best first.
+
+        Tools matching no prompt term are never returned. *connectors*
+        restricts the ranking to those connectors' tools.
+        """
+        if limit < 1:
+            return []
+        terms = _tokenize(prompt)
+        if scoring == "tfidf":
+            if self._tfidf is None:
+                self._tfidf = _TfidfMatrix(self)
+            best = self._tfidf.top(terms, limit, connectors)
+        else:
+            scores = self._bm25(terms)
+            if connectors is not None:
+                allowed = set(connectors)
+                scores = {d: s for d, s in scores.items() if self.tools[d][0] in allowed}
+            best = heapq.nlargest(limit, scores, key=scores.__getitem__)
+        return [self._result(doc) for doc in best]
+
+    def _result(self, doc: int) -> Dict[str, Any]:
+        _, tool, info = self.tools[doc]
+        return {
+            "name": tool,
+            "description": info.get("description", ""),
+            "toolId": info.get("toolId", "") or info.get("actionId", ""),
+            "inputSchema": info.get("inputSchema", {}),
+            "outputSchema": info.get("outputSchema", {}),
+        }
+
+
+class _TfidfMatrix:
+    """Column-wise (per-term) TF-IDF weights, L2-normalized per tool.
+
+    Stored as one NumPy array of tool ids and one of weights per term, so a
+    query adds up a few short vectors instead of looping over postings.
+    """
+
+    def __init__(self, index: _LocalIndex) -> None:
+        try:
+            import numpy as np
+        except ImportError:
+            raise ImportError(
+                "TF-IDF ranking requires NumPy. Install it with: "
+                "pip install 'fastn-ai[search]'"
+            ) from None
+        self._np = np
+        norms = np.zeros(len(index), dtype=np.float64)
+        weights: Dict[str, Tuple[Any, Any]] = {}
+        for term, postings in index.postings.items():
+            docs = np.fromiter((d for d, _ in postings), dtype=np.int64, count=len(postings))
+            tf = np.fromiter((t for _, t in postings), dtype=np.float64, count=len(postings))
+            w = (1 + np.log(tf)) * index._idf[term]
+            np.add.at(norms, docs, w * w)
+            weights[term] = (docs, w)
+        norms = np.sqrt(norms)
+        norms[norms == 0] = 1.0
+        self._weights = {t: (d, w / norms[d]) for t, (d, w) in weights.items()}
+        self._idf = index._idf
+        self._size = len(index)
+        names = [connector for connector, _, _ in index.tools]
+        self._connector_ids = {name: i for i, name in enumerate(dict.fromkeys(names))}
+        self._connector_of = np.array(
+            [self._connector_ids[name] for name in names], dtype=np.int64,
+        )
+
+    def top(
+        self, terms: Sequence[str], limit: int, connectors: Optional[Sequence[str]] = None,
+    ) -> List[int]:
+        """Tool ids of the *limit* highest cosine scores, best first."""
+        np = self._np
+        counts: Dict[str, int] = {}
+        for term in terms:
+            if term in self._weights:
+                counts[term] = counts.get(term, 0) + 1
+        if not counts:
+            return []
+        query = {t: (1 + math.log(c)) * self._idf[t] for t, c in counts.items()}
+        scale = math.sqrt(sum(w * w for w in query.values()))
+        total = np.zeros(self._size, dtype=np.float64)
+        for term, qw in query.items():
+            docs, w = self._weights[term]
+            total[docs] += w * (qw / scale)
+        if connectors is not None:
+            ids = [self._connector_ids[c] for c in connectors if c in self._connector_ids]
+            total[~np.isin(self._connector_of, ids)] = 0.0
+        hits = np.flatnonzero(total)
+        if len(hits) > limit:
+            hits = hits[np.argpartition(-total[hits], limit - 1)[:limit]]
+        # Best score first; ties go to the tool that comes first in the registry.
+        return hits[np.lexsort((hits, -total[hits]))].tolist()
@@ -5,18 +5,39 @@ from __future__ import annotations
 import json as _json
 import re
 import uuid as _uuid
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import (
+    Any,
+    AsyncGenerator,
+    AsyncIterator,
+    Dict,
+    Generator,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+)
 
 from fastn._constants import (
-    DEPLOY_FLOW_MUTATION,
     FLOW_BUILDER_SPACE_ID,
     FLOW_BUILDER_URL,
     FLOWS_API_URL,
     FLOW_RUN_API_URL,
-    GET_FLOW_QUERY,
-    LIST_FLOWS_QUERY,
 )
+from fastn._queries import DEPLOY_FLOW_MUTATION, GET_FLOW_QUERY, LIST_FLOWS_QUERY
 from fastn._http import _api_call_sync, _api_call_async, _gql_call_sync, _gql_call_async
+from fastn._cache import _cached_async, _cached_sync, _invalidate
+from fastn._graphql import _project
+from fastn._pages import (
+    DEFAULT_PAGE_SIZE,
+    Page,
+    _check_page_size,
+    _iter_pages_async,
+    _iter_pages_sync,
+    _next_offset,
+    _search_query,
+)
 from fastn.exceptions import FlowNotFoundError
 
 
@@ -418,19 +439,78 @@ def _extract_output_fields(flow_data: Dict[str, Any]) -> Dict[str, Any]:
 # Flow listing helpers
 # ---------------------------------------------------------------------------
 
-def _build_flows_query_variables(client: Any) -> Dict[str, Any]:
-    """Build the GraphQL variables for the ``apis`` query."""
-    workspace_id = client._config.resolve_project_id()
+_LIST_PAGE_SIZE = 500
+
+# Flow summary key -> the ``apis`` node field it is read from.
+_FLOW_FIELDS = {
+    "flow_id": "id",
+    "name": "name",
+    "description": "description",
+    "status": "status",
+    "version": "version",
+    "updatedAt": "updatedAt",
+    "deployedAt": "deployedAt",
+    "flowType": "metaData",
+    "architecture": "metaData",
+    "isAsync": "metaData",
+}
+
+
+def _build_flows_query_variables(
+    client: Any,
+    limit: int = _LIST_PAGE_SIZE,
+    offset: int = 0,
+    status: Optional[str] = None,
+    name: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Build the GraphQL variables for one page of the ``apis`` query.
+
+    *status* and *name* are passed to the server's search (``filter`` and
+    ``query``) so it can drop non-matching flows before sending them.
+    """
+    workspace_id = client._auth.workspace_id
+    filters = {"status": status} if status else None
     return {
         "input": {
             "clientId": workspace_id,
-            "first": 500,
+            "first": limit,
             "after": None,
-            "query": '{"input":{"limit":500,"offset":0,"sort":"desc","query":"","filter":{}}}',
+            "query": _search_query(limit, offset, "desc", name or "", filters),
         }
     }
 
 
+def _flows_document(
+    status: Optional[str], name: Optional[str], fields: Optional[Sequence[str]],
+) -> str:
+    """The ``apis`` query, trimmed to the node fields *fields* needs.
+
+    Fields the client-side filters read (``status``, ``name``) are always
+    selected when those filters are set.
+    """
+    if fields is None:
+        return LIST_FLOWS_QUERY
+    unknown = [f for f in fields if f not in _FLOW_FIELDS]
+    if unknown:
+        raise ValueError(
+            f"Unknown flow fields: {', '.join(unknown)}. "
+            f"Choose from: {', '.join(_FLOW_FIELDS)}"
+        )
+    selected = {_FLOW_FIELDS[f] for f in fields}
+    if status:
+        selected.add("status")
+    if name:
+        selected.add("name")
+    return _project(LIST_FLOWS_QUERY, ("apis", "edges", "node"), sorted(selected))
+
+
+def _list_key(
+    status: Optional[str], name: Optional[str], fields: Optional[Sequence[str]],
+) -> Tuple[Any, ...]:
+    """Response-cache arguments for a ``flows.list`` call."""
+    return (status, name, tuple(fields) if fields is not None else None)
+
+
 def _parse_flows_response(data: Dict[str, Any]) -> List[Dict[str, Any]]:
     """Parse the ``apis`` GraphQL response into a list of flow dicts."""
     result = data.get("apis") or {}
@@ -465,18 +545,69 @@ def _parse_flows_response(data: Dict[str, Any]) -> List[Dict[str, Any]]:
     return flows
 
 
-def _fetch_flows_sync(client: Any) -> List[Dict[str, Any]]:
-    """Fetch all flows from the workspace using the ``apis`` GraphQL query (sync)."""
-    variables = _build_flows_query_variables(client)
-    data = _gql_call_sync(client, LIST_FLOWS_QUERY, variables)
-    return _parse_flows_response(data)
-
+def _flows_page(
+    data: Dict[str, Any],
+    offset: int,
+    page_size: int,
+    status: Optional[str],
+    name: Optional[str],
+    fields: Optional[Sequence[str]],
+) -> Page:
+    """Parse one ``apis`` page into ``(flows, next_offset)``.
 
-async def _fetch_flows_async(client: Any) -> List[Dict[str, Any]]:
-    """Fetch all flows from the workspace using the ``apis`` GraphQL query (async)."""
-    variables = _build_flows_query_variables(client)
-    data = await _gql_call_async(client, LIST_FLOWS_QUERY, variables)
-    return _parse_flows_response(data)
+    The server-side filters are re-applied here (exact *status*,
+    case-insensitive substring of *name*), so results are the same
+    whether or not the server honoured them.
+    """
+    result = data.get("apis") or {}
+    count = len(result.get("edges") or [])
+    flows = _parse_flows_response(data)
+    if status:
+        flows = [f for f in flows if f.get("status") == status]
+    if name:
+        needle = name.lower()
+        flows = [f for f in flows if needle in f.get("name", "").lower()]
+    if fields is not None:
+        flows = [{k: f[k] for k in fields if k in f} for f in flows]
+    return flows, _next_offset(result.get("pageInfo"), offset, count, page_size)
+
+
+def _iter_flows_sync(
+    client: Any,
+    page_size: int = _LIST_PAGE_SIZE,
+    status: Optional[str] = None,
+    name: Optional[str] = None,
+    fields: Optional[Sequence[str]] = None,
+) -> Generator[Dict[str, Any], None, None]:
+    """Page through the flows in the workspace, prefetching the next page (sync)."""
+    _check_page_size(page_size)
+    query = _flows_document(status, name, fields)
+
+    def fetch(offset: int) -> Page:
+        variables = _build_flows_query_variables(client, page_size, offset, status, name)
+        data = _gql_call_sync(client, query, variables)
+        return _flows_page(data, offset, page_size, status, name, fields)
+
+    return _iter_pages_sync(fetch)
+
+
+def _iter_flows_async(
+    client: Any,
+    page_size: int = _LIST_PAGE_SIZE,
+    status: Optional[str] = None,
+    name: Optional[str] = None,
+    fields: Optional[Sequence[str]] = None,
+) -> AsyncGenerator[Dict[str, Any], None]:
+    """Page through the flows in the workspace, prefetching the next page (async)."""
+    _check_page_size(page_size)
+    query = _flows_document(status, name, fields)
+
+    async def fetch(offset: int) -> Page:
+        variables = _build_flows_query_variables(client, page_size, offset, status, name)
+        data = await _gql_call_async(client, query, variables)
+        return _flows_page(data, offset, page_size, status, name, fields)
+
+    return _iter_pages_async(fetch)
 
 
 # ---------------------------------------------------------------------------
@@ -485,7 +616,7 @@ async def _fetch_flows_async(client: Any) -> List[Dict[str, Any]]:
 
 def _build_get_flow_variables(client: Any, flow_name: str) -> Dict[str, Any]:
     """Build the GraphQL variables for the ``api`` (single flow) query."""
-    workspace_id = client._config.resolve_project_id()
+    workspace_id = client._auth.workspace_id
     return {
         "input": {
             "clientId": workspace_id,
@@ -513,24 +644,33 @@ def _build_flow_run_headers(
 def _resolve_flow_id_sync(client: Any, name_or_id: str) -> str:
     """Resolve a flow name to its base flow_id by listing flows.
 
+    Tries the server-side name search first, then a full scan: the search
+    is undocumented and may not match exact names.
+
     Raises FlowNotFoundError if no match is found.
     """
-    flows = _fetch_flows_sync(client)
-    for flow in flows:
-        if flow.get("name") == name_or_id:
-            return flow["flow_id"]
+    for name in (name_or_id, None):
+        for flow in _iter_flows_sync(client, name=name, fields=("flow_id", "name")):
+            if flow.get("name") == name_or_id:
+                return flow["flow_id"]
     raise FlowNotFoundError(name_or_id)
 
 
 async def _resolve_flow_id_async(client: Any, name_or_id: str) -> str:
     """Resolve a flow name to its base flow_id by listing flows (async).
 
+    Tries the server-side name search first, then a full scan.
+
     Raises FlowNotFoundError if no match is found.
     """
-    flows = await _fetch_flows_async(client)
-    for flow in flows:
-        if flow.get("name") == name_or_id:
-            return flow["flow_id"]
+    for name in (name_or_id, None):
+        flows = _iter_flows_async(client, name=name, fields=("flow_id", "name"))
+        try:
+            async for flow in flows:
+                if flow.get("name") == name_or_id:
+                    return flow["flow_id"]
+        finally:
+            await flows.aclose()
     raise FlowNotFoundError(name_or_id)
 
 
@@ -581,7 +721,7 @@ class _FlowsSync:
             The agent response dict.
         """
         sid = session_id or str(_uuid.uuid4())
-        project_id = self._client._config.resolve_project_id()
+        project_id = self._client._auth.workspace_id
         payload: Dict[str, Any] = {
             "input": {
                 "chatInput": prompt,
@@ -595,7 +735,9 @@ class _FlowsSync:
             "x-fastn-space-tenantid": project_id,
             "stage": "DRAFT",
         }
-        return _api_call_sync(self._client, "POST", FLOW_BUILDER_URL, payload, extra_headers=extra)
+        result = _api_call_sync(self._client, "POST", FLOW_BUILDER_URL, payload, extra_headers=extra)
+        _invalidate(self._client, "flows")
+        return result
 
     # Backward-compatible alias
     create = generate
@@ -618,15 +760,17 @@ class _FlowsSync:
             FlowNotFoundError: If the flow cannot be found by ID or name.
         """
         try:
-            return _api_call_sync(
+            result = _api_call_sync(
                 self._client, "POST", f"{FLOWS_API_URL}/delete", {"flow_id": flow_id}
             )
         except FlowNotFoundError:
             # The given string may be a versioned name -- resolve to base ID.
             resolved_id = _resolve_flow_id_sync(self._client, flow_id)
-            return _api_call_sync(
+            result = _api_call_sync(
                 self._client, "POST", f"{FLOWS_API_URL}/delete", {"flow_id": resolved_id}
             )
+        _invalidate(self._client, "flows")
+        return result
 
     def run(
         self,
@@ -667,7 +811,7 @@ class _FlowsSync:
         Returns:
             The mutation response with ``id`` and ``__typename``.
         """
-        workspace_id = self._client._config.resolve_project_id()
+        workspace_id = self._client._auth.workspace_id
         variables = {
             "input": {
                 "clientId": workspace_id,
@@ -677,6 +821,7 @@ class _FlowsSync:
             }
         }
         data = _gql_call_sync(self._client, DEPLOY_FLOW_MUTATION, variables)
+        _invalidate(self._client, "flows")
         return data.get("deployApiToStage", data)
 
     def get(self, flow_name: str) -> Dict[str, Any]:
@@ -691,12 +836,15 @@ class _FlowsSync:
         Returns:
             The full flow definition dict.
         """
-        variables = _build_get_flow_variables(self._client, flow_name)
-        data = _gql_call_sync(self._client, GET_FLOW_QUERY, variables)
-        flow = data.get("api")
-        if not flow:
-            raise FlowNotFoundError(flow_name)
-        return flow
+        def fetch() -> Dict[str, Any]:
+            variables = _build_get_flow_variables(self._client, flow_name)
+            data = _gql_call_sync(self._client, GET_FLOW_QUERY, variables)
+            flow = data.get("api")
+            if not flow:
+                raise FlowNotFoundError(flow_name)
+            return flow
+
+        return _cached_sync(self._client, "flows", "get", (flow_name,), fetch)
 
     def schema(self, flow_name: str) -> Dict[str, Any]:
         """Discover the input schema of a flow by parsing its steps.
@@ -728,29 +876,66 @@ class _FlowsSync:
             RunNotFoundError: If the run_id does not exist.
         """
         return _api_call_sync(
-            self._client, "POST", f"{FLOWS_API_URL}/get_run", {"run_id": run_id}
+            self._client, "POST", f"{FLOWS_API_URL}/get_run", {"run_id": run_id},
+            idempotent=True,
         )
 
-    def list(self, status: Optional[str] = None) -> List[Dict[str, Any]]:
+    def list(
+        self,
+        status: Optional[str] = None,
+        name: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> List[Dict[str, Any]]:
         """List flows in the project.
 
         Fetches flows from the workspace via the ``apis`` GraphQL query.
+        Filters are sent to the server with the query, and *fields* trims
+        the query's selection set, so only what is asked for is
+        transferred and parsed.
 
         Args:
             status: Optional filter -- ``"DEPLOYED"``, ``"DRAFT"``, etc.
-                or ``None`` for all.  Case-insensitive.
+                or ``None`` for all.
+            name: Optional filter -- flows whose name contains this text
+                (case-insensitive).
+            fields: Optional projection -- the flow keys to return, e.g.
+                ``["flow_id", "name"]``. Defaults to all of them.
 
         Returns:
             A list of flow summary dicts with ``flow_id``, ``name``,
             ``description``, ``status``, ``version``, ``updatedAt``,
-            and ``deployedAt``.
+            and ``deployedAt`` (or just *fields*).
+
+        Raises:
+            ValueError: If *fields* names an unknown key.
         """
-        flows = _fetch_flows_sync(self._client)
+        return _cached_sync(
+            self._client, "flows", "list", _list_key(status, name, fields),
+            lambda: list(_iter_flows_sync(self._client, _LIST_PAGE_SIZE, status, name, fields)),
+        )
+
+    def iter(
+        self,
+        status: Optional[str] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        name: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over flows page by page instead of loading them all.
+
+        The next page is fetched in the background while the current one
+        is consumed, so at most two pages are in memory.
 
-        if status:
-            flows = [f for f in flows if f.get("status") == status]
+        Args:
+            status: Optional filter, as for :meth:`list`.
+            page_size: Flows per request.
+            name: Optional name filter, as for :meth:`list`.
+            fields: Optional projection, as for :meth:`list`.
 
-        return flows
+        Yields:
+            Flow summary dicts, as returned by :meth:`list`.
+        """
+        return _iter_flows_sync(self._client, page_size, status, name, fields)
 
     def update(
         self,
@@ -784,9 +969,11 @@ class _FlowsSync:
             payload["enabled"] = enabled
         if answers is not None:
             payload["answers"] = answers
-        return _api_call_sync(
+        result = _api_call_sync(
             self._client, "POST", f"{FLOWS_API_URL}/update", payload
         )
+        _invalidate(self._client, "flows")
+        return result
 
 
 class _FlowsAsync:
@@ -806,7 +993,7 @@ class _FlowsAsync:
     ) -> Dict[str, Any]:
         """Generate an integration flow via the flow builder agent (async)."""
         sid = session_id or str(_uuid.uuid4())
-        project_id = self._client._config.resolve_project_id()
+        project_id = self._client._auth.workspace_id
         payload: Dict[str, Any] = {
             "input": {
                 "chatInput": prompt,
@@ -820,9 +1007,11 @@ class _FlowsAsync:
             "x-fastn-space-tenantid": project_id,
             "stage": "DRAFT",
         }
-        return await _api_call_async(
+        result = await _api_call_async(
             self._client, "POST", FLOW_BUILDER_URL, payload, extra_headers=extra
         )
+        _invalidate(self._client, "flows")
+        return result
 
     # Backward-compatible alias
     create = generate
@@ -834,14 +1023,16 @@ class _FlowsAsync:
         automatically if the initial ID is not found.
         """
         try:
-            return await _api_call_async(
+            result = await _api_call_async(
                 self._client, "POST", f"{FLOWS_API_URL}/delete", {"flow_id": flow_id}
             )
         except FlowNotFoundError:
             resolved_id = await _resolve_flow_id_async(self._client, flow_id)
-            return await _api_call_async(
+            result = await _api_call_async(
                 self._client, "POST", f"{FLOWS_API_URL}/delete", {"flow_id": resolved_id}
             )
+        _invalidate(self._client, "flows")
+        return result
 
     async def run(
         self,
@@ -864,7 +1055,7 @@ class _FlowsAsync:
         comment: str = "",
     ) -> Dict[str, Any]:
         """Deploy a flow to a stage (async)."""
-        workspace_id = self._client._config.resolve_project_id()
+        workspace_id = self._client._auth.workspace_id
         variables = {
             "input": {
                 "clientId": workspace_id,
@@ -874,16 +1065,20 @@ class _FlowsAsync:
             }
         }
         data = await _gql_call_async(self._client, DEPLOY_FLOW_MUTATION, variables)
+        _invalidate(self._client, "flows")
         return data.get("deployApiToStage", data)
 
     async def get(self, flow_name: str) -> Dict[str, Any]:
         """Fetch the full definition of a flow (async)."""
-        variables = _build_get_flow_variables(self._client, flow_name)
-        data = await _gql_call_async(self._client, GET_FLOW_QUERY, variables)
-        flow = data.get("api")
-        if not flow:
-            raise FlowNotFoundError(flow_name)
-        return flow
+        async def fetch() -> Dict[str, Any]:
+            variables = _build_get_flow_variables(self._client, flow_name)
+            data = await _gql_call_async(self._client, GET_FLOW_QUERY, variables)
+            flow = data.get("api")
+            if not flow:
+                raise FlowNotFoundError(flow_name)
+            return flow
+
+        return await _cached_async(self._client, "flows", "get", (flow_name,), fetch)
 
     async def schema(self, flow_name: str) -> Dict[str, Any]:
         """Discover the input schema of a flow (async)."""
@@ -893,20 +1088,37 @@ class _FlowsAsync:
     async def get_run(self, run_id: str) -> Dict[str, Any]:
         """Get the status of a flow run (async)."""
         return await _api_call_async(
-            self._client, "POST", f"{FLOWS_API_URL}/get_run", {"run_id": run_id}
+            self._client, "POST", f"{FLOWS_API_URL}/get_run", {"run_id": run_id},
+            idempotent=True,
         )
 
-    async def list(self, status: Optional[str] = None) -> List[Dict[str, Any]]:
+    async def list(
+        self,
+        status: Optional[str] = None,
+        name: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> List[Dict[str, Any]]:
         """List flows in the project (async).
 
         Fetches flows from the workspace via the ``apis`` GraphQL query.
         """
-        flows = await _fetch_flows_async(self._client)
+        async def fetch() -> List[Dict[str, Any]]:
+            flows = _iter_flows_async(self._client, _LIST_PAGE_SIZE, status, name, fields)
+            return [flow async for flow in flows]
 
-        if status:
-            flows = [f for f in flows if f.get("status") == status]
+        return await _cached_async(
+            self._client, "flows", "list", _list_key(status, name, fields), fetch,
+        )
 
-        return flows
+    def iter(
+        self,
+        status: Optional[str] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        name: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over flows page by page (async). Use with ``async for``."""
+        return _iter_flows_async(self._client, page_size, status, name, fields)
 
     async def update(
         self,
@@ -926,6 +1138,8 @@ class _FlowsAsync:
             payload["enabled"] = enabled
         if answers is not None:
             payload["answers"] = answers
-        return await _api_call_async(
+        result = await _api_call_async(
             self._client, "POST", f"{FLOWS_API_URL}/update", payload
         )
+        _invalidate(self._client, "flows")
+        return result
@@ -1,8 +1,46 @@
-"""LLM tool format converters for OpenAI, Anthropic, Gemini, and Bedrock."""
+"""LLM tool format converters for OpenAI, Anthropic, Gemini, and Bedrock.
+
+Converting a tool is a few dict allocations, cheaper than any cache
+lookup, so :data:`_FORMAT_CONVERTERS` always builds fresh definitions.
+Encoding them is what costs: agents send mostly the same tools before
+every LLM turn, so :func:`_tools_json` memoizes each definition's compact
+JSON encoding per (format, tool id, name, description) in a process-wide
+LRU, and splices a tools array together from the cached bytes. Each entry
+keeps a private copy of the input schema it was encoded from and is only
+reused while the tool's schema still equals it, so a schema edited in
+place is re-encoded; the comparison costs a small fraction of encoding.
+
+:func:`_compact_tools` shrinks definitions before they reach the LLM, at
+one of :data:`~fastn._constants._COMPACTION_LEVELS`, each including the
+previous one:
+
+    light        drop annotation keywords (``title``, ``default``,
+                 ``examples``, ...) and cut descriptions to their first
+                 sentence, capped in length
+    standard     also move sub-schemas that repeat within a tool into
+                 ``$defs`` (not for Gemini, which has no ``$ref``)
+    aggressive   also drop optional properties where an object lists
+                 required ones, and all property descriptions
+
+With a ``max_tokens`` budget, tools are taken best first; one that does
+not fit is compacted further, and skipped if it still does not fit.
+Token counts are estimates at four bytes of compact JSON per token.
+"""
 
 from __future__ import annotations
 
-from typing import Any, Dict, List
+import copy
+import json
+import logging
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from fastn._constants import _COMPACTION_LEVELS, FORMAT_CACHE_SIZE
+
+_logger = logging.getLogger("fastn")
 
 
 def _unwrap_input_schema(schema: Dict[str, Any]) -> Dict[str, Any]:
@@ -53,9 +91,266 @@ def _wrap_bedrock(name: str, desc: str, params: dict) -> dict:
     return {"toolSpec": {"name": name, "description": desc, "inputSchema": {"json": params}}}
 
 
+_WRAPPERS = {
+    "openai": _wrap_openai,
+    "anthropic": _wrap_anthropic,
+    "gemini": _wrap_gemini,
+    "bedrock": _wrap_bedrock,
+}
+
 _FORMAT_CONVERTERS = {
     "openai": lambda actions: _format_actions(actions, _wrap_openai),
     "anthropic": lambda actions: _format_actions(actions, _wrap_anthropic),
     "gemini": lambda actions: _format_actions(actions, _wrap_gemini),
     "bedrock": lambda actions: _format_actions(actions, _wrap_bedrock),
 }
+
+
+def _encode(value: Any) -> bytes:
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+class _FormatCache:
+    """Thread-safe LRU of encoded tool definitions."""
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Tuple[Any, ...], Tuple[Any, bytes]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def encoded(self, action: Dict[str, Any], format: str) -> bytes:
+        """*action* converted to *format* and JSON-encoded."""
+        name = action["name"]
+        description = action.get("description", "")
+        schema = action.get("inputSchema", {})
+        key = (format, action.get("toolId") or action.get("actionId", ""), name, description)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == schema:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+        snapshot = copy.deepcopy(schema)
+        encoded = _encode(_WRAPPERS[format](name, description, _unwrap_input_schema(snapshot)))
+        with self._lock:
+            self._entries[key] = (snapshot, encoded)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return encoded
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+
+_format_cache = _FormatCache(FORMAT_CACHE_SIZE)
+
+
+def _tools_json(actions: List[Dict[str, Any]], format: str) -> bytes:
+    """*actions* converted to *format* as a compact UTF-8 JSON array."""
+    if format == "raw":
+        return _encode(actions)
+    return b"[" + b",".join(_format_cache.encoded(action, format) for action in actions) + b"]"
+
+
+# ---------------------------------------------------------------------------
+# Schema compaction (get_tools_for(compact=..., max_tokens=...))
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class CompactionStats:
+    """Estimated prompt tokens of tool definitions, from ``compaction_stats()``.
+
+    Attributes:
+        calls: ``get_tools_for`` / ``get_tools_json`` calls that compacted.
+        tokens_before: Estimated tokens of the uncompacted definitions.
+        tokens_after: Estimated tokens of the definitions returned.
+        tools_dropped: Tools left out to stay within ``max_tokens``.
+    """
+
+    calls: int = 0
+    tokens_before: int = 0
+    tokens_after: int = 0
+    tools_dropped: int = 0
+
+    @property
+    def tokens_saved(self) -> int:
+        """Estimated tokens kept out of LLM prompts."""
+        return self.tokens_before - self.tokens_after
+
+    def __add__(self, other: "CompactionStats") -> "CompactionStats":
+        return CompactionStats(
+            self.calls + other.calls,
+            self.tokens_before + other.tokens_before,
+            self.tokens_after + other.tokens_after,
+            self.tools_dropped + other.tools_dropped,
+        )
+
+
+# Per level: tool description cap, property description cap (0 drops
+# them), dedupe sub-schemas, drop optional properties.
+_LEVEL_SETTINGS = {
+    "light": (240, 120, False, False),
+    "standard": (160, 80, True, False),
+    "aggressive": (100, 0, True, True),
+}
+
+_ANNOTATIONS = frozenset({
+    "title", "default", "examples", "example", "$comment", "$schema",
+    "readOnly", "writeOnly", "deprecated",
+})
+# Keywords whose value is a schema, a list of schemas, or a map of them.
+_SCHEMA_KEYS = ("items", "additionalProperties", "not", "contains")
+_SCHEMA_LIST_KEYS = ("anyOf", "oneOf", "allOf", "prefixItems")
+_SCHEMA_MAP_KEYS = ("properties", "patternProperties", "$defs", "definitions")
+
+# A sentence ends at ". " before a capital, after a word (so "e.g. Slack"
+# does not end one).
+_SENTENCE_END = re.compile(r"(?<=[\w)]{2}[.!?])\s+(?=[A-Z])")
+_DEF_NAME = re.compile(r"[^A-Za-z0-9_]+")
+# A $ref costs ~30 bytes; smaller repeats are cheaper left inline.
+_MIN_DEDUPE_BYTES = 80
+
+
+def _estimate_tokens(value: Any) -> int:
+    return (len(_encode(value)) + 3) // 4
+
+
+def _shorten(text: str, limit: int) -> str:
+    """First sentence of *text*, cut at a word boundary to *limit* chars."""
+    text = _SENTENCE_END.split(text.strip(), 1)[0]
+    if len(text) <= limit:
+        return text
+    cut = text[:limit - 3].rsplit(" ", 1)[0]
+    return cut.rstrip(",;:") + "..."
+
+
+def _strip_schema(schema: Any, prop_limit: int, drop_optional: bool) -> Any:
+    """Copy of *schema* without annotations and with shortened descriptions."""
+    if not isinstance(schema, dict):
+        return schema
+    out: Dict[str, Any] = {}
+    for key, value in schema.items():
+        if key in _ANNOTATIONS or key.startswith("x-"):
+            continue
+        if key == "description":
+            if prop_limit and isinstance(value, str):
+                out[key] = _shorten(value, prop_limit)
+        elif key in _SCHEMA_MAP_KEYS and isinstance(value, dict):
+            out[key] = {k: _strip_schema(v, prop_limit, drop_optional) for k, v in value.items()}
+        elif key in _SCHEMA_LIST_KEYS and isinstance(value, list):
+            out[key] = [_strip_schema(v, prop_limit, drop_optional) for v in value]
+        elif key in _SCHEMA_KEYS:
+            out[key] = _strip_schema(value, prop_limit, drop_optional)
+        else:
+            out[key] = value
+    required = out.get("required")
+    if drop_optional and required and isinstance(out.get("properties"), dict):
+        out["properties"] = {k: v for k, v in out["properties"].items() if k in required}
+    return out
+
+
+def _sub_schemas(schema: Any, name: str) -> Any:
+    """Yield ``(holder, key, sub_schema, name)`` for nested object schemas."""
+    if not isinstance(schema, dict):
+        return
+    for key in ("properties", "$defs"):
+        children = schema.get(key)
+        if isinstance(children, dict):
+            for child_name, child in children.items():
+                if isinstance(child, dict) and "properties" in child:
+                    yield children, child_name, child, child_name
+                yield from _sub_schemas(child, child_name)
+    items = schema.get("items")
+    if isinstance(items, dict):
+        if "properties" in items:
+            yield schema, "items", items, f"{name}_item"
+        yield from _sub_schemas(items, f"{name}_item")
+
+
+def _dedupe(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Move object sub-schemas that occur more than once into ``$defs``.
+
+    Mutates the (already copied) schema tree under *params*.
+    """
+    existing = params.get("$defs")
+    defs: Dict[str, Any] = dict(existing) if isinstance(existing, dict) else {}
+    root = {"properties": params.get("properties", {}), "$defs": defs}
+    while True:
+        seen: Dict[bytes, List[Tuple[Dict[str, Any], str, str]]] = {}
+        for holder, key, sub, name in _sub_schemas(root, ""):
+            seen.setdefault(_encode(sub), []).append((holder, key, name))
+        repeated = [
+            (encoded, sites) for encoded, sites in seen.items()
+            if len(sites) > 1 and len(encoded) >= _MIN_DEDUPE_BYTES
+        ]
+        if not repeated:
+            break
+        # The largest saving first; its copies may contain smaller repeats.
+        encoded, sites = max(repeated, key=lambda r: len(r[0]) * (len(r[1]) - 1))
+        def_name = next((key for holder, key, _ in sites if holder is defs), None)
+        if def_name is None:
+            base = _DEF_NAME.sub("_", sites[0][2]) or "schema"
+            def_name, n = base, 2
+            while def_name in defs:
+                def_name, n = f"{base}_{n}", n + 1
+            defs[def_name] = json.loads(encoded)
+        # Every other copy, including duplicate definitions, becomes a
+        # reference; existing "#/$defs/<dup>" references still resolve.
+        for holder, key, _ in sites:
+            if holder is not defs or key != def_name:
+                holder[key] = {"$ref": f"#/$defs/{def_name}"}
+    if defs:
+        params = dict(params, **{"$defs": defs})
+    return params
+
+
+def _compact_action(action: Dict[str, Any], format: str, level: Optional[str]) -> Dict[str, Any]:
+    """*action* converted to *format*, compacted at *level* (None: as is)."""
+    params = _unwrap_input_schema(action.get("inputSchema", {}))
+    description = action.get("description", "")
+    if level is not None:
+        tool_limit, prop_limit, dedupe, drop_optional = _LEVEL_SETTINGS[level]
+        description = _shorten(description, tool_limit) if description else description
+        params = _strip_schema(params, prop_limit, drop_optional)
+        if dedupe and format != "gemini":
+            params = _dedupe(params)
+    return _WRAPPERS[format](action["name"], description, params)
+
+
+def _compact_tools(
+    actions: List[Dict[str, Any]],
+    format: str,
+    level: Optional[str] = None,
+    max_tokens: Optional[int] = None,
+) -> Tuple[List[Dict[str, Any]], CompactionStats]:
+    """Convert *actions* (best first) to *format*, compacted to fit *max_tokens*."""
+    levels: List[Optional[str]] = [None, *_COMPACTION_LEVELS]
+    levels = levels[levels.index(level):]
+    tools: List[Dict[str, Any]] = []
+    before = after = 0
+    dropped: List[str] = []
+    for action in actions:
+        uncompacted = _compact_action(action, format, None)
+        full = _estimate_tokens(uncompacted)
+        before += full
+        for candidate_level in levels:
+            if candidate_level is None:
+                tool, tokens = uncompacted, full
+            else:
+                tool = _compact_action(action, format, candidate_level)
+                tokens = _estimate_tokens(tool)
+            if max_tokens is None or after + tokens <= max_tokens:
+                tools.append(tool)
+                after += tokens
+                break
+        else:
+            dropped.append(action["name"])
+    if dropped:
+        _logger.debug("Dropped %d tools to fit max_tokens=%s: %s", len(dropped), max_tokens, ", ".join(dropped))
+    return tools, CompactionStats(1, before, after, len(dropped))
@@ -0,0 +1,561 @@
+"""GraphQL request batching for the ``_gql_call_*`` helpers.
+
+While batching is on — inside ``with client.batch():`` or on a client
+built with ``graphql_batch_window=`` — queries issued close together are
+merged into one aliased document and sent as a single POST::
+
+    query($b0_input:GetEntityInput!$b1_input:ListUCLAgentsInput!){
+      b0_widgetMetadata:widgetMetadata(input:$b0_input){...}
+      b1_listUCLAgents:listUCLAgents(input:$b1_input){...}}
+
+Each operation's variables and top-level fields get a ``b<i>_`` prefix;
+the response is split back per caller and the prefixes dropped. Errors
+are attributed through their ``path``; an operation whose slice is
+missing (a non-null failure elsewhere nulled ``data``), or a response
+with errors that cannot be attributed (document validation), is re-sent
+on its own so every caller sees exactly what an unbatched call would.
+
+Only single-operation ``query`` documents without fragments are merged.
+Mutations and anything else go out unbatched, as do merged documents'
+persisted-query hashes (merged text varies with the batch).
+
+Sync: the first caller to queue a query waits up to the window for
+others (threads sharing the client) and then sends for all of them.
+``batch.submit()`` runs calls on worker threads and sends as soon as
+every worker is waiting, without sitting out the window.
+
+Async: callers queue and await a future; the batch is sent on the next
+event-loop iteration (or after the window), so queries started together
+with ``asyncio.gather`` share one request.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import re
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+from fastn._constants import GRAPHQL_BATCH_MAX_SIZE, GRAPHQL_URL
+from fastn._graphql import (
+    _close,
+    _document,
+    _evict_oldest,
+    _minify,
+    _selections,
+    _tokens,
+)
+from fastn._http import (
+    _check_gql_response,
+    _gql_error,
+    _gql_send_async,
+    _gql_send_sync,
+    _merge_headers,
+    _request_async,
+    _request_sync,
+)
+
+# Marks an operation that has to be re-sent on its own.
+_RESEND = object()
+
+# Parsed and merged documents are cached per query text / batch shape.
+_OPERATION_CACHE_SIZE = 256
+_MERGED_CACHE_SIZE = 64
+
+
+class _Operation(NamedTuple):
+    """A single-query document split into mergeable parts."""
+
+    variables: Tuple[str, ...]
+    fields: Tuple[Tuple[str, Tuple[str, ...]], ...]
+
+
+_operations: Dict[str, Optional[_Operation]] = {}
+_merged: Dict[Tuple[str, ...], str] = {}
+
+
+def _parse(query: str) -> Optional[_Operation]:
+    """Split *query* into variable definitions and top-level fields.
+
+    Returns None if the document cannot be merged: not a query, more
+    than one definition (fragments), operation directives, or fragment
+    spreads in the top-level selection set.
+    """
+    tokens = _tokens(_document(query).text)
+    i = 0
+    if tokens and tokens[0] == "query":
+        i = 1
+        if tokens[i] not in ("(", "{"):
+            i += 1
+    variables: Tuple[str, ...] = ()
+    if i < len(tokens) and tokens[i] == "(":
+        end = _close(tokens, i)
+        variables = tuple(tokens[i + 1:end])
+        i = end + 1
+    if i >= len(tokens) or tokens[i] != "{" or _close(tokens, i) != len(tokens) - 1:
+        return None
+
+    fields = []
+    for key, _, name, end in _selections(tokens, i):
+        if key == "...":
+            return None
+        fields.append((key, tuple(tokens[name:end])))
+    return _Operation(variables, tuple(fields))
+
+
+def _operation(query: str) -> Optional[_Operation]:
+    """Return the parsed form of *query* (None if unmergeable), parsing once."""
+    try:
+        return _operations[query]
+    except KeyError:
+        try:
+            op = _parse(query)
+        except (ValueError, IndexError):
+            op = None
+        if len(_operations) >= _OPERATION_CACHE_SIZE:
+            _evict_oldest(_operations)
+        _operations[query] = op
+        return op
+
+
+def _prefixed(tokens: Sequence[str], prefix: str) -> List[str]:
+    """Copy *tokens* with every ``$variable`` renamed to ``$<prefix>variable``."""
+    out = []
+    previous = ""
+    for token in tokens:
+        out.append(prefix + token if previous == "$" else token)
+        previous = token
+    return out
+
+
+def _merge(queries: Tuple[str, ...]) -> str:
+    """Merge single-query documents into one aliased, minified document."""
+    text = _merged.get(queries)
+    if text is None:
+        definitions: List[str] = []
+        selections: List[str] = []
+        for i, query in enumerate(queries):
+            prefix = f"b{i}_"
+            op = _operation(query)
+            definitions += _prefixed(op.variables, prefix)
+            for key, tokens in op.fields:
+                selections += [prefix + key, ":"]
+                selections += _prefixed(tokens, prefix)
+        head = f"query({' '.join(definitions)})" if definitions else "query"
+        text = _minify(f"{head}{{{' '.join(selections)}}}")
+        if len(_merged) >= _MERGED_CACHE_SIZE:
+            _evict_oldest(_merged)
+        _merged[queries] = text
+    return text
+
+
+class _Pending:
+    """One queued query and the future its caller waits on."""
+
+    __slots__ = ("query", "variables", "extra_headers", "future")
+
+    def __init__(
+        self,
+        query: str,
+        variables: Dict[str, Any],
+        extra_headers: Optional[Dict[str, str]],
+        future: Any,
+    ) -> None:
+        self.query = query
+        self.variables = variables
+        self.extra_headers = extra_headers
+        self.future = future
+
+    def resolve(self, result: Any) -> None:
+        if not self.future.done():
+            self.future.set_result(result)
+
+    def fail(self, exc: BaseException) -> None:
+        if not self.future.done():
+            self.future.set_exception(exc)
+
+
+def _groups(ops: List[_Pending]) -> List[List[_Pending]]:
+    """Split *ops* into mergeable groups (same headers, at most the max size)."""
+    by_headers: Dict[Any, List[_Pending]] = {}
+    for op in ops:
+        key = tuple(sorted(op.extra_headers.items())) if op.extra_headers else ()
+        by_headers.setdefault(key, []).append(op)
+    return [
+        group[i:i + GRAPHQL_BATCH_MAX_SIZE]
+        for group in by_headers.values()
+        for i in range(0, len(group), GRAPHQL_BATCH_MAX_SIZE)
+    ]
+
+
+def _batch_request(group: List[_Pending]) -> Dict[str, Any]:
+    variables: Dict[str, Any] = {}
+    for i, op in enumerate(group):
+        for name, value in (op.variables or {}).items():
+            variables[f"b{i}_{name}"] = value
+    return {
+        "query": _merge(tuple(op.query for op in group)),
+        "variables": variables,
+    }
+
+
+def _split(response: Any, group: List[_Pending]) -> List[Any]:
+    """Turn a merged response into one outcome per operation.
+
+    Each outcome is that operation's data slice, an exception, or
+    ``_RESEND``.
+    """
+    if response.status_code == 400:
+        # The merged document failed validation; find out which part did.
+        return [_RESEND] * len(group)
+    if response.status_code >= 400:
+        try:
+            _check_gql_response(response)
+        except Exception as e:
+            return [e] * len(group)
+
+    body = response.json() or {}
+    data = body.get("data") or {}
+    by_op: Dict[int, List[Dict[str, Any]]] = {}
+    for error in body.get("errors") or []:
+        path = error.get("path") or [""]
+        match = re.match(r"b(\d+)_", str(path[0]))
+        if match is None or int(match.group(1)) >= len(group):
+            return [_RESEND] * len(group)
+        by_op.setdefault(int(match.group(1)), []).append(error)
+
+    outcomes: List[Any] = []
+    for i, op in enumerate(group):
+        if i in by_op:
+            outcomes.append(_gql_error(by_op[i]))
+            continue
+        prefix = f"b{i}_"
+        keys = [key for key, _ in _operation(op.query).fields]
+        if all(prefix + key in data for key in keys):
+            outcomes.append({key: data[prefix + key] for key in keys})
+        else:
+            outcomes.append(_RESEND)
+    return outcomes
+
+
+# ---------------------------------------------------------------------------
+# Sync
+# ---------------------------------------------------------------------------
+
+def _send_one_sync(client: Any, op: _Pending) -> None:
+    try:
+        op.resolve(_gql_send_sync(client, op.query, op.variables, op.extra_headers))
+    except Exception as e:
+        op.fail(e)
+
+
+def _flush_sync(client: Any, ops: List[_Pending]) -> None:
+    """Send queued operations and settle every caller's future."""
+    try:
+        for group in _groups(ops):
+            if len(group) == 1:
+                _send_one_sync(client, group[0])
+                continue
+            try:
+                headers = _merge_headers(client, group[0].extra_headers)
+                response = _request_sync(
+                    client, "POST", GRAPHQL_URL, _batch_request(group), headers,
+                )
+                outcomes = _split(response, group)
+            except Exception as e:
+                outcomes = [e] * len(group)
+            for op, outcome in zip(group, outcomes):
+                if outcome is _RESEND:
+                    _send_one_sync(client, op)
+                elif isinstance(outcome, BaseException):
+                    op.fail(outcome)
+                else:
+                    op.resolve(outcome)
+    except BaseException as e:
+        for op in ops:
+            op.fail(e)
+        raise
+
+
+class _SyncBatcher:
+    """Queue of sync callers; the first one in sends for everybody."""
+
+    def __init__(self, client: Any) -> None:
+        self._client = client
+        self._cond = threading.Condition()
+        self._queue: List[_Pending] = []
+        # Workers a ``batch.submit()`` run has started and not finished.
+        self._expected = 0
+
+    def expect(self, n: int) -> None:
+        with self._cond:
+            self._expected += n
+            self._cond.notify_all()
+
+    def done(self) -> None:
+        with self._cond:
+            self._expected -= 1
+            self._cond.notify_all()
+
+    def _full(self) -> bool:
+        queued = len(self._queue)
+        return queued >= GRAPHQL_BATCH_MAX_SIZE or 0 < self._expected <= queued
+
+    def call(
+        self,
+        query: str,
+        variables: Dict[str, Any],
+        extra_headers: Optional[Dict[str, str]],
+        window: float,
+    ) -> Any:
+        op = _Pending(query, variables, extra_headers, Future())
+        with self._cond:
+            self._queue.append(op)
+            leader = len(self._queue) == 1
+            self._cond.notify_all()
+            if leader:
+                deadline = time.monotonic() + window
+                while not self._full():
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                ops, self._queue = self._queue, []
+        if leader:
+            _flush_sync(self._client, ops)
+        return op.future.result()
+
+
+class _BatchFuture(Future):
+    """Future for ``batch.submit()``; waiting on it starts the batch."""
+
+    def __init__(self, batch: "_GraphQLBatch") -> None:
+        super().__init__()
+        self._batch = batch
+
+    def result(self, timeout: Optional[float] = None) -> Any:
+        self._batch.run()
+        return super().result(timeout)
+
+    def exception(self, timeout: Optional[float] = None) -> Optional[BaseException]:
+        self._batch.run()
+        return super().exception(timeout)
+
+
+class _GraphQLBatch:
+    """``with client.batch() as batch:`` on :class:`~fastn.FastnClient`."""
+
+    def __init__(self, client: Any, window: float) -> None:
+        self._client = client
+        self._window = window
+        self._calls: List[Tuple[_BatchFuture, Callable[..., Any], tuple, dict]] = []
+
+    def __enter__(self) -> "_GraphQLBatch":
+        self._client._batch_scopes.append(self._window)
+        return self
+
+    def __exit__(self, exc_type: Any, *args: Any) -> None:
+        try:
+            if exc_type is None:
+                self.run()
+            else:
+                for future, _, _, _ in self._calls:
+                    future.cancel()
+        finally:
+            self._client._batch_scopes.remove(self._window)
+
+    def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> "Future[Any]":
+        """Schedule ``fn(*args, **kwargs)`` to run with the rest of the batch.
+
+        Submitted calls start together when the block exits (or when a
+        returned future is waited on), each on its own thread, and their
+        queries go out in one request once all of them are waiting.
+        """
+        future = _BatchFuture(self)
+        self._calls.append((future, fn, args, kwargs))
+        return future
+
+    def run(self) -> None:
+        """Start every submitted call and wait for all of them."""
+        calls, self._calls = self._calls, []
+        if not calls:
+            return
+        batcher = _batcher(self._client, _SyncBatcher)
+        batcher.expect(len(calls))
+        threads = [
+            threading.Thread(target=self._call, args=(batcher,) + call, daemon=True)
+            for call in calls
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    @staticmethod
+    def _call(
+        batcher: _SyncBatcher,
+        future: Future,
+        fn: Callable[..., Any],
+        args: tuple,
+        kwargs: dict,
+    ) -> None:
+        try:
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(fn(*args, **kwargs))
+                except BaseException as e:
+                    future.set_exception(e)
+        finally:
+            batcher.done()
+
+
+# ---------------------------------------------------------------------------
+# Async
+# ---------------------------------------------------------------------------
+
+async def _send_one_async(client: Any, op: _Pending) -> None:
+    try:
+        op.resolve(await _gql_send_async(client, op.query, op.variables, op.extra_headers))
+    except Exception as e:
+        op.fail(e)
+
+
+async def _flush_group_async(client: Any, group: List[_Pending]) -> None:
+    if len(group) == 1:
+        await _send_one_async(client, group[0])
+        return
+    try:
+        headers = _merge_headers(client, group[0].extra_headers)
+        response = await _request_async(
+            client, "POST", GRAPHQL_URL, _batch_request(group), headers,
+        )
+        outcomes = _split(response, group)
+    except Exception as e:
+        outcomes = [e] * len(group)
+    resend = []
+    for op, outcome in zip(group, outcomes):
+        if outcome is _RESEND:
+            resend.append(_send_one_async(client, op))
+        elif isinstance(outcome, BaseException):
+            op.fail(outcome)
+        else:
+            op.resolve(outcome)
+    await asyncio.gather(*resend)
+
+
+async def _flush_async(client: Any, ops: List[_Pending]) -> None:
+    """Send queued operations and settle every caller's future."""
+    try:
+        await asyncio.gather(*(_flush_group_async(client, g) for g in _groups(ops)))
+    except BaseException as e:
+        for op in ops:
+            op.fail(e)
+        raise
+
+
+class _AsyncBatcher:
+    """Queue of async callers, sent on the next loop iteration or window."""
+
+    def __init__(self, client: Any) -> None:
+        self._client = client
+        self._queue: List[_Pending] = []
+        self._timer: Optional[asyncio.Handle] = None
+        self._tasks: "Set[asyncio.Future[None]]" = set()
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        ops, self._queue = self._queue, []
+        if ops:
+            task = asyncio.ensure_future(_flush_async(self._client, ops))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def call(
+        self,
+        query: str,
+        variables: Dict[str, Any],
+        extra_headers: Optional[Dict[str, str]],
+        window: float,
+    ) -> Any:
+        loop = asyncio.get_running_loop()
+        op = _Pending(query, variables, extra_headers, loop.create_future())
+        self._queue.append(op)
+        if len(self._queue) >= GRAPHQL_BATCH_MAX_SIZE:
+            self._flush()
+        elif len(self._queue) == 1:
+            if window > 0:
+                self._timer = loop.call_later(window, self._flush)
+            else:
+                self._timer = loop.call_soon(self._flush)
+        return await op.future
+
+
+class _AsyncGraphQLBatch:
+    """``with client.batch():`` on :class:`~fastn.AsyncFastnClient`.
+
+    Also usable as ``async with``. Queries awaited inside the block —
+    typically through ``asyncio.gather`` — are merged.
+    """
+
+    def __init__(self, client: Any, window: float) -> None:
+        self._client = client
+        self._window = window
+
+    def __enter__(self) -> "_AsyncGraphQLBatch":
+        self._client._batch_scopes.append(self._window)
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self._client._batch_scopes.remove(self._window)
+
+    async def __aenter__(self) -> "_AsyncGraphQLBatch":
+        return self.__enter__()
+
+    async def __aexit__(self, *args: Any) -> None:
+        self.__exit__(*args)
+
+
+# ---------------------------------------------------------------------------
+# Entry points for fastn._http
+# ---------------------------------------------------------------------------
+
+_batcher_lock = threading.Lock()
+
+
+def _batcher(client: Any, cls: type) -> Any:
+    """Return the client's batcher, creating it on first use."""
+    batcher = client._gql_batcher
+    if batcher is None:
+        with _batcher_lock:
+            batcher = client._gql_batcher
+            if batcher is None:
+                batcher = client._gql_batcher = cls(client)
+    return batcher
+
+
+def _batched_call_sync(
+    client: Any,
+    query: str,
+    variables: Dict[str, Any],
+    extra_headers: Optional[Dict[str, str]],
+    window: float,
+) -> Any:
+    if _operation(query) is None:
+        return _gql_send_sync(client, query, variables, extra_headers)
+    return _batcher(client, _SyncBatcher).call(query, variables, extra_headers, window)
+
+
+async def _batched_call_async(
+    client: Any,
+    query: str,
+    variables: Dict[str, Any],
+    extra_headers: Optional[Dict[str, str]],
+    window: float,
+) -> Any:
+    if _operation(query) is None:
+        return await _gql_send_async(client, query, variables, extra_headers)
+    return await _batcher(client, _AsyncBatcher).call(query, variables, extra_headers, window)
@@ -0,0 +1,285 @@
+"""GraphQL request documents: minification and persisted queries.
+
+Query documents are minified once, on first use, and cached with their
+sha256. ``_gql_call_*`` then sends the minified text instead of the
+indented source (``GET_FLOW_QUERY`` shrinks by about half).
+
+With ``persisted_queries=True`` on the client, requests follow the
+automatic persisted query (APQ) protocol:
+
+1. Send only ``extensions.persistedQuery.sha256Hash`` and the variables.
+2. If the server replies ``PersistedQueryNotFound``, resend with the full
+   (minified) text plus the hash, so the server stores it and later calls
+   need only the hash.
+3. If it replies ``PersistedQueryNotSupported``, stop sending hashes on
+   that client and send full text from then on.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import re
+from typing import Any, Dict, FrozenSet, List, NamedTuple, Sequence, Tuple
+
+_IGNORED = " \t\r\n,\ufeff"
+
+_NOT_FOUND = "not_found"
+_NOT_SUPPORTED = "not_supported"
+
+
+class _Document(NamedTuple):
+    """A minified GraphQL document and its APQ hash."""
+
+    text: str
+    sha256: str
+
+
+# Fixed documents, projections and merged batch documents all pass through
+# _document(); batches can produce any number of distinct texts, so the
+# cache is bounded (oldest entry dropped first).
+_DOCUMENT_CACHE_SIZE = 512
+_documents: Dict[str, _Document] = {}
+
+# Lexer for minified documents: strings, "...", numbers, names, punctuators.
+_TOKEN = re.compile(
+    r'"""(?:\\"""|[^"]|"(?!""))*"""|"(?:\\.|[^"\\])*"|\.\.\.|-?[0-9][\w.+-]*|\w+|\S'
+)
+
+_PROJECTION_CACHE_SIZE = 256
+_projections: Dict[Tuple[str, Tuple[str, ...], FrozenSet[str]], str] = {}
+
+
+def _evict_oldest(cache: Dict[Any, Any]) -> None:
+    """Drop *cache*'s oldest entry; tolerates concurrent inserts and evictions."""
+    with contextlib.suppress(StopIteration, RuntimeError):
+        cache.pop(next(iter(cache)), None)
+
+
+def _is_word(c: str) -> bool:
+    return c.isalnum() or c == "_"
+
+
+def _string_end(query: str, i: int) -> int:
+    """Index just past the string literal starting at *i*."""
+    if query.startswith('"""', i):
+        j = i + 3
+        while True:
+            k = query.index('"""', j)
+            if query[k - 1] != "\\":
+                return k + 3
+            j = k + 3
+    j = i + 1
+    while query[j] != '"':
+        j += 2 if query[j] == "\\" else 1
+    return j + 1
+
+
+def _minify(query: str) -> str:
+    """Drop comments and insignificant whitespace/commas from a document.
+
+    A single space is kept only where two tokens would otherwise merge
+    (name/number next to name/number, or a number before ``...``).
+    """
+    out: List[str] = []
+    prev_word = prev_number = False
+    gap = False
+    i, n = 0, len(query)
+    while i < n:
+        c = query[i]
+        if c in _IGNORED:
+            gap = True
+            i += 1
+        elif c == "#":
+            end = query.find("\n", i)
+            i = n if end < 0 else end
+            gap = True
+        elif c == '"':
+            end = _string_end(query, i)
+            out.append(query[i:end])
+            prev_word = prev_number = gap = False
+            i = end
+        elif _is_word(c):
+            j = i + 1
+            while j < n and _is_word(query[j]):
+                j += 1
+            if gap and prev_word:
+                out.append(" ")
+            out.append(query[i:j])
+            prev_word, prev_number, gap = True, c.isdigit(), False
+            i = j
+        else:
+            if gap and prev_number and c == ".":
+                out.append(" ")
+            out.append(c)
+            prev_word = prev_number = gap = False
+            i += 1
+    return "".join(out)
+
+
+def _document(query: str) -> _Document:
+    """Return the minified, hashed form of *query*, computing it once."""
+    doc = _documents.get(query)
+    if doc is None:
+        text = _minify(query)
+        doc = _Document(text, hashlib.sha256(text.encode("utf-8")).hexdigest())
+        if len(_documents) >= _DOCUMENT_CACHE_SIZE:
+            _evict_oldest(_documents)
+        _documents[query] = doc
+    return doc
+
+
+def _is_mutation(query: str) -> bool:
+    """Whether *query* is a mutation (and so must not be blindly re-sent)."""
+    return _document(query).text.startswith("mutation")
+
+
+def _tokens(text: str) -> List[str]:
+    """Split a minified document into tokens."""
+    return _TOKEN.findall(text)
+
+
+def _close(tokens: Sequence[str], i: int) -> int:
+    """Index of the bracket closing the one at *i*."""
+    opening = tokens[i]
+    closing = {"(": ")", "{": "}", "[": "]"}[opening]
+    depth = 0
+    for j in range(i, len(tokens)):
+        if tokens[j] == opening:
+            depth += 1
+        elif tokens[j] == closing:
+            depth -= 1
+            if depth == 0:
+                return j
+    raise ValueError("unbalanced GraphQL document")
+
+
+def _skip_arguments_and_directives(tokens: Sequence[str], k: int, end: int) -> int:
+    if k < end and tokens[k] == "(":
+        k = _close(tokens, k) + 1
+    while k < end and tokens[k] == "@":
+        k += 2
+        if k < end and tokens[k] == "(":
+            k = _close(tokens, k) + 1
+    return k
+
+
+def _selections(tokens: Sequence[str], i: int) -> List[Tuple[str, int, int, int]]:
+    """Split the selection set opening at ``tokens[i]`` into spans.
+
+    Returns ``(key, start, name, end)`` per selection: *key* is the
+    response key (alias or field name; ``"..."`` for fragments),
+    ``tokens[start:end]`` the whole selection and ``tokens[name:end]``
+    the selection without its alias.
+    """
+    end = _close(tokens, i)
+    spans = []
+    k = i + 1
+    while k < end:
+        start = name = k
+        if tokens[k] == "...":
+            key = "..."
+            k += 1
+            if tokens[k] == "on":
+                k += 2
+            elif tokens[k] not in ("{", "@"):
+                k += 1
+        else:
+            key = tokens[k]
+            if tokens[k + 1] == ":":
+                name = k + 2
+            k = name + 1
+        k = _skip_arguments_and_directives(tokens, k, end)
+        if k < end and tokens[k] == "{":
+            k = _close(tokens, k) + 1
+        spans.append((key, start, name, k))
+    return spans
+
+
+def _selection_set(tokens: Sequence[str], k: int) -> int:
+    """Index of the first ``{`` at or after *k*, skipping argument lists."""
+    while tokens[k] != "{":
+        k = _close(tokens, k) + 1 if tokens[k] == "(" else k + 1
+    return k
+
+
+def _project(query: str, path: Sequence[str], keep: Sequence[str]) -> str:
+    """Return *query* with the selection set at *path* cut down to *keep*.
+
+    *path* names the fields leading from the operation's root selection
+    to the one to trim (e.g. ``("apis", "edges", "node")``); the kept
+    selections retain their arguments and sub-selections. Results are
+    cached, so the minified, projected text is built once per shape.
+
+    Raises:
+        ValueError: If *keep* is empty or names a field the selection
+            set does not have.
+    """
+    cache_key = (query, tuple(path), frozenset(keep))
+    text = _projections.get(cache_key)
+    if text is not None:
+        return text
+    if not keep:
+        raise ValueError("fields must name at least one field")
+    tokens = _tokens(_document(query).text)
+    i = _selection_set(tokens, 0)
+    for field in path:
+        spans = {key: (start, end) for key, start, _, end in _selections(tokens, i)}
+        if field not in spans:
+            raise ValueError(f"No '{field}' selection in the document")
+        i = _selection_set(tokens, spans[field][0])
+    spans_at = _selections(tokens, i)
+    unknown = set(keep) - {key for key, _, _, _ in spans_at}
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+    kept = [t for key, start, _, end in spans_at if key in keep for t in tokens[start:end]]
+    text = _minify(" ".join(tokens[:i + 1] + kept + tokens[_close(tokens, i):]))
+    if len(_projections) >= _PROJECTION_CACHE_SIZE:
+        _evict_oldest(_projections)
+    _projections[cache_key] = text
+    return text
+
+
+def _gql_payload(
+    client: Any, query: str, variables: Dict[str, Any], full: bool = False,
+) -> Dict[str, Any]:
+    """Build a GraphQL POST body — hash only, unless *full* or APQ is off."""
+    doc = _document(query)
+    if not client._persisted_queries:
+        return {"query": doc.text, "variables": variables}
+    extensions = {"persistedQuery": {"version": 1, "sha256Hash": doc.sha256}}
+    if full:
+        return {"query": doc.text, "variables": variables, "extensions": extensions}
+    return {"variables": variables, "extensions": extensions}
+
+
+def _apq_error(response: Any) -> str:
+    """Return the APQ error code in *response*, or ``""``.
+
+    The raw body is scanned before anything is parsed, so ordinary
+    responses are not decoded twice.
+    """
+    content = response.content
+    if b"PersistedQueryNot" not in content:
+        return ""
+    try:
+        errors = response.json().get("errors") or []
+    except (ValueError, AttributeError):
+        return ""
+    for error in errors:
+        for code in (error.get("message"), (error.get("extensions") or {}).get("code")):
+            if code in ("PersistedQueryNotFound", "PERSISTED_QUERY_NOT_FOUND"):
+                return _NOT_FOUND
+            if code in ("PersistedQueryNotSupported", "PERSISTED_QUERY_NOT_SUPPORTED"):
+                return _NOT_SUPPORTED
+    return ""
+
+
+def _persisted_query_missed(client: Any, response: Any) -> bool:
+    """True if a hash-only request must be resent with the full text."""
+    if response.status_code not in (200, 400):
+        return False
+    error = _apq_error(response)
+    if error == _NOT_SUPPORTED:
+        client._persisted_queries = False
+    return bool(error)
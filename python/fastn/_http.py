@@ -2,14 +2,105 @@
 
 from __future__ import annotations
 
-import json
+import asyncio
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Dict, FrozenSet, List, Mapping, Optional
 
 import httpx
 
-from fastn._constants import BACKOFF_FACTOR, GRAPHQL_URL
-from fastn.exceptions import APIError, AuthError, FlowNotFoundError, RunNotFoundError
+from fastn._constants import GRAPHQL_URL
+from fastn._graphql import _gql_payload, _is_mutation, _persisted_query_missed
+from fastn.exceptions import (
+    APIError,
+    AuthError,
+    ConfigError,
+    FlowNotFoundError,
+    RunNotFoundError,
+)
+from fastn.retry import (
+    RETRYABLE_EXCEPTIONS,
+    UNPROCESSED_STATUS_CODES,
+    UNSENT_EXCEPTIONS,
+)
+
+
+# ---------------------------------------------------------------------------
+# Connection pool configuration
+# ---------------------------------------------------------------------------
+
+def _http_client_options(
+    timeout: float,
+    connect_timeout: Optional[float] = None,
+    read_timeout: Optional[float] = None,
+    write_timeout: Optional[float] = None,
+    pool_timeout: Optional[float] = None,
+    max_connections: Optional[int] = None,
+    max_keepalive_connections: Optional[int] = None,
+    keepalive_expiry: Optional[float] = None,
+    http2: bool = False,
+    transport: Any = None,
+) -> Dict[str, Any]:
+    """Build keyword arguments for ``httpx.Client`` / ``httpx.AsyncClient``.
+
+    Each split timeout falls back to *timeout*. Pool limits left as None
+    keep the httpx defaults. When *transport* is given the pool lives in
+    the transport, so pool and HTTP/2 options must be set there instead.
+
+    Raises:
+        ConfigError: If pool options are combined with *transport*, or
+            HTTP/2 is requested without the ``h2`` package installed.
+    """
+    options: Dict[str, Any] = {
+        "timeout": httpx.Timeout(
+            timeout,
+            connect=timeout if connect_timeout is None else connect_timeout,
+            read=timeout if read_timeout is None else read_timeout,
+            write=timeout if write_timeout is None else write_timeout,
+            pool=timeout if pool_timeout is None else pool_timeout,
+        ),
+    }
+    pool_options = {
+        "max_connections": max_connections,
+        "max_keepalive_connections": max_keepalive_connections,
+        "keepalive_expiry": keepalive_expiry,
+    }
+    pool_set = [k for k, v in pool_options.items() if v is not None]
+
+    if transport is not None:
+        if pool_set or http2:
+            raise ConfigError(
+                f"Cannot combine transport= with {', '.join(pool_set or ['http2'])}. "
+                f"Configure limits and HTTP/2 on the transport itself."
+            )
+        options["transport"] = transport
+        return options
+
+    if pool_set:
+        default_limits = httpx.Limits()
+        options["limits"] = httpx.Limits(
+            max_connections=(
+                max_connections if max_connections is not None
+                else default_limits.max_connections
+            ),
+            max_keepalive_connections=(
+                max_keepalive_connections if max_keepalive_connections is not None
+                else default_limits.max_keepalive_connections
+            ),
+            keepalive_expiry=(
+                keepalive_expiry if keepalive_expiry is not None
+                else default_limits.keepalive_expiry
+            ),
+        )
+    if http2:
+        try:
+            import h2  # noqa: F401
+        except ImportError:
+            raise ConfigError(
+                "HTTP/2 requires the 'h2' package. "
+                "Install it with: pip install 'fastn-ai[http2]'"
+            ) from None
+        options["http2"] = True
+    return options
 
 
 # ---------------------------------------------------------------------------
@@ -72,12 +163,17 @@ def _check_gql_response(response: Any) -> Dict[str, Any]:
 
     data = response.json() or {}
     if data.get("errors"):
-        msg = data["errors"][0].get("message", "Unknown GraphQL error")
-        raise APIError(f"GraphQL error: {msg}")
+        raise _gql_error(data["errors"])
 
     return data.get("data", {})
 
 
+def _gql_error(errors: List[Dict[str, Any]]) -> APIError:
+    """Build the APIError raised for a GraphQL ``errors`` list."""
+    msg = errors[0].get("message", "Unknown GraphQL error")
+    return APIError(f"GraphQL error: {msg}")
+
+
 def _redact_headers(headers: Dict[str, str]) -> Dict[str, str]:
     """Redact sensitive header values for logging."""
     redacted = {}
@@ -89,11 +185,187 @@ def _redact_headers(headers: Dict[str, str]) -> Dict[str, str]:
     return redacted
 
 
-def _log_request(client: Any, method: str, url: str, payload: Any = None) -> None:
-    """Log an outgoing HTTP request (verbose mode)."""
-    client._log(f"{method} {url}")
-    client._log(f"Headers: {json.dumps(_redact_headers(dict(client._headers)), indent=2)}")
-    client._log(f"Payload: {json.dumps(payload or {}, indent=2, default=str)}")
+def _merge_headers(
+    client: Any, extra_headers: Optional[Dict[str, str]] = None,
+) -> Mapping[str, str]:
+    """Return the client's headers with per-call *extra_headers* applied.
+
+    ``client._headers`` is a read-only snapshot that token refresh replaces
+    rather than mutates, so without extras it is returned as-is.
+    """
+    headers = client._headers
+    if extra_headers:
+        return {**headers, **extra_headers}
+    return headers
+
+
+# ---------------------------------------------------------------------------
+# Request with retry — every call path goes through these two functions
+# ---------------------------------------------------------------------------
+
+def _next_retry_delay(
+    client: Any,
+    attempt: int,
+    previous: float,
+    response: Any = None,
+) -> Optional[float]:
+    """Return the sleep before retry number *attempt* + 1, or None to give up.
+
+    Gives up when the policy's ``max_retries`` is used, the server's
+    ``Retry-After`` exceeds ``max_delay``, or the client's retry budget
+    is empty.
+    """
+    policy = client._retry_policy
+    if attempt >= policy.max_retries:
+        return None
+    delay = policy.next_delay(previous)
+    if response is not None:
+        requested = policy.retry_after(response)
+        if requested is not None:
+            if requested > policy.max_delay:
+                return None
+            delay = requested
+    if not client._retry_budget.withdraw():
+        return None
+    return delay
+
+
+def _retry_statuses(client: Any, idempotent: bool) -> FrozenSet[int]:
+    """Statuses worth retrying; only unprocessed ones for calls that change state."""
+    policy = client._retry_policy
+    if idempotent or policy.retry_non_idempotent:
+        return policy.retry_statuses
+    return policy.retry_statuses & UNPROCESSED_STATUS_CODES
+
+
+def _may_resend(client: Any, idempotent: bool, error: Exception) -> bool:
+    """Whether a failed attempt can be re-sent without risking a double apply."""
+    return (
+        idempotent
+        or client._retry_policy.retry_non_idempotent
+        or isinstance(error, UNSENT_EXCEPTIONS)
+    )
+
+
+def _request_sync(
+    client: Any,
+    method: str,
+    url: str,
+    payload: Optional[Dict[str, Any]],
+    headers: Mapping[str, str],
+    idempotent: bool = True,
+) -> Any:
+    """Send a request, retrying transient failures (sync).
+
+    Returns the final ``httpx.Response`` — possibly a retryable status once
+    retries are exhausted — for the caller to check.
+
+    Calls that are not *idempotent* (mutations, tool execution) are only
+    retried on 429 and on failures where the request never left the
+    client, since a 5xx or read timeout may follow a change the server
+    already applied. ``RetryPolicy.retry_non_idempotent`` lifts this.
+
+    Raises:
+        APIError: If the connection still fails after the last attempt.
+    """
+    hooks = client._instrumentation
+    if hooks is not None:
+        hooks.on_request(method, url, headers, payload)
+    client._retry_budget.deposit()
+    retry_statuses = _retry_statuses(client, idempotent)
+
+    delay = 0.0
+    attempt = 0
+    while True:
+        if hooks is not None:
+            started = time.perf_counter()
+        try:
+            if method == "POST":
+                response = client._http.post(url, json=payload or {}, headers=headers)
+            else:
+                response = client._http.get(url, headers=headers)
+        except RETRYABLE_EXCEPTIONS as e:
+            next_delay = None
+            if _may_resend(client, idempotent, e):
+                next_delay = _next_retry_delay(client, attempt, delay)
+            if next_delay is None:
+                raise APIError(
+                    f"Connection failed after {attempt + 1} attempts: {e}"
+                ) from e
+            reason = type(e).__name__
+        else:
+            if hooks is not None:
+                hooks.on_response(method, url, response, time.perf_counter() - started)
+            if response.status_code not in retry_statuses:
+                return response
+            next_delay = _next_retry_delay(client, attempt, delay, response)
+            if next_delay is None:
+                return response
+            reason = f"HTTP {response.status_code}"
+
+        attempt += 1
+        delay = next_delay
+        if hooks is not None:
+            hooks.on_retry(method, url, attempt, delay, reason)
+        time.sleep(delay)
+
+
+async def _request_async(
+    client: Any,
+    method: str,
+    url: str,
+    payload: Optional[Dict[str, Any]],
+    headers: Mapping[str, str],
+    idempotent: bool = True,
+) -> Any:
+    """Send a request, retrying transient failures (async).
+
+    See ``_request_sync`` for the return value and which failures are
+    retried.
+
+    Raises:
+        APIError: If the connection still fails after the last attempt.
+    """
+    hooks = client._instrumentation
+    if hooks is not None:
+        hooks.on_request(method, url, headers, payload)
+    client._retry_budget.deposit()
+    retry_statuses = _retry_statuses(client, idempotent)
+
+    delay = 0.0
+    attempt = 0
+    while True:
+        if hooks is not None:
+            started = time.perf_counter()
+        try:
+            if method == "POST":
+                response = await client._http.post(url, json=payload or {}, headers=headers)
+            else:
+                response = await client._http.get(url, headers=headers)
+        except RETRYABLE_EXCEPTIONS as e:
+            next_delay = None
+            if _may_resend(client, idempotent, e):
+                next_delay = _next_retry_delay(client, attempt, delay)
+            if next_delay is None:
+                raise APIError(
+                    f"Connection failed after {attempt + 1} attempts: {e}"
+                ) from e
+            reason = type(e).__name__
+        else:
+            if hooks is not None:
+                hooks.on_response(method, url, response, time.perf_counter() - started)
+            if response.status_code not in retry_statuses:
+                return response
+            next_delay = _next_retry_delay(client, attempt, delay, response)
+            if next_delay is None:
+                return response
+            reason = f"HTTP {response.status_code}"
+
+        attempt += 1
+        delay = next_delay
+        if hooks is not None:
+            hooks.on_retry(method, url, attempt, delay, reason)
+        await asyncio.sleep(delay)
 
 
 def _api_call_sync(
@@ -102,20 +374,18 @@ def _api_call_sync(
     url: str,
     payload: Optional[Dict[str, Any]] = None,
     extra_headers: Optional[Dict[str, str]] = None,
+    idempotent: Optional[bool] = None,
 ) -> Any:
-    """Shared HTTP call with error handling (sync)."""
-    client._ensure_fresh_token()
-    headers = dict(client._headers)
-    if extra_headers:
-        headers.update(extra_headers)
-    _log_request(client, method, url, payload)
-
-    if method == "POST":
-        response = client._http.post(url, json=payload or {}, headers=headers)
-    else:
-        response = client._http.get(url, headers=headers)
+    """Shared HTTP call with retry and error handling (sync).
 
-    client._log(f"Response {response.status_code}: {response.text[:2000]}")
+    *idempotent* defaults to True for GET only; pass True for POSTs that
+    just read (status and run lookups) so they get the full retry policy.
+    """
+    client._ensure_fresh_token()
+    headers = _merge_headers(client, extra_headers)
+    if idempotent is None:
+        idempotent = method == "GET"
+    response = _request_sync(client, method, url, payload, headers, idempotent)
     return _check_api_response(response, payload)
 
 
@@ -125,20 +395,18 @@ async def _api_call_async(
     url: str,
     payload: Optional[Dict[str, Any]] = None,
     extra_headers: Optional[Dict[str, str]] = None,
+    idempotent: Optional[bool] = None,
 ) -> Any:
-    """Shared HTTP call with error handling (async)."""
-    client._ensure_fresh_token()
-    headers = dict(client._headers)
-    if extra_headers:
-        headers.update(extra_headers)
-    _log_request(client, method, url, payload)
-
-    if method == "POST":
-        response = await client._http.post(url, json=payload or {}, headers=headers)
-    else:
-        response = await client._http.get(url, headers=headers)
+    """Shared HTTP call with retry and error handling (async).
 
-    client._log(f"Response {response.status_code}: {response.text[:2000]}")
+    *idempotent* defaults to True for GET only; pass True for POSTs that
+    just read (status and run lookups) so they get the full retry policy.
+    """
+    await client._ensure_fresh_token_async()
+    headers = _merge_headers(client, extra_headers)
+    if idempotent is None:
+        idempotent = method == "GET"
+    response = await _request_async(client, method, url, payload, headers, idempotent)
     return _check_api_response(response, payload)
 
 
@@ -148,16 +416,39 @@ def _gql_call_sync(
     variables: Dict[str, Any],
     extra_headers: Dict[str, str] | None = None,
 ) -> Any:
-    """Shared GraphQL call with error handling (sync)."""
+    """Shared GraphQL call with retry and error handling (sync).
+
+    Queries are merged with concurrent ones into a single request while
+    batching is on (``client.batch()`` or ``graphql_batch_window=``).
+    """
     client._ensure_fresh_token()
-    headers = dict(client._headers)
-    if extra_headers:
-        headers.update(extra_headers)
-    gql_payload = {"query": query, "variables": variables}
-    _log_request(client, "POST", GRAPHQL_URL, gql_payload)
+    window = client._batch_window()
+    if window is not None:
+        from fastn._gql_batch import _batched_call_sync
+
+        return _batched_call_sync(client, query, variables, extra_headers, window)
+    return _gql_send_sync(client, query, variables, extra_headers)
+
 
-    response = client._http.post(GRAPHQL_URL, json=gql_payload, headers=headers)
-    client._log(f"Response {response.status_code}: {response.text[:2000]}")
+def _gql_send_sync(
+    client: Any,
+    query: str,
+    variables: Dict[str, Any],
+    extra_headers: Dict[str, str] | None = None,
+) -> Any:
+    """Send one GraphQL operation in its own request (sync)."""
+    headers = _merge_headers(client, extra_headers)
+    persisted = client._persisted_queries
+    idempotent = not _is_mutation(query)
+    payload = _gql_payload(client, query, variables)
+    response = _request_sync(
+        client, "POST", GRAPHQL_URL, payload, headers, idempotent
+    )
+    if persisted and _persisted_query_missed(client, response):
+        payload = _gql_payload(client, query, variables, full=True)
+        response = _request_sync(
+            client, "POST", GRAPHQL_URL, payload, headers, idempotent
+        )
     return _check_gql_response(response)
 
 
@@ -167,59 +458,51 @@ async def _gql_call_async(
     variables: Dict[str, Any],
     extra_headers: Dict[str, str] | None = None,
 ) -> Any:
-    """Shared GraphQL call with error handling (async)."""
-    client._ensure_fresh_token()
-    headers = dict(client._headers)
-    if extra_headers:
-        headers.update(extra_headers)
-    gql_payload = {"query": query, "variables": variables}
-    _log_request(client, "POST", GRAPHQL_URL, gql_payload)
+    """Shared GraphQL call with retry and error handling (async).
 
-    response = await client._http.post(GRAPHQL_URL, json=gql_payload, headers=headers)
-    client._log(f"Response {response.status_code}: {response.text[:2000]}")
-    return _check_gql_response(response)
+    Queries are merged with concurrent ones into a single request while
+    batching is on (``client.batch()`` or ``graphql_batch_window=``).
+    """
+    await client._ensure_fresh_token_async()
+    window = client._batch_window()
+    if window is not None:
+        from fastn._gql_batch import _batched_call_async
 
+        return await _batched_call_async(client, query, variables, extra_headers, window)
+    return await _gql_send_async(client, query, variables, extra_headers)
+
+
+async def _gql_send_async(
+    client: Any,
+    query: str,
+    variables: Dict[str, Any],
+    extra_headers: Dict[str, str] | None = None,
+) -> Any:
+    """Send one GraphQL operation in its own request (async)."""
+    headers = _merge_headers(client, extra_headers)
+    persisted = client._persisted_queries
+    idempotent = not _is_mutation(query)
+    payload = _gql_payload(client, query, variables)
+    response = await _request_async(
+        client, "POST", GRAPHQL_URL, payload, headers, idempotent
+    )
+    if persisted and _persisted_query_missed(client, response):
+        payload = _gql_payload(client, query, variables, full=True)
+        response = await _request_async(
+            client, "POST", GRAPHQL_URL, payload, headers, idempotent
+        )
+    return _check_gql_response(response)
 
-# ---------------------------------------------------------------------------
-# POST with retry — 429 back-off and connection-error recovery
-# ---------------------------------------------------------------------------
 
 def _post_with_retry_sync(
     client: Any,
     url: str,
     payload: Dict[str, Any],
     extra_headers: Optional[Dict[str, str]] = None,
+    idempotent: bool = False,
 ) -> Any:
-    """POST with retry for 429 and connection errors (sync).
-
-    Uses ``_check_api_response`` for consistent error handling and
-    ``client._max_retries`` for the retry budget.
-    """
-    client._ensure_fresh_token()
-    headers = dict(client._headers)
-    if extra_headers:
-        headers.update(extra_headers)
-    _log_request(client, "POST", url, payload)
-
-    last_error: Optional[Exception] = None
-    for attempt in range(client._max_retries + 1):
-        try:
-            response = client._http.post(url, json=payload, headers=headers)
-            client._log(f"Response {response.status_code}: {response.text[:2000]}")
-            if response.status_code == 429 and attempt < client._max_retries:
-                time.sleep(BACKOFF_FACTOR * (2 ** attempt))
-                continue
-            return _check_api_response(response, payload)
-        except (httpx.ConnectError, httpx.ReadTimeout) as e:
-            last_error = e
-            if attempt < client._max_retries:
-                time.sleep(BACKOFF_FACTOR * (2 ** attempt))
-                continue
-            raise APIError(
-                f"Connection failed after {client._max_retries + 1} attempts: {e}"
-            ) from e
-
-    raise APIError(f"Request failed: {last_error}") from last_error
+    """POST with retry (sync). Kept for tool execution call sites."""
+    return _api_call_sync(client, "POST", url, payload, extra_headers, idempotent)
 
 
 async def _post_with_retry_async(
@@ -227,36 +510,7 @@ async def _post_with_retry_async(
     url: str,
     payload: Dict[str, Any],
     extra_headers: Optional[Dict[str, str]] = None,
+    idempotent: bool = False,
 ) -> Any:
-    """POST with retry for 429 and connection errors (async).
-
-    Uses ``_check_api_response`` for consistent error handling and
-    ``client._max_retries`` for the retry budget.
-    """
-    import asyncio
-
-    client._ensure_fresh_token()
-    headers = dict(client._headers)
-    if extra_headers:
-        headers.update(extra_headers)
-    _log_request(client, "POST", url, payload)
-
-    last_error: Optional[Exception] = None
-    for attempt in range(client._max_retries + 1):
-        try:
-            response = await client._http.post(url, json=payload, headers=headers)
-            client._log(f"Response {response.status_code}: {response.text[:2000]}")
-            if response.status_code == 429 and attempt < client._max_retries:
-                await asyncio.sleep(BACKOFF_FACTOR * (2 ** attempt))
-                continue
-            return _check_api_response(response, payload)
-        except (httpx.ConnectError, httpx.ReadTimeout) as e:
-            last_error = e
-            if attempt < client._max_retries:
-                await asyncio.sleep(BACKOFF_FACTOR * (2 ** attempt))
-                continue
-            raise APIError(
-                f"Connection failed after {client._max_retries + 1} attempts: {e}"
-            ) from e
-
-    raise APIError(f"Request failed: {last_error}") from last_error
+    """POST with retry (async). Kept for tool execution call sites."""
+    return await _api_call_async(client, "POST", url, payload, extra_headers, idempotent)
@@ -2,15 +2,55 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Sequence
 
-from fastn._constants import (
+from fastn._cache import _cached_async, _cached_sync, _invalidate
+from fastn._graphql import _project
+from fastn._http import _gql_call_async, _gql_call_sync
+from fastn._pages import (
+    DEFAULT_PAGE_SIZE,
+    Page,
+    _check_page_size,
+    _iter_pages_async,
+    _iter_pages_sync,
+    _next_offset,
+    _search_query,
+)
+from fastn._queries import (
     GET_CONNECTOR_QUERY,
     GET_KIT_CONNECTORS_QUERY,
     GET_KIT_METADATA_QUERY,
     SAVE_KIT_METADATA_MUTATION,
 )
-from fastn._http import _gql_call_async, _gql_call_sync
+
+
+def _build_kit_connectors_variables(
+    client: Any, query: str, limit: int, offset: int,
+) -> Dict[str, Any]:
+    """Build the GraphQL variables for one page of ``widgetConnectors``."""
+    return {
+        "input": {
+            "projectId": client._auth.workspace_id,
+            "first": limit,
+            "after": None,
+            "query": _search_query(limit, offset, "desc", query),
+        }
+    }
+
+
+def _kit_connectors_document(fields: Optional[Sequence[str]]) -> str:
+    """The ``widgetConnectors`` query, with the node trimmed to *fields*."""
+    if fields is None:
+        return GET_KIT_CONNECTORS_QUERY
+    return _project(GET_KIT_CONNECTORS_QUERY, ("widgetConnectors", "edges", "node"), fields)
+
+
+def _kit_page(data: Dict[str, Any], offset: int, limit: int) -> Page:
+    """Parse a ``widgetConnectors`` page into ``(connectors, next_offset)``."""
+    result = data.get("widgetConnectors") or {}
+    edges = result.get("edges") or []
+    nodes = [e["node"] for e in edges if "node" in e]
+    return nodes, _next_offset(result.get("pageInfo"), offset, len(edges), limit)
 
 
 class _KitSync:
@@ -38,14 +78,17 @@ class _KitSync:
         ``isAIAgentWidgetEnabled``, ``labelsLayout``,
         ``advancedSettings``, and ``widgetsMetrics``.
         """
-        project_id = self._client._config.resolve_project_id()
+        project_id = self._client._auth.workspace_id
         variables = {
             "input": {
                 "id": project_id,
                 "clientId": project_id,
             }
         }
-        data = _gql_call_sync(self._client, GET_KIT_METADATA_QUERY, variables)
+        data = _cached_sync(
+            self._client, "kit", "get", (),
+            lambda: _gql_call_sync(self._client, GET_KIT_METADATA_QUERY, variables),
+        )
         return data.get("widgetMetadata") or {}
 
     def update(self, settings: Dict[str, Any]) -> Dict[str, Any]:
@@ -65,7 +108,7 @@ class _KitSync:
             The saved kit metadata (``authenticationApi``,
             ``isCustomAuthenticationEnabled``, ``advancedSettings``).
         """
-        project_id = self._client._config.resolve_project_id()
+        project_id = self._client._auth.workspace_id
         variables = {
             "input": {
                 "projectId": project_id,
@@ -73,43 +116,63 @@ class _KitSync:
             }
         }
         data = _gql_call_sync(self._client, SAVE_KIT_METADATA_MUTATION, variables)
+        _invalidate(self._client, "kit")
         return data.get("saveWidgetMetadata") or {}
 
-    def list(self, query: str = "", limit: int = 8, offset: int = 0) -> List[Dict[str, Any]]:
+    def list(
+        self,
+        query: str = "",
+        limit: int = 8,
+        offset: int = 0,
+        fields: Optional[Sequence[str]] = None,
+    ) -> List[Dict[str, Any]]:
         """List kit connectors for the current project.
 
         Args:
             query: Optional search query string.
             limit: Maximum number of results (default 8).
             offset: Pagination offset (default 0).
+            fields: Only request these connector fields (e.g.
+                ``["id", "name"]``). Defaults to every field.
 
         Returns:
             A list of kit connector dicts with ``id``, ``name``,
             ``active``, ``connectionId``, ``widgetType``, ``labels``,
             ``imageUri``, etc.
         """
-        project_id = self._client._config.resolve_project_id()
-        import json as _json
-        inner_query = _json.dumps({
-            "input": {
-                "limit": limit,
-                "offset": offset,
-                "sort": "desc",
-                "query": query,
-                "filter": {},
-            }
-        })
-        variables = {
-            "input": {
-                "projectId": project_id,
-                "first": limit,
-                "after": None,
-                "query": inner_query,
-            }
-        }
-        data = _gql_call_sync(self._client, GET_KIT_CONNECTORS_QUERY, variables)
-        edges = (data.get("widgetConnectors") or {}).get("edges") or []
-        return [e["node"] for e in edges if "node" in e]
+        document = _kit_connectors_document(fields)
+        variables = _build_kit_connectors_variables(self._client, query, limit, offset)
+        data = _gql_call_sync(self._client, document, variables)
+        return _kit_page(data, offset, limit)[0]
+
+    def iter(
+        self,
+        query: str = "",
+        page_size: int = DEFAULT_PAGE_SIZE,
+        fields: Optional[Sequence[str]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over all kit connectors, a page at a time.
+
+        Follows ``pageInfo`` until the last page, fetching the next page in
+        the background while the current one is consumed.
+
+        Args:
+            query: Optional search query string.
+            page_size: Connectors per request.
+            fields: Only request these connector fields.
+
+        Yields:
+            Kit connector dicts, as returned by :meth:`list`.
+        """
+        _check_page_size(page_size)
+        document = _kit_connectors_document(fields)
+
+        def fetch(offset: int) -> Page:
+            variables = _build_kit_connectors_variables(self._client, query, page_size, offset)
+            data = _gql_call_sync(self._client, document, variables)
+            return _kit_page(data, offset, page_size)
+
+        return _iter_pages_sync(fetch)
 
     def get_connector(self, connector_id: str) -> Dict[str, Any]:
         """Get full details for a specific kit connector.
@@ -123,7 +186,7 @@ class _KitSync:
             ``description``, ``actions``, ``events``,
             ``connectedConnectors``, ``externalFlows``, etc.
         """
-        project_id = self._client._config.resolve_project_id()
+        project_id = self._client._auth.workspace_id
         variables = {
             "input": {
                 "projectId": project_id,
@@ -131,7 +194,10 @@ class _KitSync:
                 "template": False,
             }
         }
-        data = _gql_call_sync(self._client, GET_CONNECTOR_QUERY, variables)
+        data = _cached_sync(
+            self._client, "kit", "get_connector", (connector_id,),
+            lambda: _gql_call_sync(self._client, GET_CONNECTOR_QUERY, variables),
+        )
         return data.get("connector") or {}
 
 
@@ -147,19 +213,22 @@ class _KitAsync:
 
     async def get(self) -> Dict[str, Any]:
         """Get kit metadata for the current project (async)."""
-        project_id = self._client._config.resolve_project_id()
+        project_id = self._client._auth.workspace_id
         variables = {
             "input": {
                 "id": project_id,
                 "clientId": project_id,
             }
         }
-        data = await _gql_call_async(self._client, GET_KIT_METADATA_QUERY, variables)
+        data = await _cached_async(
+            self._client, "kit", "get", (),
+            lambda: _gql_call_async(self._client, GET_KIT_METADATA_QUERY, variables),
+        )
         return data.get("widgetMetadata") or {}
 
     async def update(self, settings: Dict[str, Any]) -> Dict[str, Any]:
         """Update kit metadata for the current project (async)."""
-        project_id = self._client._config.resolve_project_id()
+        project_id = self._client._auth.workspace_id
         variables = {
             "input": {
                 "projectId": project_id,
@@ -167,36 +236,42 @@ class _KitAsync:
             }
         }
         data = await _gql_call_async(self._client, SAVE_KIT_METADATA_MUTATION, variables)
+        _invalidate(self._client, "kit")
         return data.get("saveWidgetMetadata") or {}
 
-    async def list(self, query: str = "", limit: int = 8, offset: int = 0) -> List[Dict[str, Any]]:
+    async def list(
+        self,
+        query: str = "",
+        limit: int = 8,
+        offset: int = 0,
+        fields: Optional[Sequence[str]] = None,
+    ) -> List[Dict[str, Any]]:
         """List kit connectors for the current project (async)."""
-        project_id = self._client._config.resolve_project_id()
-        import json as _json
-        inner_query = _json.dumps({
-            "input": {
-                "limit": limit,
-                "offset": offset,
-                "sort": "desc",
-                "query": query,
-                "filter": {},
-            }
-        })
-        variables = {
-            "input": {
-                "projectId": project_id,
-                "first": limit,
-                "after": None,
-                "query": inner_query,
-            }
-        }
-        data = await _gql_call_async(self._client, GET_KIT_CONNECTORS_QUERY, variables)
-        edges = (data.get("widgetConnectors") or {}).get("edges") or []
-        return [e["node"] for e in edges if "node" in e]
+        document = _kit_connectors_document(fields)
+        variables = _build_kit_connectors_variables(self._client, query, limit, offset)
+        data = await _gql_call_async(self._client, document, variables)
+        return _kit_page(data, offset, limit)[0]
+
+    def iter(
+        self,
+        query: str = "",
+        page_size: int = DEFAULT_PAGE_SIZE,
+        fields: Optional[Sequence[str]] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over all kit connectors (async). Use with ``async for``."""
+        _check_page_size(page_size)
+        document = _kit_connectors_document(fields)
+
+        async def fetch(offset: int) -> Page:
+            variables = _build_kit_connectors_variables(self._client, query, page_size, offset)
+            data = await _gql_call_async(self._client, document, variables)
+            return _kit_page(data, offset, page_size)
+
+        return _iter_pages_async(fetch)
 
     async def get_connector(self, connector_id: str) -> Dict[str, Any]:
         """Get full details for a specific kit connector (async)."""
-        project_id = self._client._config.resolve_project_id()
+        project_id = self._client._auth.workspace_id
         variables = {
             "input": {
                 "projectId": project_id,
@@ -204,5 +279,8 @@ class _KitAsync:
                 "template": False,
             }
         }
-        data = await _gql_call_async(self._client, GET_CONNECTOR_QUERY, variables)
+        data = await _cached_async(
+            self._client, "kit", "get_connector", (connector_id,),
+            lambda: _gql_call_async(self._client, GET_CONNECTOR_QUERY, variables),
+        )
         return data.get("connector") or {}
@@ -0,0 +1,117 @@
+"""Paged iteration over control-plane listings with one page of prefetch.
+
+``flows.iter()``, ``kit.iter()`` and ``connectors.iter()`` walk the
+``limit``/``offset`` windows the list APIs accept, stopping on the
+``pageInfo`` they return. While the consumer works through one page the
+next is already being fetched — on a single background thread (sync) or
+as a task on the running loop (async) — so at most two pages are held in
+memory at a time. The first page is fetched by the caller itself, and a
+single-page listing never starts a thread or task. Breaking out of the
+loop cancels the pending fetch.
+
+A page fetcher takes an offset and returns ``(items, next_offset)``,
+with ``next_offset`` None on the last page.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import (
+    Any,
+    AsyncGenerator,
+    Awaitable,
+    Callable,
+    Dict,
+    Generator,
+    List,
+    Optional,
+    Tuple,
+)
+
+DEFAULT_PAGE_SIZE = 100
+
+Page = Tuple[List[Any], Optional[int]]
+
+
+def _search_query(
+    limit: int,
+    offset: int,
+    sort: str = "desc",
+    query: str = "",
+    filters: Optional[Dict[str, Any]] = None,
+) -> str:
+    """Serialize the search window the list APIs take as their ``query`` string."""
+    return json.dumps(
+        {"input": {
+            "limit": limit, "offset": offset, "sort": sort, "query": query,
+            "filter": filters or {},
+        }},
+        separators=(",", ":"),
+    )
+
+
+def _check_page_size(page_size: int) -> None:
+    if page_size < 1:
+        raise ValueError(f"page_size must be at least 1, got {page_size}")
+
+
+def _next_offset(
+    page_info: Optional[dict], offset: int, count: int, page_size: int,
+) -> Optional[int]:
+    """Offset of the page after the *count* items fetched at *offset*, or None.
+
+    ``hasNextPage`` wins when the API reports it; otherwise a full page
+    that has not reached ``totalCount`` means there may be more.
+    """
+    page_info = page_info or {}
+    if page_info.get("hasNextPage") is not None:
+        more = bool(page_info["hasNextPage"]) and count > 0
+    else:
+        total = page_info.get("totalCount")
+        more = count >= page_size and (total is None or offset + count < total)
+    return offset + count if more else None
+
+
+def _iter_pages_sync(fetch: Callable[[int], Page]) -> Generator[Any, None, None]:
+    """Yield every item, fetching the next page while this one is consumed."""
+    items, offset = fetch(0)
+    if offset is None:
+        yield from items
+        return
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="fastn-page")
+    future: Optional[Future] = None
+    try:
+        while True:
+            future = executor.submit(fetch, offset) if offset is not None else None
+            yield from items
+            if future is None:
+                return
+            items, offset = future.result()
+    finally:
+        if future is not None:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+async def _iter_pages_async(
+    fetch: Callable[[int], Awaitable[Page]],
+) -> AsyncGenerator[Any, None]:
+    """Async version of :func:`_iter_pages_sync`; the prefetch is a task."""
+    items, offset = await fetch(0)
+    task: Optional[asyncio.Future] = None
+    try:
+        while True:
+            task = asyncio.ensure_future(fetch(offset)) if offset is not None else None
+            for item in items:
+                yield item
+            if task is None:
+                return
+            items, offset = await task
+    finally:
+        if task is not None:
+            task.cancel()
+            # The prefetch may still fail while it unwinds; retrieve its
+            # error so asyncio doesn't log "Task exception was never retrieved".
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
@@ -0,0 +1,124 @@
+"""Compiled parameter-routing plans for tool execution.
+
+A tool's ``inputSchema`` decides where each flat kwarg goes in the
+executeTool ``parameters`` object (see ``_build_params_from_schema``).
+Working that out means walking every top-level and inner property, which
+is wasted effort when the same tool runs over and over with the same
+schema. :func:`_plan_for` compiles the schema once into a
+:class:`_ParamPlan` — a field → destination map — and caches it by schema
+identity, so routing a call is one dict lookup per kwarg.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+from typing import Any, Dict, List, Optional, Tuple
+
+_logger = logging.getLogger("fastn")
+
+# Plans are cached per schema object. Entries keep a reference to their
+# schema, so an id() cannot be reused while its entry is alive.
+_PLAN_CACHE_SIZE = 4096
+_plan_cache: Dict[int, Tuple[Any, "_ParamPlan"]] = {}
+
+# Routing modes
+_BODY = 0      # no schema: wrap every kwarg under "body"
+_FLAT = 1      # only primitive properties: pass kwargs through unchanged
+_ROUTED = 2    # at least one object property: route kwargs into groups
+
+
+class _ParamPlan:
+    """Where each kwarg of one tool goes.
+
+    Attributes:
+        mode: ``_BODY``, ``_FLAT`` or ``_ROUTED``.
+        routes: Field name → destinations. A destination is a group key,
+            or ``None`` for the top level. A field listed under several
+            groups is copied into each, as the schema walk always did.
+        fallback: Group that receives kwargs the schema doesn't know.
+    """
+
+    __slots__ = ("mode", "routes", "fallback")
+
+    def __init__(
+        self,
+        mode: int,
+        routes: Optional[Dict[str, Tuple[Optional[str], ...]]] = None,
+        fallback: str = "",
+    ) -> None:
+        self.mode = mode
+        self.routes = routes or {}
+        self.fallback = fallback
+
+    def apply(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Route *kwargs* into the structure the schema expects."""
+        if self.mode == _FLAT:
+            return kwargs
+        if self.mode == _BODY:
+            return {"body": kwargs} if kwargs else {}
+
+        routes = self.routes
+        result: Dict[str, Any] = {}
+        unknown: Optional[List[str]] = None
+        for name, value in kwargs.items():
+            destinations = routes.get(name)
+            if destinations is None:
+                if unknown is None:
+                    unknown = []
+                unknown.append(name)
+                destinations = (self.fallback,)
+            for group_key in destinations:
+                if group_key is None:
+                    result[name] = value
+                    continue
+                group = result.get(group_key)
+                if group is None:
+                    group = result[group_key] = {}
+                group[name] = value
+
+        if unknown and _logger.isEnabledFor(logging.DEBUG):
+            _logger.debug(
+                "Unknown kwargs %s not in schema — routed to fallback group", unknown,
+            )
+        return result
+
+
+def _compile_plan(schema: Dict[str, Any]) -> _ParamPlan:
+    """Walk *schema* once and build its routing plan."""
+    props = schema.get("properties", {})
+    if not props:
+        return _ParamPlan(_BODY)
+
+    # Object properties become groups holding their inner fields;
+    # primitive properties stay at the top level.
+    groups: List[str] = []
+    routes: Dict[str, Tuple[Optional[str], ...]] = {}
+    flat_fields: List[str] = []
+    for key, pdata in props.items():
+        if isinstance(pdata, dict) and pdata.get("type") == "object":
+            groups.append(key)
+            for field_name in pdata.get("properties") or ():
+                routes[field_name] = routes.get(field_name, ()) + (key,)
+        else:
+            flat_fields.append(key)
+
+    if not groups:
+        return _ParamPlan(_FLAT)
+    for field_name in flat_fields:
+        routes[field_name] = routes.get(field_name, ()) + (None,)
+    return _ParamPlan(_ROUTED, routes, fallback=groups[0])
+
+
+def _plan_for(schema: Dict[str, Any]) -> _ParamPlan:
+    """Return the cached plan for *schema*, compiling it on first use."""
+    entry = _plan_cache.get(id(schema))
+    if entry is not None and entry[0] is schema:
+        return entry[1]
+    plan = _compile_plan(schema)
+    if len(_plan_cache) >= _PLAN_CACHE_SIZE:
+        # Evict the oldest entry; pop() tolerates a concurrent eviction.
+        with contextlib.suppress(StopIteration, RuntimeError):
+            _plan_cache.pop(next(iter(_plan_cache)), None)
+    _plan_cache[id(schema)] = (schema, plan)
+    return plan
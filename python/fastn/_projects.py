@@ -4,7 +4,8 @@ from __future__ import annotations
 
 from typing import Any, Dict, List
 
-from fastn._constants import GET_ORGANIZATIONS_QUERY
+from fastn._cache import _cached_async, _cached_sync
+from fastn._queries import GET_ORGANIZATIONS_QUERY
 from fastn._http import _gql_call_sync, _gql_call_async
 from fastn.exceptions import AuthError
 
@@ -33,17 +34,22 @@ class _ProjectsSync:
         from fastn.oauth import _decode_jwt_payload
 
         self._client._ensure_fresh_token()
-        token = self._client._config.auth_token
-        if not token:
+        auth = self._client._auth
+        if not auth.token:
             raise AuthError("No auth token available.")
 
-        payload = _decode_jwt_payload(token)
-        user_id = payload.get("sub", "")
+        # Claims are decoded once per token; decoding again only happens
+        # for a malformed token, to raise the same error as before.
+        claims = auth.claims or _decode_jwt_payload(auth.token)
+        user_id = claims.get("sub", "")
         if not user_id:
             raise AuthError("Token does not contain a user ID.")
 
         variables = {"userId": user_id}
-        data = _gql_call_sync(self._client, GET_ORGANIZATIONS_QUERY, variables)
+        data = _cached_sync(
+            self._client, "projects", "list", (user_id,),
+            lambda: _gql_call_sync(self._client, GET_ORGANIZATIONS_QUERY, variables),
+        )
         return data.get("getOrganizations") or []
 
 
@@ -61,16 +67,21 @@ class _ProjectsAsync:
         """List all projects available to the authenticated user (async)."""
         from fastn.oauth import _decode_jwt_payload
 
-        self._client._ensure_fresh_token()
-        token = self._client._config.auth_token
-        if not token:
+        await self._client._ensure_fresh_token_async()
+        auth = self._client._auth
+        if not auth.token:
             raise AuthError("No auth token available.")
 
-        payload = _decode_jwt_payload(token)
-        user_id = payload.get("sub", "")
+        # Claims are decoded once per token; decoding again only happens
+        # for a malformed token, to raise the same error as before.
+        claims = auth.claims or _decode_jwt_payload(auth.token)
+        user_id = claims.get("sub", "")
         if not user_id:
             raise AuthError("Token does not contain a user ID.")
 
         variables = {"userId": user_id}
-        data = await _gql_call_async(self._client, GET_ORGANIZATIONS_QUERY, variables)
+        data = await _cached_async(
+            self._client, "projects", "list", (user_id,),
+            lambda: _gql_call_async(self._client, GET_ORGANIZATIONS_QUERY, variables),
+        )
         return data.get("getOrganizations") or []
@@ -0,0 +1,181 @@
+"""Memory-mapped binary registry (``.fastn/registry.bin``).
+
+``registry.json`` is pretty-printed and has to be parsed whole, so an app
+that touches three connectors still builds dicts for all of them.
+``save_registry`` therefore also writes ``registry.bin``, and clients
+read it via ``load_registry(lazy=True)``:
+
+    offset  size  field
+    0       4     magic ``b"FNRG"``
+    4       1     format version (1)
+    5       4     header length H, little-endian uint32
+    9       H     header: compact JSON
+                    {"meta": {top-level registry keys except "connectors"},
+                     "source": [registry.json st_mtime_ns, st_size],
+                     "connectors": [[name, offset, length, summary], ...]}
+    9 + H   ...   one compact JSON document per connector; offsets are
+                  relative to the end of the header
+
+The file is memory-mapped, and a connector's JSON is decoded the first
+time it is looked up (``_resolve_connector``, the catalog). Only the
+header is parsed up front. Each entry's ``summary`` holds
+``display_name``, ``category`` and ``tool_count``, so
+``connectors.list()`` needs no per-connector decoding.
+
+``registry.json`` stays the source of truth. ``source`` records the
+JSON file this binary was written from, and if ``registry.json`` has
+changed since, :func:`open_registry_bin` returns None and the caller
+loads the JSON instead.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import mmap
+import os
+import struct
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple
+
+REGISTRY_BIN_FILE = "registry.bin"
+
+_MAGIC = b"FNRG"
+_VERSION = 1
+_PREFIX = struct.Struct("<4sBI")
+
+
+def _compact(data: Any) -> bytes:
+    return json.dumps(data, separators=(",", ":")).encode("utf-8")
+
+
+def _summary(name: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "display_name": data.get("display_name", name),
+        "category": data.get("category", ""),
+        "tool_count": data.get("tool_count", len(data.get("tools", {}))),
+    }
+
+
+class _LazyConnectors(Mapping[str, Dict[str, Any]]):
+    """Read-only ``connector name -> data`` mapping over a mapped registry.bin."""
+
+    def __init__(
+        self,
+        buf: mmap.mmap,
+        base: int,
+        entries: List[List[Any]],
+    ) -> None:
+        self._buf = buf
+        self._base = base
+        self._entries: Dict[str, Tuple[int, int, Dict[str, Any]]] = {
+            name: (offset, length, summary) for name, offset, length, summary in entries
+        }
+        self._decoded: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def __getitem__(self, name: str) -> Dict[str, Any]:
+        data = self._decoded.get(name)
+        if data is None:
+            offset, length, _ = self._entries[name]
+            start = self._base + offset
+            with self._lock:
+                data = self._decoded.get(name)
+                if data is None:
+                    data = self._decoded[name] = json.loads(self._buf[start:start + length])
+        return data
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._entries
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def summary(self, name: str) -> Dict[str, Any]:
+        """``display_name``, ``category`` and ``tool_count`` without decoding."""
+        return self._entries[name][2]
+
+
+def write_registry_bin(registry: Dict[str, Any], fastn_dir: Path) -> Optional[Path]:
+    """Write registry.bin for the registry.json just saved in *fastn_dir*.
+
+    Best effort: on failure (e.g. Windows refusing to replace a file that
+    is still mapped) any existing registry.bin is left in place — its
+    ``source`` no longer matches registry.json, so readers ignore it.
+    """
+    json_path = Path(fastn_dir) / "registry.json"
+    target = Path(fastn_dir) / REGISTRY_BIN_FILE
+    try:
+        st = json_path.stat()
+    except OSError:
+        return None
+
+    blobs: List[bytes] = []
+    entries: List[List[Any]] = []
+    offset = 0
+    for name, data in registry.get("connectors", {}).items():
+        blob = _compact(data)
+        entries.append([name, offset, len(blob), _summary(name, data)])
+        blobs.append(blob)
+        offset += len(blob)
+    header = _compact({
+        "meta": {k: v for k, v in registry.items() if k != "connectors"},
+        "source": [st.st_mtime_ns, st.st_size],
+        "connectors": entries,
+    })
+
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=str(fastn_dir), prefix=".registry-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(_PREFIX.pack(_MAGIC, _VERSION, len(header)))
+                f.write(header)
+                for blob in blobs:
+                    f.write(blob)
+            os.replace(tmp_path, target)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_path)
+            raise
+    except OSError:
+        return None
+    return target
+
+
+def open_registry_bin(fastn_dir: Path) -> Optional[Dict[str, Any]]:
+    """Map registry.bin and return a registry dict with lazy connectors.
+
+    Returns None if the file is missing, unreadable, in another format
+    version, or older than registry.json.
+    """
+    path = Path(fastn_dir) / REGISTRY_BIN_FILE
+    try:
+        with open(path, "rb") as f:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+    try:
+        magic, version, header_len = _PREFIX.unpack_from(buf, 0)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError("not a registry.bin v1 file")
+        base = _PREFIX.size + header_len
+        header = json.loads(buf[_PREFIX.size:base])
+        try:
+            st = (Path(fastn_dir) / "registry.json").stat()
+            if [st.st_mtime_ns, st.st_size] != header["source"]:
+                raise ValueError("registry.json changed since registry.bin was written")
+        except FileNotFoundError:
+            pass  # registry.bin on its own is still a complete registry
+    except (ValueError, KeyError, struct.error, OSError):
+        buf.close()
+        return None
+
+    registry = dict(header["meta"])
+    registry["connectors"] = _LazyConnectors(buf, base, header["connectors"])
+    return registry
@@ -0,0 +1,96 @@
+"""Process-wide cache of registry.json and migrations.json for the clients.
+
+``fastn.config.load_registry`` parses the whole registry on every call,
+so an app that builds a client per request used to re-read and re-parse
+it each time and keep one copy per client. Clients now ask
+:func:`_load_shared` instead, and only on first use of a connector or
+catalog method:
+
+- Entries are keyed by the file's absolute path and validated against
+  the ``st_mtime_ns`` and ``st_size`` of the files behind them
+  (registry.json and registry.bin for the registry), so a ``fastn
+  connector sync`` is picked up by the next load (or
+  ``client.reload_registry()``) while unchanged files cost a ``stat()``.
+- The registry comes from the memory-mapped registry.bin when it is
+  current (see ``fastn._registry_bin``), so only connectors actually used
+  are decoded.
+- Every client loading the same file gets the same parsed object. It is
+  shared, so SDK code treats it as read-only; the CLI, which edits the
+  registry, keeps using ``load_registry``.
+- A lock serializes loads so concurrent first uses parse the file once.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+from fastn._registry_bin import REGISTRY_BIN_FILE
+from fastn.config import MIGRATIONS_FILE, REGISTRY_FILE, find_fastn_dir, load_registry
+
+_EMPTY_REGISTRY: Dict[str, Any] = {"version": "", "connectors": {}}
+
+# Stat fingerprint of the files behind an entry: (mtime_ns, size) or None each.
+_Signature = Tuple[Optional[Tuple[int, int]], ...]
+
+# abs path -> (signature, parsed data)
+_cache: Dict[str, Tuple[_Signature, Any]] = {}
+_lock = threading.Lock()
+
+
+def _signature(paths: Sequence[str]) -> _Signature:
+    sig = []
+    for path in paths:
+        try:
+            st = os.stat(path)
+        except OSError:
+            sig.append(None)
+        else:
+            sig.append((st.st_mtime_ns, st.st_size))
+    return tuple(sig)
+
+
+def _load_shared(paths: Sequence[str], load: Callable[[], Any], default: Any) -> Any:
+    """Return ``load()``'s result for *paths*, reusing it while they are unchanged."""
+    sig = _signature(paths)
+    if not any(sig):
+        return default
+    entry = _cache.get(paths[0])
+    if entry is not None and entry[0] == sig:
+        return entry[1]
+    with _lock:
+        entry = _cache.get(paths[0])
+        if entry is not None and entry[0] == sig:
+            return entry[1]
+        data = load()
+        _cache[paths[0]] = (sig, data)
+        return data
+
+
+def _load_json_file(path: str) -> Any:
+    with open(path) as f:
+        return json.load(f)
+
+
+def _resolve_dir(fastn_dir: Optional[Path]) -> str:
+    return os.path.abspath(fastn_dir if fastn_dir is not None else find_fastn_dir())
+
+
+def _shared_registry(fastn_dir: Optional[Path] = None) -> Dict[str, Any]:
+    """Shared, read-only registry for *fastn_dir* (found from cwd if None).
+
+    Backed by the memory-mapped registry.bin when it is current, else
+    registry.json.
+    """
+    base = _resolve_dir(fastn_dir)
+    paths = (os.path.join(base, REGISTRY_FILE), os.path.join(base, REGISTRY_BIN_FILE))
+    return _load_shared(paths, lambda: load_registry(Path(base), lazy=True), _EMPTY_REGISTRY)
+
+
+def _shared_migrations(fastn_dir: Optional[Path] = None) -> Dict[str, Any]:
+    """Shared, read-only migrations map for *fastn_dir*."""
+    path = os.path.join(_resolve_dir(fastn_dir), MIGRATIONS_FILE)
+    return _load_shared((path,), lambda: _load_json_file(path), {})
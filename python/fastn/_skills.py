@@ -4,8 +4,9 @@ from __future__ import annotations
 
 from typing import Any, Dict, List
 
-from fastn._constants import LIST_SKILLS_QUERY
+from fastn._cache import _cached_async, _cached_sync
 from fastn._http import _gql_call_async, _gql_call_sync
+from fastn._queries import LIST_SKILLS_QUERY
 
 
 class _SkillsSync:
@@ -29,9 +30,12 @@ class _SkillsSync:
         Returns a list of dicts with ``id``, ``projectId``, ``name``,
         ``description``, ``createdAt``, ``updatedAt``.
         """
-        project_id = self._client._config.resolve_project_id()
+        project_id = self._client._auth.workspace_id
         variables = {"input": {"projectId": project_id}}
-        data = _gql_call_sync(self._client, LIST_SKILLS_QUERY, variables)
+        data = _cached_sync(
+            self._client, "skills", "list", (),
+            lambda: _gql_call_sync(self._client, LIST_SKILLS_QUERY, variables),
+        )
         return data.get("listUCLAgents") or []
 
 
@@ -47,7 +51,10 @@ class _SkillsAsync:
 
     async def list(self) -> List[Dict[str, Any]]:
         """List all agent skills in the current project (async)."""
-        project_id = self._client._config.resolve_project_id()
+        project_id = self._client._auth.workspace_id
         variables = {"input": {"projectId": project_id}}
-        data = await _gql_call_async(self._client, LIST_SKILLS_QUERY, variables)
+        data = await _cached_async(
+            self._client, "skills", "list", (),
+            lambda: _gql_call_async(self._client, LIST_SKILLS_QUERY, variables),
+        )
         return data.get("listUCLAgents") or []
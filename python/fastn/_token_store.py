@@ -0,0 +1,135 @@
+"""Cross-process OAuth token sharing through ``.fastn/config.json``.
+
+When many worker processes load the same ``fastn login`` session, each
+would otherwise call Keycloak on expiry and keep the new token to itself.
+With ``share_token=True`` the clients coordinate through the config file:
+
+1. Take an exclusive advisory lock on ``config.json.lock``.
+2. Re-read ``config.json``. If another process already stored a token
+   that is still valid, adopt it — no network call.
+3. Otherwise refresh (with the stored refresh token, in case it was
+   rotated) and publish the result by writing a temp file and
+   ``os.replace``-ing it over ``config.json``, so readers never see a
+   partial file.
+
+Refresh traffic therefore stays at one request per expiry no matter how
+many processes share the file. Locking uses ``fcntl`` on POSIX and
+``msvcrt`` on Windows; where neither exists the lock is a no-op and only
+the atomic rewrite remains.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None  # type: ignore[assignment]
+
+_TOKEN_FIELDS = ("auth_token", "refresh_token", "token_expiry")
+
+
+class _SharedTokenStore:
+    """Token fields of one config file, guarded by a sidecar lock file."""
+
+    def __init__(self, config_file: Path) -> None:
+        self.path = Path(config_file)
+        self._lock_path = self.path.with_name(self.path.name + ".lock")
+
+    def acquire(self) -> Any:
+        """Block until this process holds the lock. Returns a handle for release()."""
+        with contextlib.ExitStack() as stack:
+            # Closed if locking fails; kept open (and locked) otherwise.
+            handle = stack.enter_context(open(self._lock_path, "a+"))
+            if fcntl is not None:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+            elif msvcrt is not None:  # pragma: no cover - Windows
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+            stack.pop_all()
+        return handle
+
+    async def acquire_async(self) -> Any:
+        """Take the lock from a worker thread so the event loop keeps running."""
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(None, self.acquire)
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            # The thread still gets the lock; hand it straight back.
+            future.add_done_callback(
+                lambda f: f.cancelled() or f.exception() or self.release(f.result())
+            )
+            raise
+
+    def release(self, handle: Any) -> None:
+        """Release a lock taken with acquire()."""
+        try:
+            if fcntl is not None:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+            elif msvcrt is not None:  # pragma: no cover - Windows
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+        finally:
+            handle.close()
+
+    def read(self) -> Dict[str, str]:
+        """Return the token fields currently stored in the config file."""
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return {k: data.get(k, "") for k in _TOKEN_FIELDS}
+
+    def publish(self, auth_token: str, refresh_token: str, token_expiry: str) -> None:
+        """Atomically replace the token fields, keeping the rest of the file.
+
+        Call with the lock held.
+        """
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            data = {}
+        data.update(
+            auth_token=auth_token, refresh_token=refresh_token, token_expiry=token_expiry,
+        )
+
+        fd, tmp_path = tempfile.mkstemp(dir=str(self.path.parent), prefix=".config-")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f, indent=2)
+                f.write("\n")
+                f.flush()
+                os.fsync(f.fileno())
+            # Windows or other OS without POSIX permissions
+            with contextlib.suppress(OSError):
+                os.chmod(tmp_path, 0o600)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_path)
+            raise
+
+
+def _adoptable(stored: Dict[str, str], current_token: str) -> Optional[Dict[str, str]]:
+    """Return *stored* if it holds a different, still-valid access token."""
+    from fastn.oauth import is_token_expired
+
+    token = stored.get("auth_token")
+    if token and token != current_token and not is_token_expired(stored.get("token_expiry", "")):
+        return stored
+    return None
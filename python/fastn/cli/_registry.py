@@ -6,13 +6,18 @@ schema migration, and stub generation/installation.
 
 from __future__ import annotations
 
+import contextlib
+import json
 import sys
+import threading
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import click
 
 from fastn.config import (
+    SYNC_CHECKPOINT_FILE,
     FastnConfig,
     get_installed_connectors,
     load_manifest,
@@ -33,7 +38,7 @@ from fastn.cli import (
     SOURCE_ORG,
     SOURCE_WORKSPACE,
 )
-from fastn._constants import GET_ORGANIZATIONS_QUERY
+from fastn._queries import GET_ORGANIZATIONS_QUERY
 
 # Helpers from the helpers module
 from fastn.cli._helpers import (
@@ -385,6 +390,163 @@ def _parse_tool_node(node: dict) -> dict:
     }
 
 
+# ---------------------------------------------------------------------------
+# Incremental sync
+# ---------------------------------------------------------------------------
+
+# Listing fields that identify a connector's tool set. The listing carries
+# no version or timestamp, so a connector whose fields match keeps its
+# cached schemas (until they are older than --max-age, when one is given).
+_LISTING_KEYS = ("id", "source", "connector_type")
+
+
+def _tools_are_fresh(cdata: dict, max_age: Optional[float], now: datetime) -> bool:
+    """Whether *cdata*'s tool schemas were fetched less than *max_age* days ago.
+
+    Always True when *max_age* is None (age-based refresh is off).
+    """
+    if max_age is None:
+        return True
+    synced_at = cdata.get("synced_at")
+    if not synced_at:
+        return False
+    try:
+        fetched = datetime.fromisoformat(synced_at)
+    except (TypeError, ValueError):
+        return False
+    if fetched.tzinfo is None:
+        fetched = fetched.replace(tzinfo=timezone.utc)
+    return now - fetched < timedelta(days=max_age)
+
+
+def _plan_tool_sync(
+    old_registry: Dict,
+    registry: Dict,
+    force: bool,
+    max_age: Optional[float],
+    now: datetime,
+) -> List[str]:
+    """Carry cached tool schemas into *registry* and list connectors to fetch.
+
+    A connector keeps its cached schemas when its listing fields are
+    unchanged. It is fetched again with *force*, or when *max_age* is set
+    and those schemas are older than *max_age* days; the cached copy stays
+    in place in case that fetch fails. Entries written before sync
+    recorded ``synced_at`` are dated *now* if their stored schema hash
+    still matches their tools.
+    """
+    old_connectors = old_registry.get("connectors", {})
+    to_fetch = []
+    for name, cdata in registry.get("connectors", {}).items():
+        if cdata.get("tools") or not cdata.get("id"):
+            continue
+        cached = old_connectors.get(name)
+        if cached and all(cached.get(k) == cdata.get(k) for k in _LISTING_KEYS):
+            for key in ("tools", "tool_count", "schema_hash", "synced_at"):
+                if key in cached:
+                    cdata[key] = cached[key]
+            if (
+                "synced_at" not in cdata
+                and cdata.get("schema_hash")
+                and cdata["schema_hash"] == _schema_hash(name, cdata)
+            ):
+                cdata["synced_at"] = now.isoformat()
+            fetched_before = bool(cdata.get("tools")) or "synced_at" in cdata
+            if not force and fetched_before and _tools_are_fresh(cdata, max_age, now):
+                continue
+        to_fetch.append(name)
+    return to_fetch
+
+
+def _schema_hash(name: str, cdata: dict) -> Optional[str]:
+    """``compute_schema_hash`` of one connector, when the generator is available."""
+    if compute_schema_hash is None:
+        return None
+    return compute_schema_hash({"connectors": {name: cdata}}, name)
+
+
+class _SyncCheckpoint:
+    """Connectors fetched by a sync that has not finished.
+
+    One JSON line per connector, appended (open, write, close) as each
+    fetch completes, so an interrupted sync loses at most the fetches in
+    flight.
+    A line torn by a crash is skipped on load. The file is removed once
+    the sync has saved the registry.
+    """
+
+    def __init__(self, fastn_dir: Path) -> None:
+        self.path = fastn_dir / SYNC_CHECKPOINT_FILE
+        self._lock = threading.Lock()
+        self._started = False
+
+    def load(self) -> Dict[str, dict]:
+        entries: Dict[str, dict] = {}
+        try:
+            with open(self.path) as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue
+                    if isinstance(entry, dict) and "name" in entry:
+                        entries[entry["name"]] = entry
+        except OSError:
+            pass
+        return entries
+
+    def resume(
+        self, registry: Dict, to_fetch: List[str], max_age: Optional[float], now: datetime,
+    ) -> List[str]:
+        """Apply checkpointed fetches to *registry*; return what is left to fetch.
+
+        Entries apply to every connector with the same id, including ones
+        this run would not fetch, since they are newer than registry.json.
+        """
+        connectors = registry.get("connectors", {})
+        resumed = set()
+        for name, entry in self.load().items():
+            cdata = connectors.get(name)
+            if (
+                cdata is None
+                or entry.get("id") != cdata.get("id")
+                or not isinstance(entry.get("tools"), dict)
+                or not _tools_are_fresh(entry, max_age, now)
+            ):
+                continue
+            cdata["tools"] = entry["tools"]
+            cdata["tool_count"] = len(entry["tools"])
+            cdata["synced_at"] = entry["synced_at"]
+            if entry.get("schema_hash"):
+                cdata["schema_hash"] = entry["schema_hash"]
+            resumed.add(name)
+        return [name for name in to_fetch if name not in resumed]
+
+    def record(self, name: str, cdata: dict) -> None:
+        line = json.dumps({
+            "name": name,
+            "id": cdata.get("id"),
+            "synced_at": cdata.get("synced_at"),
+            "schema_hash": cdata.get("schema_hash"),
+            "tools": cdata.get("tools", {}),
+        })
+        with self._lock, open(self.path, "a") as f:
+            # Start on a fresh line after a record torn by a crash.
+            if not self._started and f.tell() and not self._ends_with_newline():
+                line = "\n" + line
+            self._started = True
+            f.write(line + "\n")
+
+    def _ends_with_newline(self) -> bool:
+        with open(self.path, "rb") as f:
+            f.seek(-1, 2)
+            return f.read(1) == b"\n"
+
+    def clear(self) -> None:
+        with self._lock, contextlib.suppress(FileNotFoundError):
+            self.path.unlink()
+
+
 def _check_and_migrate(
     fastn_dir: Path,
     old_registry: Dict,
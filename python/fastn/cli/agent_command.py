@@ -880,39 +880,49 @@ def _execute_tool_call(
 # OpenAI tool conversion
 # ---------------------------------------------------------------------------
 
-def _convert_tools_for_openai(tool_list: list) -> list:
+def _convert_tools_for_openai(
+    tool_list: list,
+    compact: Optional[str] = None,
+    max_tokens: Optional[int] = None,
+) -> list:
     """Convert getTools API response to OpenAI function-calling format.
 
     Schemas are unwrapped so the LLM sees flat params (e.g. ``channel``,
     ``text``) instead of nested wrappers (``body.channel``, ``body.text``).
     The execution side re-wraps via ``_build_params_from_schema``.
+    *compact* and *max_tokens* shrink the schemas as in ``get_tools_for``.
     """
-    from fastn._formatters import _unwrap_input_schema
+    return _compact_tools_for_openai(tool_list, compact, max_tokens)[0]
 
-    result = []
+
+def _compact_tools_for_openai(
+    tool_list: list,
+    compact: Optional[str] = None,
+    max_tokens: Optional[int] = None,
+) -> tuple:
+    """Like ``_convert_tools_for_openai``, returning ``(tools, stats)``.
+
+    *stats* is a ``CompactionStats`` with the estimated tokens of the
+    schemas before and after compaction.
+    """
+    from fastn._formatters import _compact_tools
+
+    actions = []
     for tool in tool_list:
         fn = tool.get("function", {})
         if fn:
-            params = fn.get("parameters", {})
-            result.append({
-                "type": "function",
-                "function": {
-                    "name": fn.get("name", ""),
-                    "description": fn.get("description", ""),
-                    "parameters": _unwrap_input_schema(params),
-                },
+            actions.append({
+                "name": fn.get("name", ""),
+                "description": fn.get("description", ""),
+                "inputSchema": fn.get("parameters", {}),
             })
         else:
-            params = tool.get("inputSchema", tool.get("parameters", {}))
-            result.append({
-                "type": "function",
-                "function": {
-                    "name": tool.get("name", tool.get("toolId", "") or tool.get("actionId", "")),
-                    "description": tool.get("description", ""),
-                    "parameters": _unwrap_input_schema(params),
-                },
+            actions.append({
+                "name": tool.get("name", tool.get("toolId", "") or tool.get("actionId", "")),
+                "description": tool.get("description", ""),
+                "inputSchema": tool.get("inputSchema", tool.get("parameters", {})),
             })
-    return result
+    return _compact_tools(actions, "openai", compact, max_tokens)
 
 
 # ---------------------------------------------------------------------------
@@ -1316,6 +1326,10 @@ def _diagnose_agent_failure(
               help="Stop the agent after this many consecutive tool errors")
 @click.option("--max-tools", default=5, type=int, show_default=True,
               help="Maximum number of tools to pass to the LLM")
+@click.option("--compact", type=click.Choice(["light", "standard", "aggressive"]), default=None,
+              help="Shrink tool schemas sent to the LLM (descriptions, optional fields, repeats)")
+@click.option("--max-tool-tokens", default=None, type=click.IntRange(min=1),
+              help="Estimated token budget for tool schemas; compacts or drops tools to fit")
 @click.option("--model", "model_override", default=None,
               help="Override LLM model (e.g. gpt-4o-mini, gpt-4o)")
 @click.option("--setup", "force_setup", is_flag=True, default=False,
@@ -1325,7 +1339,8 @@ def _diagnose_agent_failure(
 def agent(ctx: click.Context, prompt: tuple, connector: Optional[str],
           tool_filter: Optional[str], connection_id: Optional[str],
           max_turns: int, skip_confirm: bool, run_eval: bool,
-          max_errors: int, max_tools: int, model_override: Optional[str],
+          max_errors: int, max_tools: int, compact: Optional[str],
+          max_tool_tokens: Optional[int], model_override: Optional[str],
           force_setup: bool,
           tenant: Optional[str]) -> None:
     """Give a goal in plain English \u2014 the agent thinks, picks the right skills and tools, and executes.
@@ -1345,6 +1360,8 @@ def agent(ctx: click.Context, prompt: tuple, connector: Optional[str],
     Use --connector to scope discovery to a specific connector.
     Each tool call requires confirmation by default. Pass -y to skip.
     Pass --eval to evaluate whether the agent did the right thing.
+    Pass --compact or --max-tool-tokens to shrink the tool schemas sent
+    to the LLM on every turn.
 
     \b
     First-time setup will prompt you to choose an LLM provider and enter an
@@ -1460,7 +1477,13 @@ def agent(ctx: click.Context, prompt: tuple, connector: Optional[str],
         )
 
     try:
-        llm_tools = _convert_tools_for_openai(tool_list)
+        llm_tools, compaction = _compact_tools_for_openai(tool_list, compact, max_tool_tokens)
+        if compact or max_tool_tokens:
+            dropped = f", {compaction.tools_dropped} dropped" if compaction.tools_dropped else ""
+            click.echo(
+                f"  \u2713 Tool schemas: ~{_format_tokens(compaction.tokens_after)} tokens "
+                f"(saved ~{_format_tokens(compaction.tokens_saved)}{dropped})"
+            )
         result = _agent_loop_openai(
             api_key, model, prompt_str, llm_tools,
             action_map, headers, workspace_id, connection_id,
@@ -10,7 +10,8 @@ import click
 from fastn.cli import cli, OrderedGroup, GRAPHQL_URL
 from fastn.cli._helpers import _ensure_fresh_token, _handle_401, _verbose_post
 from fastn.config import load_config
-from fastn._constants import DEPLOY_FLOW_MUTATION, FLOW_BUILDER_SPACE_ID, FLOW_BUILDER_URL, FLOW_RUN_API_URL, FLOWS_API_URL, LIST_FLOWS_QUERY, GET_FLOW_QUERY
+from fastn._constants import FLOW_BUILDER_SPACE_ID, FLOW_BUILDER_URL, FLOW_RUN_API_URL, FLOWS_API_URL
+from fastn._queries import DEPLOY_FLOW_MUTATION, GET_FLOW_QUERY, LIST_FLOWS_QUERY
 from fastn._flows import _extract_flow_input_fields as _extract_input_fields, _extract_output_fields
 
 
@@ -9,7 +9,7 @@ import click
 from fastn.cli import cli, OrderedGroup, GRAPHQL_URL
 from fastn.cli._helpers import _ensure_fresh_token, _handle_401, _verbose_post
 from fastn.config import load_config
-from fastn._constants import (
+from fastn._queries import (
     GET_CONNECTOR_QUERY,
     GET_KIT_CONNECTORS_QUERY,
     GET_KIT_METADATA_QUERY,
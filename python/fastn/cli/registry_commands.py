@@ -23,13 +23,16 @@ from fastn.cli._helpers import (
     _workspace_url,
 )
 from fastn.cli._registry import (
+    _SyncCheckpoint,
     _detect_languages,
     _extract_org_id,
     _fetch_tool_actions,
     _fetch_tools_by_scope,
     _fetch_registry_list,
     _parse_tool_node,
+    _plan_tool_sync,
     _regenerate_stubs,
+    _schema_hash,
 )
 from fastn.config import (
     add_connector_to_manifest,
@@ -119,8 +122,15 @@ def _save_snapshot_and_generate_package_stubs(registry: dict) -> None:
 
 @connector.command()
 @click.option("--force", is_flag=True, help="Re-fetch all tool schemas even if cached")
-def sync(force: bool = False) -> None:
-    """Sync all connectors, fetch tool schemas, and generate type stubs."""
+@click.option("--max-age", default=None, type=click.FloatRange(min=0),
+              help="Also re-fetch cached tool schemas older than this many days")
+def sync(force: bool = False, max_age: Optional[float] = None) -> None:
+    """Sync all connectors, fetch tool schemas, and generate type stubs.
+
+    Only connectors that are new or whose listing changed are fetched,
+    plus those whose cached schemas are older than --max-age if given. An interrupted sync
+    resumes from .fastn/sync_checkpoint.jsonl on the next run.
+    """
     config = load_config()
     if not config.auth_token and not config.api_key:
         raise click.ClickException("Not authenticated. Run `fastn login` first.")
@@ -137,45 +147,39 @@ def sync(force: bool = False) -> None:
 
     registry = _fetch_registry_list(config)
 
-    # Preserve cached tool schemas from the previous sync so we only
-    # re-fetch connectors that are genuinely new or never had tools.
-    if not force:
-        old_connectors = old_registry.get("connectors", {})
-        for name, cdata in registry.get("connectors", {}).items():
-            if not cdata.get("tools") and name in old_connectors:
-                cached = old_connectors[name]
-                if cached.get("tools"):
-                    cdata["tools"] = cached["tools"]
-                    cdata["tool_count"] = cached.get("tool_count", len(cached["tools"]))
+    # Reuse cached tool schemas; pick up where an interrupted sync stopped.
+    now = datetime.now(timezone.utc)
+    to_fetch = _plan_tool_sync(old_registry, registry, force, max_age, now)
+    checkpoint = _SyncCheckpoint(fastn_dir)
+    planned = len(to_fetch)
+    to_fetch = checkpoint.resume(registry, to_fetch, max_age, now)
+    if len(to_fetch) < planned:
+        click.echo(f"  Resuming interrupted sync: {planned - len(to_fetch)} connectors already fetched.")
 
     save_registry(registry, fastn_dir)
 
     # Update manifest
     manifest = load_manifest(fastn_dir)
     manifest["registry_version"] = registry.get("version", "unknown")
-    manifest["last_synced"] = datetime.now(timezone.utc).isoformat()
+    manifest["last_synced"] = now.isoformat()
     save_manifest(manifest, fastn_dir)
 
     connector_count = len(registry.get("connectors", {}))
     click.echo(f"\u2713 Registry synced: {connector_count} connectors available.")
 
-    # Fetch tool schemas only for connectors without cached tools
     reg_connectors = registry.get("connectors", {})
-    to_fetch = [
-        (name, cdata)
-        for name, cdata in reg_connectors.items()
-        if not cdata.get("tools") and cdata.get("id")
-    ]
+    old_connectors = old_registry.get("connectors", {})
     skipped = len(reg_connectors) - len(to_fetch)
 
     if to_fetch:
         from concurrent.futures import ThreadPoolExecutor, as_completed
 
         click.echo(f"Fetching tool schemas for {len(to_fetch)} connectors...")
-        fetched = 0
-        failed = 0
+        counts = {"new": 0, "changed": 0, "unchanged": 0, "failed": 0}
 
-        def _fetch_one(name: str, cdata: dict) -> bool:
+        def _fetch_one(name: str) -> str:
+            """Fetch *name*'s tools and say how they compare with the cached ones."""
+            cdata = reg_connectors[name]
             source = cdata.get("source", SOURCE_COMMUNITY)
             try:
                 tool_nodes = _fetch_tool_actions(config, cdata["id"], source)
@@ -183,30 +187,38 @@ def sync(force: bool = False) -> None:
                 for node in tool_nodes:
                     parsed = _parse_tool_node(node)
                     tools[parsed["key"]] = parsed["data"]
-                cdata["tools"] = tools
-                cdata["tool_count"] = len(tools)
-                return True
             except Exception:
-                return False
+                return "failed"
+            previous_hash = cdata.get("schema_hash")
+            previous = cdata.get("tools")
+            cdata["tools"] = tools
+            cdata["tool_count"] = len(tools)
+            cdata["synced_at"] = datetime.now(timezone.utc).isoformat()
+            schema_hash = _schema_hash(name, cdata)
+            if schema_hash is not None:
+                cdata["schema_hash"] = schema_hash
+            checkpoint.record(name, cdata)
+            if not previous and "synced_at" not in old_connectors.get(name, {}):
+                return "new"
+            if previous_hash is not None and schema_hash is not None:
+                return "changed" if previous_hash != schema_hash else "unchanged"
+            return "changed" if previous != tools else "unchanged"
 
         with ThreadPoolExecutor(max_workers=10) as pool:
-            futures = {
-                pool.submit(_fetch_one, name, cdata): name
-                for name, cdata in to_fetch
-            }
-            for future in as_completed(futures):
-                if future.result():
-                    fetched += 1
-                else:
-                    failed += 1
-                done = fetched + failed
+            futures = [pool.submit(_fetch_one, name) for name in to_fetch]
+            for done, future in enumerate(as_completed(futures), 1):
+                counts[future.result()] += 1
                 if done % 50 == 0:
                     click.echo(f"  ... {done}/{len(to_fetch)} connectors")
 
         save_registry(registry, fastn_dir)
-        click.echo(f"\u2713 Fetched tool schemas: {fetched} new, {skipped} cached, {failed} failed.")
+        click.echo(
+            f"\u2713 Fetched tool schemas: {counts['new']} new, {counts['changed']} changed, "
+            f"{counts['unchanged']} unchanged, {skipped} cached, {counts['failed']} failed."
+        )
     else:
         click.echo(f"\u2713 Tool schemas up to date ({skipped} cached).")
+    checkpoint.clear()
 
     # Save snapshot and generate package stubs
     _save_snapshot_and_generate_package_stubs(registry)
@@ -7,7 +7,7 @@ import click
 from fastn.cli import cli, GRAPHQL_URL
 from fastn.cli._helpers import _ensure_fresh_token, _handle_401, _verbose_post
 from fastn.config import load_config
-from fastn._constants import LIST_SKILLS_QUERY
+from fastn._queries import LIST_SKILLS_QUERY
 
 
 @cli.command()
@@ -21,36 +21,108 @@ AI-powered mode — natural language tool discovery:
 
 Constructor parameters:
     api_key, project_id, auth_token, tenant_id, stage,
-    config_path, timeout, max_retries, verbose
+    config_path, timeout, max_retries, retry_policy, verbose, instrumentation,
+    share_token (refresh a ``fastn login`` session once across processes
+    that share its config.json), persisted_queries (send GraphQL documents
+    by sha256 hash, falling back to the full text when the server asks),
+    graphql_batch_window (merge GraphQL queries issued within this many
+    seconds of each other into one request; see ``batch()``),
+    response_cache_ttl / response_cache_size (cache read-only control-plane
+    calls for this many seconds, in an LRU of this many entries; see
+    ``cache_stats()``), discovery_cache_ttl / discovery_cache_size (reuse
+    ``get_tools_for()`` / ``run()`` discovery results for identical prompts;
+    see ``discovery_cache_stats()``)
+
+Connection pool parameters (all optional — httpx defaults otherwise):
+    connect_timeout, read_timeout, write_timeout, pool_timeout
+        Split timeouts in seconds; each falls back to ``timeout``.
+    max_connections, max_keepalive_connections, keepalive_expiry
+        Pool limits. Raise these when running many concurrent calls.
+    http2
+        Multiplex requests over HTTP/2 (``pip install 'fastn-ai[http2]'``).
+    transport
+        An ``httpx.HTTPTransport`` (sync) or ``httpx.AsyncHTTPTransport``
+        (async) to share one pool across several clients. Pool options and
+        ``http2`` are then configured on the transport itself.
 """
 
 from __future__ import annotations
 
-import logging
+import asyncio
+import importlib
+import threading
+import time
+import weakref
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from types import MappingProxyType
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import httpx
 
-from fastn.auth import build_headers
-from fastn.config import FastnConfig, load_config, load_migrations, load_registry
+from fastn.config import (
+    CONFIG_FILE,
+    FastnConfig,
+    find_fastn_dir,
+    load_config,
+)
 from fastn.connector import AsyncDynamicConnector, DynamicConnector
 from fastn.exceptions import ConnectorNotFoundError, FastnError
+from fastn.instrumentation import Instrumentation, _resolve_instrumentation
+from fastn.retry import RetryPolicy, _RetryBudget
 
 # Internal modules — split from this file for maintainability
 from fastn._constants import (
     API_BASE_URL,
+    BOUND_PROXY_CACHE_SIZE,
     MAX_RETRIES,
+    DISCOVERY_CACHE_SIZE,
+    DISCOVERY_CACHE_STALE_TTL,
+    RESPONSE_CACHE_SIZE,
+    _COMPACTION_LEVELS,
+    _DISCOVERY_MODES,
     _SUPPORTED_FORMATS,
 )
-from fastn._formatters import _FORMAT_CONVERTERS
-from fastn._http import _post_with_retry_async, _post_with_retry_sync
-from fastn._catalog import _ConnectorCatalog, _ConnectorCatalogAsync
-from fastn._flows import _FlowsSync, _FlowsAsync
-from fastn._auth_ns import _AuthSync, _AuthAsync
-from fastn._projects import _ProjectsSync, _ProjectsAsync
-from fastn._skills import _SkillsSync, _SkillsAsync
-from fastn._kit import _KitSync, _KitAsync
+from fastn._formatters import (
+    _FORMAT_CONVERTERS,
+    CompactionStats,
+    _compact_tools,
+    _encode,
+    _tools_json,
+)
+from fastn._http import (
+    _http_client_options,
+    _post_with_retry_async,
+    _post_with_retry_sync,
+)
+from fastn._auth_context import _build_auth_context
+from fastn._registry_cache import _shared_migrations, _shared_registry
+from fastn._batch import (
+    DEFAULT_CONCURRENCY,
+    ExecuteResult,
+    _iter_execute_async,
+    _iter_execute_sync,
+)
+from fastn._cache import (
+    CacheStats,
+    _TTLCache,
+    _discovery_key,
+    _revalidating_async,
+    _revalidating_sync,
+)
+from fastn._token_store import _SharedTokenStore, _adoptable
+from fastn._params import _plan_for
 
 
 # ---------------------------------------------------------------------------
@@ -74,65 +146,15 @@ def _build_params_from_schema(
         Flat schema      ``{offset: {type: integer}, limit: {type: integer}}``
             → ``{"offset": ..., "limit": ...}``
         No schema        → ``{"body": {<all kwargs>}}`` (backward compat)
-    """
-    schema = tool_info.get("inputSchema", {})
-    props = schema.get("properties", {})
 
-    if not props:
+    Unknown kwargs go into the first object group. The schema is walked
+    once; later calls reuse its compiled routing plan (``fastn._params``).
+    """
+    schema = tool_info.get("inputSchema")
+    if not schema:
         # No schema — fall back to wrapping under "body"
         return {"body": kwargs} if kwargs else {}
-
-    # Build a map: inner field name → top-level group key
-    # For object properties, their inner fields get routed into that group.
-    # For primitive properties, they stay at the top level.
-    object_groups: Dict[str, Dict[str, Any]] = {}  # group_key → inner props
-    flat_fields: set = set()
-
-    for key, pdata in props.items():
-        if isinstance(pdata, dict) and pdata.get("type") == "object":
-            inner = pdata.get("properties", {})
-            object_groups[key] = inner
-        else:
-            flat_fields.add(key)
-
-    # If there are no object groups, everything is flat
-    if not object_groups:
-        return kwargs
-
-    # Route each kwarg into the correct group
-    result: Dict[str, Any] = {}
-    used: set = set()
-
-    for group_key, inner_props in object_groups.items():
-        group_params: Dict[str, Any] = {}
-        for field_name in inner_props:
-            if field_name in kwargs:
-                group_params[field_name] = kwargs[field_name]
-                used.add(field_name)
-        if group_params:
-            result[group_key] = group_params
-
-    # Flat fields go at the top level
-    for field_name in flat_fields:
-        if field_name in kwargs:
-            result[field_name] = kwargs[field_name]
-            used.add(field_name)
-
-    # Any remaining kwargs that weren't matched — add to the first group
-    # or at top level if no groups exist
-    remaining = {k: v for k, v in kwargs.items() if k not in used}
-    if remaining:
-        logging.getLogger("fastn").debug(
-            "Unknown kwargs %s not in schema — routed to fallback group",
-            list(remaining.keys()),
-        )
-        if object_groups:
-            first_group = next(iter(object_groups))
-            result.setdefault(first_group, {}).update(remaining)
-        else:
-            result.update(remaining)
-
-    return result
+    return _plan_for(schema).apply(kwargs)
 
 
 def _resolve_connector(
@@ -182,27 +204,90 @@ def _build_execute_payload(
     return payload
 
 
-def _all_tools_from_registry(registry: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
-    """Collect all tool name -> {toolId, inputSchema} mappings across all connectors."""
+def _build_tool_index(
+    registry: Dict[str, Any],
+) -> Tuple[Mapping[str, Dict[str, Any]], Dict[str, Tuple[str, ...]]]:
+    """Index every tool in the registry by name for ``connect()`` proxies.
+
+    Returns a read-only ``tool_name -> {toolId, inputSchema}`` mapping and
+    the names defined by more than one connector, each mapped to those
+    connectors in registry order. As before, the last connector wins.
+    """
     all_tools: Dict[str, Dict[str, Any]] = {}
-    for connector_data in registry.get("connectors", {}).values():
+    owners: Dict[str, Tuple[str, ...]] = {}
+    for connector_name, connector_data in registry.get("connectors", {}).items():
         for tool_name, tool_info in connector_data.get("tools", {}).items():
             all_tools[tool_name] = {
                 "toolId": tool_info.get("toolId", "") or tool_info.get("actionId", ""),
                 "inputSchema": tool_info.get("inputSchema", {}),
             }
-    return all_tools
+            owners[tool_name] = owners.get(tool_name, ()) + (connector_name,)
+    collisions = {name: names for name, names in owners.items() if len(names) > 1}
+    return MappingProxyType(all_tools), collisions
+
+
+class _LazyNamespace:
+    """Client attribute that imports and builds a namespace on first access.
+
+    ``fastn.flows``, ``fastn.kit`` etc. pull in their modules and GraphQL
+    documents only when used, so ``import fastn`` and client construction
+    stay cheap for code that only executes tools. The instance is cached
+    in the client's ``__dict__``, which takes precedence over this
+    (non-data) descriptor on later lookups.
+    """
+
+    def __init__(self, module: str, class_name: str) -> None:
+        self._module = module
+        self._class_name = class_name
+        self._attr = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._attr = name
+
+    def __get__(self, client: Any, owner: Optional[type] = None) -> Any:
+        if client is None:
+            return self
+        namespace_cls = getattr(importlib.import_module(self._module), self._class_name)
+        # setdefault: threads racing on first access all get one instance.
+        return client.__dict__.setdefault(self._attr, namespace_cls(client))
 
 
 # Names that are real attributes on the client and must not be resolved
 # as dynamic connector proxies in __getattr__.
 _RESERVED_CLIENT_ATTRS = frozenset({
     "connectors", "connect", "run", "close", "execute",
-    "get_tools", "get_tool", "get_tools_for",
+    "execute_many", "execute_as_completed", "reload_registry", "batch",
+    "cache_stats", "discovery_cache_stats", "compaction_stats", "clear_cache",
+    "get_tools", "get_tool", "get_tools_for", "get_tools_json",
     "flows", "auth", "projects", "skills", "kit",
 })
 
 
+def _check_tools_args(
+    format: str, mode: str, compact: Optional[str], max_tokens: Optional[int],
+) -> None:
+    """Validate get_tools_for() / get_tools_json() arguments."""
+    if format not in _SUPPORTED_FORMATS:
+        raise ValueError(
+            f"Unsupported format '{format}'. "
+            f"Choose from: {', '.join(_SUPPORTED_FORMATS)}"
+        )
+    if mode not in _DISCOVERY_MODES:
+        raise ValueError(
+            f"Unsupported mode '{mode}'. "
+            f"Choose from: {', '.join(_DISCOVERY_MODES)}"
+        )
+    if compact is not None and compact not in _COMPACTION_LEVELS:
+        raise ValueError(
+            f"Unsupported compact level '{compact}'. "
+            f"Choose from: {', '.join(_COMPACTION_LEVELS)}"
+        )
+    if max_tokens is not None and max_tokens < 1:
+        raise ValueError("max_tokens must be at least 1")
+    if format == "raw" and (compact is not None or max_tokens is not None):
+        raise ValueError("compact and max_tokens apply to LLM formats, not 'raw'")
+
+
 def _init_config(
     api_key: Optional[str],
     project_id: Optional[str],
@@ -223,6 +308,9 @@ def _init_config(
     if api_key and not auth_token:
         resolved_auth_token = ""
 
+    # The stored refresh token only belongs to the stored access token.
+    token_from_file = bool(resolved_auth_token) and resolved_auth_token == file_config.auth_token
+
     return FastnConfig(
         api_key=resolved_api_key,
         project_id=project_id or file_config.project_id,
@@ -230,6 +318,8 @@ def _init_config(
         stage=stage or file_config.stage,
         timeout=timeout or file_config.timeout,
         auth_token=resolved_auth_token,
+        refresh_token=file_config.refresh_token if token_from_file else "",
+        token_expiry=file_config.token_expiry if token_from_file else "",
     )
 
 
@@ -258,55 +348,334 @@ class _BaseFastnClient:
         stage: Optional[str] = None,
         max_retries: int = MAX_RETRIES,
         verbose: bool = False,
+        instrumentation: Optional[Instrumentation] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        share_token: bool = False,
+        persisted_queries: bool = False,
+        graphql_batch_window: Optional[float] = None,
+        response_cache_ttl: Optional[float] = None,
+        response_cache_size: int = RESPONSE_CACHE_SIZE,
+        discovery_cache_ttl: Optional[float] = None,
+        discovery_cache_size: int = DISCOVERY_CACHE_SIZE,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        write_timeout: Optional[float] = None,
+        pool_timeout: Optional[float] = None,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        keepalive_expiry: Optional[float] = None,
+        http2: bool = False,
+        transport: Any = None,
     ) -> None:
+        """Load config and set up retry, caching and connection-pool options.
+
+        ``FastnClient`` and ``AsyncFastnClient`` pass their arguments
+        straight through to here.
+
+        Args:
+            api_key: Fastn API key (or ``FASTN_API_KEY``).
+            project_id: Project ID (or ``FASTN_PROJECT_ID``).
+            timeout: HTTP timeout in seconds.
+            config_path: Path to config.json; the registry is read from the
+                same directory.
+            auth_token: JWT from ``fastn login`` (or ``FASTN_AUTH_TOKEN``).
+            agent_id: Agent ID sent with tool calls; defaults to the
+                workspace ID.
+            tenant_id: Tenant ID (or ``FASTN_TENANT_ID``).
+            stage: ``"LIVE"``, ``"STAGING"`` or ``"DEV"`` (or ``FASTN_STAGE``).
+            max_retries: Retry count for transient failures.
+            verbose: Print debug logging.
+            instrumentation: Request/response hooks.
+            retry_policy: Full retry control; overrides *max_retries*.
+            share_token: Share refreshed ``fastn login`` tokens with other
+                processes through config.json.
+            persisted_queries: Send GraphQL queries by hash when the server
+                supports it.
+            graphql_batch_window: Seconds GraphQL queries wait to be sent as
+                one batch; None batches only inside ``batch()``.
+            response_cache_ttl: Seconds to cache read-only control-plane
+                responses; None disables the cache.
+            response_cache_size: Max entries in the response cache.
+            discovery_cache_ttl: Seconds to cache tool discovery; None
+                disables the cache.
+            discovery_cache_size: Max entries in the discovery cache.
+            connect_timeout: Connect timeout; this and the next three
+                default to *timeout*.
+            read_timeout: Read timeout.
+            write_timeout: Write timeout.
+            pool_timeout: Max wait for a free pooled connection.
+            max_connections: Connection pool size.
+            max_keepalive_connections: Idle connections kept open.
+            keepalive_expiry: Idle connection lifetime in seconds.
+            http2: Use HTTP/2 (requires ``fastn-ai[http2]``).
+            transport: httpx transport shared with other clients; it is left
+                open when this client closes.
+        """
         self._config = _init_config(
             api_key, project_id,
             timeout, config_path, auth_token, tenant_id, stage,
         )
         self._config.validate()
-        self._headers = build_headers(self._config)
-        self._max_retries = max_retries
-        self._agent_id = agent_id or self._config.resolve_project_id()
+        # Token-derived state (claims, workspace ID, headers, refresh
+        # deadlines), replaced wholesale when the token changes.
+        self._auth = _build_auth_context(self._config)
+        # An explicit policy wins over max_retries.
+        self._retry_policy = retry_policy or RetryPolicy(max_retries=max_retries)
+        self._max_retries = self._retry_policy.max_retries
+        self._retry_budget = _RetryBudget(self._retry_policy)
+        self._agent_id = agent_id or self._auth.workspace_id
+        # Automatic persisted queries; switched off if the server says it
+        # doesn't support them (see fastn._graphql).
+        self._persisted_queries = persisted_queries
+        # GraphQL batching (see fastn._gql_batch): always on with a window,
+        # or while a batch() block is open.
+        self._graphql_batch_window = graphql_batch_window
+        self._batch_scopes: List[float] = []
+        self._gql_batcher: Any = None
+        # Opt-in LRU+TTL cache for read-only control-plane calls (see
+        # fastn._cache); mutating calls invalidate their namespace.
+        self._response_cache: Optional[_TTLCache] = None
+        if response_cache_ttl is not None:
+            self._response_cache = _TTLCache(response_cache_size, response_cache_ttl)
+        # Opt-in cache of /getTools results for get_tools_for() and run();
+        # stale entries are served while they are refreshed.
+        self._discovery_cache: Optional[_TTLCache] = None
+        if discovery_cache_ttl is not None:
+            self._discovery_cache = _TTLCache(
+                discovery_cache_size, discovery_cache_ttl, DISCOVERY_CACHE_STALE_TTL,
+            )
         self._verbose = verbose
+        self._instrumentation = _resolve_instrumentation(
+            instrumentation, verbose, self._log,
+        )
+        self._http_options = _http_client_options(
+            self._config.timeout,
+            connect_timeout=connect_timeout, read_timeout=read_timeout,
+            write_timeout=write_timeout, pool_timeout=pool_timeout,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            http2=http2, transport=transport,
+        )
+        # A caller-supplied transport may be shared with other clients,
+        # so close() must leave it open.
+        self._owns_transport = transport is None
 
         fastn_dir = None
         if config_path:
             fastn_dir = Path(config_path).parent
-        self._registry = load_registry(fastn_dir)
-        self._migrations = load_migrations(fastn_dir)
+        self._fastn_dir = fastn_dir
+        # registry.json / migrations.json are loaded on first use from the
+        # process-wide cache (see fastn._registry_cache).
+        self._registry_data: Optional[Dict[str, Any]] = None
+        self._migrations_data: Optional[Dict[str, Any]] = None
+        # Bumped by reload_registry(); every connector proxy handed out is
+        # tracked so a reload can rebind it and drop its memoized tools.
+        self._registry_generation = 0
+        self._proxies: "weakref.WeakSet[Any]" = weakref.WeakSet()
+        # Built on the first connect() after each registry load, then
+        # shared read-only by every bound proxy.
+        self._tool_index: Optional[Mapping[str, Dict[str, Any]]] = None
+        self._tool_collisions: Dict[str, Tuple[str, ...]] = {}
+        # Search index for get_tools_for(mode="local"), built on first use
+        # after each registry load (see fastn._discovery).
+        self._local_index: Any = None
+        self._bound_proxies: "OrderedDict[str, Any]" = OrderedDict()
+        self._bound_lock = threading.Lock()
+        # Totals for get_tools_for(compact=..., max_tokens=...).
+        self._compaction = CompactionStats()
+        self._compaction_lock = threading.Lock()
+
+        # Opt-in: coordinate refreshes of a `fastn login` session with
+        # other processes through the config file it was loaded from.
+        self._token_store: Optional[_SharedTokenStore] = None
+        if share_token and self._config.refresh_token:
+            self._token_store = _SharedTokenStore(
+                Path(config_path) if config_path else find_fastn_dir() / CONFIG_FILE
+            )
 
-    def _ensure_fresh_token(self) -> None:
-        """Refresh the access token if it is expired."""
-        if not self._config.refresh_token or not self._config.token_expiry:
-            return
-        from fastn.oauth import (
-            compute_token_expiry,
-            is_token_expired,
-            refresh_access_token,
+    @property
+    def _registry(self) -> Dict[str, Any]:
+        """The tool registry, loaded on first access. Shared — do not mutate."""
+        registry = self._registry_data
+        if registry is None:
+            registry = self._registry_data = _shared_registry(self._fastn_dir)
+        return registry
+
+    @property
+    def _migrations(self) -> Dict[str, Any]:
+        """The migrations map, loaded on first access. Shared — do not mutate."""
+        migrations = self._migrations_data
+        if migrations is None:
+            migrations = self._migrations_data = _shared_migrations(self._fastn_dir)
+        return migrations
+
+    @property
+    def _headers(self) -> Mapping[str, str]:
+        """Read-only request headers for the current token."""
+        return self._auth.headers
+
+    def _apply_token(self, access_token: str, refresh_token: str, token_expiry: str) -> None:
+        """Store an OAuth token and rebuild the auth context from it.
+
+        The new context is swapped in with a single assignment, so another
+        thread sees either the old token's headers and deadlines or the
+        new one's, never a mix.
+        """
+        self._config.auth_token = access_token
+        self._config.refresh_token = refresh_token
+        self._config.token_expiry = token_expiry
+        auth = _build_auth_context(self._config)
+        self._http.headers = auth.headers
+        self._auth = auth
+
+    def _apply_token_response(self, token_resp: Any) -> None:
+        """Store a freshly refreshed token, publishing it if the store is shared."""
+        from fastn.oauth import compute_token_expiry
+
+        self._apply_token(
+            token_resp.access_token, token_resp.refresh_token,
+            compute_token_expiry(token_resp.expires_in),
         )
+        if self._token_store is not None:
+            self._token_store.publish(
+                self._config.auth_token, self._config.refresh_token, self._config.token_expiry,
+            )
 
-        if is_token_expired(self._config.token_expiry):
-            token_resp = refresh_access_token(self._config.refresh_token)
-            self._config.auth_token = token_resp.access_token
-            self._config.refresh_token = token_resp.refresh_token
-            self._config.token_expiry = compute_token_expiry(token_resp.expires_in)
-            self._headers["Authorization"] = f"Bearer {self._config.auth_token}"
-            self._http.headers["Authorization"] = f"Bearer {self._config.auth_token}"
+    def _adopt_stored_token(self) -> bool:
+        """Take over a valid token another process published. Call with the store locked.
+
+        Also picks up a rotated refresh token, so a refresh that follows
+        uses the one Keycloak still accepts.
+        """
+        stored = self._token_store.read()
+        if _adoptable(stored, self._config.auth_token):
+            self._apply_token(stored["auth_token"], stored["refresh_token"], stored["token_expiry"])
+            return True
+        if stored.get("refresh_token"):
+            self._config.refresh_token = stored["refresh_token"]
+        return False
+
+    def _batch_window(self) -> Optional[float]:
+        """Seconds GraphQL queries wait to be batched, or None when not batching."""
+        scopes = self._batch_scopes
+        return scopes[-1] if scopes else self._graphql_batch_window
+
+    def cache_stats(self) -> CacheStats:
+        """Hit/miss counters of the control-plane response cache.
+
+        All zero when the client was created without ``response_cache_ttl``.
+        """
+        cache = self._response_cache
+        return cache.stats() if cache is not None else CacheStats()
+
+    def discovery_cache_stats(self) -> CacheStats:
+        """Hit/miss/latency-saved counters of the tool-discovery cache.
+
+        All zero when the client was created without ``discovery_cache_ttl``.
+        """
+        cache = self._discovery_cache
+        return cache.stats() if cache is not None else CacheStats()
+
+    def compaction_stats(self) -> CompactionStats:
+        """Estimated tokens saved by ``compact=`` / ``max_tokens=`` so far."""
+        return self._compaction
+
+    def _compacted(
+        self,
+        tool_list: List[Dict[str, Any]],
+        format: str,
+        compact: Optional[str],
+        max_tokens: Optional[int],
+    ) -> List[Dict[str, Any]]:
+        """Convert *tool_list* to *format*, compacted, and count the savings."""
+        tools, stats = _compact_tools(tool_list, format, compact, max_tokens)
+        with self._compaction_lock:
+            self._compaction = self._compaction + stats
+        return tools
+
+    def clear_cache(self) -> None:
+        """Drop every cached control-plane response and tool discovery."""
+        for cache in (self._response_cache, self._discovery_cache):
+            if cache is not None:
+                cache.clear()
 
     def _log(self, *args: Any) -> None:
         """Print debug info when verbose mode is enabled."""
         if self._verbose:
             print("[fastn]", *args)
 
+    def _get_tool_index(self) -> Mapping[str, Dict[str, Any]]:
+        """Return the tool index for the current registry, building it once."""
+        index = self._tool_index
+        if index is None:
+            index, self._tool_collisions = _build_tool_index(self._registry)
+            self._tool_index = index
+        return index
+
     def connect(self, connection_id: str) -> Any:
-        """Bind a connection_id and return a connector proxy."""
-        all_tools = _all_tools_from_registry(self._registry)
-        return self._connector_class(
+        """Bind a connection_id and return a connector proxy.
+
+        Proxies are views over one shared tool index and the most recent
+        ``BOUND_PROXY_CACHE_SIZE`` are reused, so calling ``connect()`` per
+        request costs a dict lookup rather than a registry scan. A tool
+        name defined by several connectors resolves to the last one and
+        warns when first used.
+        """
+        with self._bound_lock:
+            proxy = self._bound_proxies.get(connection_id)
+            if proxy is not None:
+                self._bound_proxies.move_to_end(connection_id)
+                return proxy
+        proxy = self._connector_class(
             connector_name="*",
-            tools=all_tools,
+            tools=self._get_tool_index(),
             execute_fn=self._execute_tool,
             connection_id=connection_id,
+            generation=self._registry_generation,
+            collisions=self._tool_collisions,
         )
+        self._proxies.add(proxy)
+        with self._bound_lock:
+            proxy = self._bound_proxies.setdefault(connection_id, proxy)
+            if len(self._bound_proxies) > BOUND_PROXY_CACHE_SIZE:
+                self._bound_proxies.popitem(last=False)
+        return proxy
+
+    def reload_registry(self) -> None:
+        """Re-read registry.json and migrations.json from disk.
+
+        Call this in a long-running process after ``fastn connector sync``.
+        Connector proxies already handed out (``fastn.slack``,
+        ``fastn.connect(...)``) are rebound to the new registry; a proxy
+        whose connector was removed raises ``ToolNotFoundError`` on use.
+        """
+        self._registry_data = _shared_registry(self._fastn_dir)
+        self._migrations_data = _shared_migrations(self._fastn_dir)
+        self._registry_generation += 1
+        self._tool_index = None
+        self._local_index = None
+        self._connectors = {
+            name: proxy for name, proxy in self._connectors.items()
+            if name in self._registry.get("connectors", {})
+        }
+        for proxy in list(self._proxies):
+            name = proxy._connector_name
+            if name == "*":
+                proxy._rebind(
+                    self._get_tool_index(), "", None, self._registry_generation,
+                    collisions=self._tool_collisions,
+                )
+                continue
+            try:
+                connector_id, tools = _resolve_connector(self._registry, name)
+            except ConnectorNotFoundError:
+                connector_id, tools = "", {}
+            proxy._rebind(
+                tools, connector_id,
+                self._migrations.get("connectors", {}).get(name, {}),
+                self._registry_generation,
+            )
 
     def __getattr__(self, name: str) -> Any:
         """Resolve a connector name to a dynamic connector proxy."""
@@ -327,8 +696,10 @@ class _BaseFastnClient:
             execute_fn=self._execute_tool,
             connector_id=connector_id,
             migrations=connector_migrations,
+            generation=self._registry_generation,
         )
         self._connectors[name] = proxy
+        self._proxies.add(proxy)
         return proxy
 
     def get_tools(self, connector_name: str) -> List[Dict[str, Any]]:
@@ -341,7 +712,6 @@ class _BaseFastnClient:
 
     def _get_tools_for_connector(
         self,
-        format: str,
         limit: int,
         connector: Union[str, List[str]],
     ) -> List[Dict[str, Any]]:
@@ -350,10 +720,30 @@ class _BaseFastnClient:
         raw_tools: List[Dict[str, Any]] = []
         for name in names:
             raw_tools.extend(self.connectors.get_tools(name))
-        raw_tools = raw_tools[:limit]
-        if format == "raw":
-            return raw_tools
-        return _FORMAT_CONVERTERS[format](raw_tools)
+        return raw_tools[:limit]
+
+    def _search_local(
+        self,
+        prompt: str,
+        limit: int,
+        connector: Union[str, List[str], None],
+        mode: str,
+    ) -> List[Dict[str, Any]]:
+        """Rank the registry's tools against *prompt* (get_tools_for local modes)."""
+        index = self._local_index
+        if index is None:
+            from fastn._discovery import _LocalIndex
+
+            index = self._local_index = _LocalIndex(self._registry)
+        names = None
+        if connector is not None:
+            names = [connector] if isinstance(connector, str) else connector
+            connectors = self._registry.get("connectors", {})
+            for name in names:
+                if name not in connectors:
+                    raise ConnectorNotFoundError(name)
+        scoring = "tfidf" if mode == "local-tfidf" else "bm25"
+        return index.search(prompt, limit, names, scoring)
 
     def __repr__(self) -> str:
         n = len(self._registry.get("connectors", {}))
@@ -382,41 +772,56 @@ class FastnClient(_BaseFastnClient):
 
         # AI-powered
         result = fastn.run("Send hello to #general on Slack")
+
+    Thread safety:
+        One instance may be shared by many threads (e.g. threaded gunicorn
+        workers). Calls share the connection pool; an expired OAuth token
+        is refreshed by exactly one thread while the others wait for it,
+        and request headers are swapped as an immutable snapshot.
     """
 
     _connector_class = DynamicConnector
 
-    def __init__(
-        self,
-        api_key: Optional[str] = None,
-        project_id: Optional[str] = None,
-        timeout: Optional[float] = None,
-        config_path: Optional[str] = None,
-        auth_token: Optional[str] = None,
-        agent_id: Optional[str] = None,
-        tenant_id: Optional[str] = None,
-        stage: Optional[str] = None,
-        max_retries: int = MAX_RETRIES,
-        verbose: bool = False,
-    ) -> None:
-        super().__init__(
-            api_key=api_key, project_id=project_id,
-            timeout=timeout, config_path=config_path,
-            auth_token=auth_token, agent_id=agent_id,
-            tenant_id=tenant_id, stage=stage,
-            max_retries=max_retries, verbose=verbose,
-        )
+    # Control-plane namespaces, imported and built on first access.
+    connectors = _LazyNamespace("fastn._catalog", "_ConnectorCatalog")
+    flows = _LazyNamespace("fastn._flows", "_FlowsSync")
+    auth = _LazyNamespace("fastn._auth_ns", "_AuthSync")
+    projects = _LazyNamespace("fastn._projects", "_ProjectsSync")
+    skills = _LazyNamespace("fastn._skills", "_SkillsSync")
+    kit = _LazyNamespace("fastn._kit", "_KitSync")
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Create a client; see ``_BaseFastnClient.__init__`` for the options."""
+        super().__init__(*args, **kwargs)
         self._connectors: Dict[str, DynamicConnector] = {}
-        self._http = httpx.Client(
-            timeout=self._config.timeout,
-            headers=self._headers,
-        )
-        self.connectors = _ConnectorCatalog(self._registry)
-        self.flows = _FlowsSync(self)
-        self.auth = _AuthSync(self)
-        self.projects = _ProjectsSync(self)
-        self.skills = _SkillsSync(self)
-        self.kit = _KitSync(self)
+        self._http = httpx.Client(headers=self._headers, **self._http_options)
+        self._refresh_lock = threading.Lock()
+
+    def _ensure_fresh_token(self) -> None:
+        """Refresh the access token if it is expired.
+
+        Safe to call from many threads: the first thread to find the token
+        expired refreshes it under ``_refresh_lock``; the others block on
+        the lock and then reuse the new token instead of refreshing again.
+        """
+        if time.monotonic() < self._auth.expires_at:
+            return
+        from fastn.oauth import refresh_access_token
+
+        with self._refresh_lock:
+            if time.monotonic() < self._auth.expires_at:
+                return
+            store = self._token_store
+            handle = store.acquire() if store is not None else None
+            try:
+                if store is not None and self._adopt_stored_token():
+                    return
+                self._apply_token_response(
+                    refresh_access_token(self._config.refresh_token, self._http)
+                )
+            finally:
+                if handle is not None:
+                    store.release(handle)
 
     def _execute_tool(
         self,
@@ -450,20 +855,91 @@ class FastnClient(_BaseFastnClient):
             tool_info=None, connection_id=connection_id, tenant_id=tenant_id,
         )
 
+    def execute_many(
+        self,
+        calls: Iterable[Any],
+        concurrency: int = DEFAULT_CONCURRENCY,
+        return_exceptions: bool = False,
+    ) -> List[ExecuteResult]:
+        """Execute many tools concurrently; results come back in input order.
+
+        Args:
+            calls: ``{"tool": ..., "params": ..., "connection_id": ...,
+                "tenant_id": ...}`` dicts or ``(tool, params)`` pairs.
+            concurrency: Maximum calls in flight (worker threads sharing
+                this client's connection pool). Keep it at or below
+                ``max_connections``.
+            return_exceptions: Record failures in ``ExecuteResult.error``
+                instead of raising the first one.
+
+        Returns:
+            One :class:`ExecuteResult` per call, with per-call ``elapsed``.
+        """
+        results = list(self.execute_as_completed(calls, concurrency, return_exceptions))
+        results.sort(key=lambda r: r.index)
+        return results
+
+    def execute_as_completed(
+        self,
+        calls: Iterable[Any],
+        concurrency: int = DEFAULT_CONCURRENCY,
+        return_exceptions: bool = False,
+    ) -> Iterator[ExecuteResult]:
+        """Like :meth:`execute_many`, but yield each result as soon as it finishes.
+
+        ``ExecuteResult.index`` maps a result back to its call. *calls* is
+        consumed lazily, so it may be a generator.
+        """
+        return _iter_execute_sync(self, calls, concurrency, return_exceptions)
+
+    def batch(self, window: Optional[float] = None) -> Any:
+        """Merge the GraphQL queries made inside the block into fewer requests.
+
+        Usage::
+
+            with fastn.batch() as batch:
+                kit = batch.submit(fastn.kit.get)
+                flows = batch.submit(fastn.flows.list)
+            print(kit.result(), flows.result())
+
+        Submitted calls run together on worker threads when the block
+        exits (or a returned future is waited on) and their queries go out
+        as one aliased GraphQL request. Queries from other threads using
+        this client while the block is open are merged too. Mutations are
+        never batched; errors are raised only by the call they belong to.
+
+        Args:
+            window: Seconds a queued query waits for others before being
+                sent (default 5 ms). Ends early once every submitted call
+                is waiting.
+        """
+        from fastn._constants import GRAPHQL_BATCH_WINDOW
+        from fastn._gql_batch import _GraphQLBatch
+
+        return _GraphQLBatch(self, GRAPHQL_BATCH_WINDOW if window is None else window)
+
+    def _discover(self, prompt: str, limit: int) -> List[Dict[str, Any]]:
+        """POST *prompt* to ``/getTools``, through the discovery cache if enabled."""
+        def fetch() -> List[Dict[str, Any]]:
+            data = _post_with_retry_sync(
+                self, f"{API_BASE_URL}/getTools",
+                {"input": {"prompt": prompt, "limit": limit}},
+                idempotent=True,
+            )
+            return data if isinstance(data, list) else data.get("tools", [])
+
+        cache = self._discovery_cache
+        if cache is None:
+            return fetch()
+        return _revalidating_sync(cache, _discovery_key(self, prompt, limit), fetch)
+
     def run(
         self,
         prompt: str,
         connection_id: Optional[str] = None,
     ) -> Dict[str, Any]:
         """AI-powered tool execution."""
-        discovery_payload: Dict[str, Any] = {
-            "input": {"limit": 1, "prompt": prompt}
-        }
-        tools = _post_with_retry_sync(
-            self, f"{API_BASE_URL}/getTools", discovery_payload
-        )
-
-        tool_list = tools if isinstance(tools, list) else tools.get("tools", [])
+        tool_list = self._discover(prompt, 1)
         if not tool_list:
             raise FastnError(f"No tools found matching prompt: '{prompt}'")
 
@@ -484,29 +960,72 @@ class FastnClient(_BaseFastnClient):
         format: str = "openai",
         limit: int = 5,
         connector: Union[str, List[str], None] = None,
+        mode: str = "remote",
+        compact: Optional[str] = None,
+        max_tokens: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
-        """Get tools formatted for a specific LLM provider's tool-use API."""
-        if format not in _SUPPORTED_FORMATS:
-            raise ValueError(
-                f"Unsupported format '{format}'. "
-                f"Choose from: {', '.join(_SUPPORTED_FORMATS)}"
-            )
-
-        if connector is not None:
-            return self._get_tools_for_connector(format, limit, connector)
-
-        discovery_payload = {"input": {"prompt": prompt, "limit": limit}}
-        data = _post_with_retry_sync(
-            self, f"{API_BASE_URL}/getTools", discovery_payload
-        )
-        tool_list = data if isinstance(data, list) else data.get("tools", [])
+        """Get tools formatted for a specific LLM provider's tool-use API.
+
+        ``mode="local"`` ranks the synced registry's tools with BM25 instead
+        of calling ``/getTools`` (``"local-tfidf"``: TF-IDF cosine, needs
+        NumPy); with *connector*, only those connectors' tools are ranked.
+        *compact* (``"light"``, ``"standard"`` or ``"aggressive"``) shrinks
+        the schemas; *max_tokens* keeps the best tools that fit that many
+        estimated tokens, compacting further before leaving one out.
+        """
+        _check_tools_args(format, mode, compact, max_tokens)
+        tool_list = self._select_tools(prompt, limit, connector, mode)
         if format == "raw":
             return tool_list
+        if compact is not None or max_tokens is not None:
+            return self._compacted(tool_list, format, compact, max_tokens)
         return _FORMAT_CONVERTERS[format](tool_list)
 
+    def get_tools_json(
+        self,
+        prompt: str,
+        *,
+        format: str = "openai",
+        limit: int = 5,
+        connector: Union[str, List[str], None] = None,
+        mode: str = "remote",
+        compact: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+    ) -> bytes:
+        """Like :meth:`get_tools_for`, as a compact UTF-8 JSON array.
+
+        Each tool's encoding is cached, so the bytes can be spliced into an
+        LLM request body without re-serializing the schemas every turn.
+        Compacted tools are encoded on every call.
+        """
+        _check_tools_args(format, mode, compact, max_tokens)
+        tool_list = self._select_tools(prompt, limit, connector, mode)
+        if compact is not None or max_tokens is not None:
+            return _encode(self._compacted(tool_list, format, compact, max_tokens))
+        return _tools_json(tool_list, format)
+
+    def _select_tools(
+        self,
+        prompt: str,
+        limit: int,
+        connector: Union[str, List[str], None],
+        mode: str,
+    ) -> List[Dict[str, Any]]:
+        """The raw tools get_tools_for() / get_tools_json() return."""
+        if mode != "remote":
+            return self._search_local(prompt, limit, connector, mode)
+        if connector is not None:
+            return self._get_tools_for_connector(limit, connector)
+        return self._discover(prompt, limit)
+
     def close(self) -> None:
-        """Close the underlying HTTP client."""
-        self._http.close()
+        """Close the underlying HTTP client.
+
+        A transport passed in via ``transport=`` is left open so it can
+        keep serving other clients; its owner is responsible for closing it.
+        """
+        if self._owns_transport:
+            self._http.close()
 
     def __enter__(self) -> FastnClient:
         return self
@@ -531,37 +1050,58 @@ class AsyncFastnClient(_BaseFastnClient):
 
     _connector_class = AsyncDynamicConnector
 
-    def __init__(
-        self,
-        api_key: Optional[str] = None,
-        project_id: Optional[str] = None,
-        timeout: Optional[float] = None,
-        config_path: Optional[str] = None,
-        auth_token: Optional[str] = None,
-        agent_id: Optional[str] = None,
-        tenant_id: Optional[str] = None,
-        stage: Optional[str] = None,
-        max_retries: int = MAX_RETRIES,
-        verbose: bool = False,
-    ) -> None:
-        super().__init__(
-            api_key=api_key, project_id=project_id,
-            timeout=timeout, config_path=config_path,
-            auth_token=auth_token, agent_id=agent_id,
-            tenant_id=tenant_id, stage=stage,
-            max_retries=max_retries, verbose=verbose,
-        )
+    # Control-plane namespaces, imported and built on first access.
+    connectors = _LazyNamespace("fastn._catalog", "_ConnectorCatalogAsync")
+    flows = _LazyNamespace("fastn._flows", "_FlowsAsync")
+    auth = _LazyNamespace("fastn._auth_ns", "_AuthAsync")
+    projects = _LazyNamespace("fastn._projects", "_ProjectsAsync")
+    skills = _LazyNamespace("fastn._skills", "_SkillsAsync")
+    kit = _LazyNamespace("fastn._kit", "_KitAsync")
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Create a client; see ``_BaseFastnClient.__init__`` for the options."""
+        super().__init__(*args, **kwargs)
         self._connectors: Dict[str, AsyncDynamicConnector] = {}
-        self._http = httpx.AsyncClient(
-            timeout=self._config.timeout,
-            headers=self._headers,
-        )
-        self.connectors = _ConnectorCatalogAsync(self, self._registry)
-        self.flows = _FlowsAsync(self)
-        self.auth = _AuthAsync(self)
-        self.projects = _ProjectsAsync(self)
-        self.skills = _SkillsAsync(self)
-        self.kit = _KitAsync(self)
+        self._http = httpx.AsyncClient(headers=self._headers, **self._http_options)
+        self._refresh_task: Optional[asyncio.Future] = None
+
+    async def _ensure_fresh_token_async(self) -> None:
+        """Make sure requests go out with a valid access token.
+
+        Within ``TOKEN_REFRESH_WINDOW`` of expiry a refresh starts in the
+        background and the current call proceeds with the still-valid
+        token. Only calls that find the token expired wait, and they all
+        await the same in-flight refresh rather than starting their own.
+        """
+        auth = self._auth
+        now = time.monotonic()
+        if now < auth.refresh_at:
+            return
+        task = self._refresh_task
+        if task is None or task.done():
+            task = self._refresh_task = asyncio.ensure_future(self._refresh_token())
+            # A failed background refresh is retried by the next call; this
+            # keeps asyncio from logging "exception was never retrieved".
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        if now >= auth.expires_at:
+            # shield: a cancelled caller must not cancel the shared refresh
+            await asyncio.shield(task)
+
+    async def _refresh_token(self) -> None:
+        """Refresh the access token over this client's connection pool."""
+        from fastn.oauth import refresh_access_token_async
+
+        store = self._token_store
+        handle = await store.acquire_async() if store is not None else None
+        try:
+            if store is not None and self._adopt_stored_token():
+                return
+            self._apply_token_response(
+                await refresh_access_token_async(self._config.refresh_token, self._http)
+            )
+        finally:
+            if handle is not None:
+                store.release(handle)
 
     async def _execute_tool(
         self,
@@ -595,20 +1135,77 @@ class AsyncFastnClient(_BaseFastnClient):
             tool_info=None, connection_id=connection_id, tenant_id=tenant_id,
         )
 
+    async def execute_many(
+        self,
+        calls: Iterable[Any],
+        concurrency: int = DEFAULT_CONCURRENCY,
+        return_exceptions: bool = False,
+    ) -> List[ExecuteResult]:
+        """Execute many tools concurrently (async). See :meth:`FastnClient.execute_many`.
+
+        At most *concurrency* executions run as tasks at once.
+        """
+        results = [
+            r async for r in self.execute_as_completed(calls, concurrency, return_exceptions)
+        ]
+        results.sort(key=lambda r: r.index)
+        return results
+
+    def execute_as_completed(
+        self,
+        calls: Iterable[Any],
+        concurrency: int = DEFAULT_CONCURRENCY,
+        return_exceptions: bool = False,
+    ) -> AsyncIterator[ExecuteResult]:
+        """Async iterator over results as they finish. Use with ``async for``."""
+        return _iter_execute_async(self, calls, concurrency, return_exceptions)
+
+    def batch(self, window: Optional[float] = None) -> Any:
+        """Merge the GraphQL queries made inside the block into fewer requests.
+
+        Usage::
+
+            async with fastn.batch():
+                kit, flows, skills = await asyncio.gather(
+                    fastn.kit.get(), fastn.flows.list(), fastn.skills.list(),
+                )
+
+        Queries queued in the same event-loop iteration (or within
+        *window* seconds) go out as one aliased GraphQL request; each
+        caller gets its own slice back. Mutations are never batched;
+        errors are raised only by the call they belong to. Works with
+        ``with`` as well as ``async with``.
+
+        Args:
+            window: Seconds to hold a batch open for more queries. The
+                default sends on the next loop iteration.
+        """
+        from fastn._gql_batch import _AsyncGraphQLBatch
+
+        return _AsyncGraphQLBatch(self, 0.0 if window is None else window)
+
+    async def _discover(self, prompt: str, limit: int) -> List[Dict[str, Any]]:
+        """POST *prompt* to ``/getTools``, through the discovery cache if enabled."""
+        async def fetch() -> List[Dict[str, Any]]:
+            data = await _post_with_retry_async(
+                self, f"{API_BASE_URL}/getTools",
+                {"input": {"prompt": prompt, "limit": limit}},
+                idempotent=True,
+            )
+            return data if isinstance(data, list) else data.get("tools", [])
+
+        cache = self._discovery_cache
+        if cache is None:
+            return await fetch()
+        return await _revalidating_async(cache, _discovery_key(self, prompt, limit), fetch)
+
     async def run(
         self,
         prompt: str,
         connection_id: Optional[str] = None,
     ) -> Dict[str, Any]:
         """AI-powered tool execution (async version)."""
-        discovery_payload: Dict[str, Any] = {
-            "input": {"limit": 1, "prompt": prompt}
-        }
-        tools = await _post_with_retry_async(
-            self, f"{API_BASE_URL}/getTools", discovery_payload
-        )
-
-        tool_list = tools if isinstance(tools, list) else tools.get("tools", [])
+        tool_list = await self._discover(prompt, 1)
         if not tool_list:
             raise FastnError(f"No tools found matching prompt: '{prompt}'")
 
@@ -629,29 +1226,74 @@ class AsyncFastnClient(_BaseFastnClient):
         format: str = "openai",
         limit: int = 5,
         connector: Union[str, List[str], None] = None,
+        mode: str = "remote",
+        compact: Optional[str] = None,
+        max_tokens: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
-        """Get tools formatted for a specific LLM provider's tool-use API."""
-        if format not in _SUPPORTED_FORMATS:
-            raise ValueError(
-                f"Unsupported format '{format}'. "
-                f"Choose from: {', '.join(_SUPPORTED_FORMATS)}"
-            )
-
-        if connector is not None:
-            return self._get_tools_for_connector(format, limit, connector)
-
-        discovery_payload = {"input": {"prompt": prompt, "limit": limit}}
-        data = await _post_with_retry_async(
-            self, f"{API_BASE_URL}/getTools", discovery_payload
-        )
-        tool_list = data if isinstance(data, list) else data.get("tools", [])
+        """Get tools formatted for a specific LLM provider's tool-use API.
+
+        ``mode="local"`` ranks the synced registry's tools with BM25 instead
+        of calling ``/getTools`` (``"local-tfidf"``: TF-IDF cosine, needs
+        NumPy); with *connector*, only those connectors' tools are ranked.
+        *compact* (``"light"``, ``"standard"`` or ``"aggressive"``) shrinks
+        the schemas; *max_tokens* keeps the best tools that fit that many
+        estimated tokens, compacting further before leaving one out.
+        """
+        _check_tools_args(format, mode, compact, max_tokens)
+        tool_list = await self._select_tools(prompt, limit, connector, mode)
         if format == "raw":
             return tool_list
+        if compact is not None or max_tokens is not None:
+            return self._compacted(tool_list, format, compact, max_tokens)
         return _FORMAT_CONVERTERS[format](tool_list)
 
+    async def get_tools_json(
+        self,
+        prompt: str,
+        *,
+        format: str = "openai",
+        limit: int = 5,
+        connector: Union[str, List[str], None] = None,
+        mode: str = "remote",
+        compact: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+    ) -> bytes:
+        """Like :meth:`get_tools_for`, as a compact UTF-8 JSON array.
+
+        Each tool's encoding is cached, so the bytes can be spliced into an
+        LLM request body without re-serializing the schemas every turn.
+        Compacted tools are encoded on every call.
+        """
+        _check_tools_args(format, mode, compact, max_tokens)
+        tool_list = await self._select_tools(prompt, limit, connector, mode)
+        if compact is not None or max_tokens is not None:
+            return _encode(self._compacted(tool_list, format, compact, max_tokens))
+        return _tools_json(tool_list, format)
+
+    async def _select_tools(
+        self,
+        prompt: str,
+        limit: int,
+        connector: Union[str, List[str], None],
+        mode: str,
+    ) -> List[Dict[str, Any]]:
+        """The raw tools get_tools_for() / get_tools_json() return."""
+        if mode != "remote":
+            return self._search_local(prompt, limit, connector, mode)
+        if connector is not None:
+            return self._get_tools_for_connector(limit, connector)
+        return await self._discover(prompt, limit)
+
     async def close(self) -> None:
-        """Close the underlying async HTTP client."""
-        await self._http.aclose()
+        """Close the underlying async HTTP client.
+
+        A transport passed in via ``transport=`` is left open (see
+        :meth:`FastnClient.close`).
+        """
+        if self._refresh_task is not None and not self._refresh_task.done():
+            self._refresh_task.cancel()
+        if self._owns_transport:
+            await self._http.aclose()
 
     async def __aenter__(self) -> AsyncFastnClient:
         return self
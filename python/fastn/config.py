@@ -25,7 +25,8 @@ Key classes:
 Key functions:
     load_config()   Load config from env vars + file (priority: env > file).
     save_config()   Write config to .fastn/config.json (chmod 0o600).
-    load_registry() Load the cached tool registry (.fastn/registry.json).
+    load_registry() Load the cached tool registry (.fastn/registry.json, or
+                    the memory-mapped registry.bin with ``lazy=True``).
     load_manifest() Load the manifest (.fastn/manifest.json).
 """
 
@@ -45,6 +46,7 @@ CONFIG_FILE = "config.json"
 MANIFEST_FILE = "manifest.json"
 REGISTRY_FILE = "registry.json"
 MIGRATIONS_FILE = "migrations.json"
+SYNC_CHECKPOINT_FILE = "sync_checkpoint.jsonl"
 
 # Environment variable names
 ENV_API_KEY = "FASTN_API_KEY"
@@ -370,20 +372,37 @@ def save_manifest(manifest: Dict[str, Any], fastn_dir: Optional[Path] = None) ->
     return _save_json(manifest, fastn_dir, MANIFEST_FILE)
 
 
-def load_registry(fastn_dir: Optional[Path] = None) -> Dict[str, Any]:
-    """Load registry.json from the .fastn directory."""
+def load_registry(
+    fastn_dir: Optional[Path] = None, lazy: bool = False,
+) -> Dict[str, Any]:
+    """Load registry.json from the .fastn directory.
+
+    With ``lazy=True``, return a read-only view of ``registry.bin`` whose
+    connectors are decoded on first access, falling back to registry.json
+    if the binary is missing or out of date.
+    """
     if fastn_dir is None:
         fastn_dir = find_fastn_dir()
+    if lazy:
+        from fastn._registry_bin import open_registry_bin
+
+        registry = open_registry_bin(fastn_dir)
+        if registry is not None:
+            return registry
     return _load_json(fastn_dir, REGISTRY_FILE, {"version": "", "connectors": {}})
 
 
 def save_registry(
     registry: Dict[str, Any], fastn_dir: Optional[Path] = None
 ) -> Path:
-    """Save registry.json to the .fastn directory."""
+    """Save registry.json (and its registry.bin companion) to the .fastn directory."""
+    from fastn._registry_bin import write_registry_bin
+
     if fastn_dir is None:
         fastn_dir = find_fastn_dir()
-    return _save_json(registry, fastn_dir, REGISTRY_FILE)
+    path = _save_json(registry, fastn_dir, REGISTRY_FILE)
+    write_registry_bin(registry, fastn_dir)
+    return path
 
 
 def get_installed_connectors(fastn_dir: Optional[Path] = None) -> List[str]:
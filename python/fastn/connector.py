@@ -16,6 +16,10 @@ How it works:
     4. ``connector.send_message(channel=..., text=...)`` triggers
        ``DynamicConnector.__getattr__("send_message")`` which returns a
        closure that calls ``_execute_tool()`` with the correct toolId
+    5. The closure is memoized in the proxy's ``__dict__``, so later
+       ``connector.send_message`` lookups are plain attribute hits.
+       ``client.reload_registry()`` rebinds the proxy to the new registry
+       generation and drops the memoized closures.
 
 connection_id / tenant_id support:
     # Per-call — extracted from kwargs before sending to API
@@ -39,7 +43,7 @@ Classes:
 from __future__ import annotations
 
 import warnings
-from typing import Any, Callable, Dict, Optional, Tuple, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from fastn.exceptions import ToolNotFoundError
 
@@ -134,6 +138,8 @@ class _BaseDynamicConnector:
         connector_id: str = "",
         connection_id: Optional[str] = None,
         migrations: Optional[Dict[str, Any]] = None,
+        generation: int = 0,
+        collisions: Optional[Dict[str, Tuple[str, ...]]] = None,
     ) -> None:
         self._connector_name = connector_name
         self._tools = tools
@@ -141,6 +147,36 @@ class _BaseDynamicConnector:
         self._connector_id = connector_id
         self._connection_id = connection_id
         self._migrations = migrations or {}
+        # Registry generation this proxy's tools came from, and the tool
+        # names whose callables are memoized in __dict__.
+        self._generation = generation
+        self._memoized: List[str] = []
+        # Tool names defined by more than one connector (connect() proxies).
+        self._collisions = collisions or {}
+
+    def _memoize(self, tool_name: str, method: Callable[..., Any]) -> Callable[..., Any]:
+        """Store *method* as an instance attribute so __getattr__ is skipped next time."""
+        self.__dict__[tool_name] = method
+        self._memoized.append(tool_name)
+        return method
+
+    def _rebind(
+        self,
+        tools: Dict[str, Dict[str, str]],
+        connector_id: str,
+        migrations: Optional[Dict[str, Any]],
+        generation: int,
+        collisions: Optional[Dict[str, Tuple[str, ...]]] = None,
+    ) -> None:
+        """Point the proxy at a reloaded registry and drop memoized callables."""
+        for tool_name in self._memoized:
+            self.__dict__.pop(tool_name, None)
+        self._memoized = []
+        self._tools = tools
+        self._connector_id = connector_id
+        self._migrations = migrations or {}
+        self._generation = generation
+        self._collisions = collisions or {}
 
     def _resolve_tool_call(self, tool_name: str) -> _ToolResolution:
         """Resolve a tool name to its execution metadata.
@@ -159,12 +195,23 @@ class _BaseDynamicConnector:
         if tool_name.startswith("_"):
             raise AttributeError(tool_name)
 
+        matched = tool_name
         tool_info = self._tools.get(tool_name)
 
         # Fallback: try matching without underscores (send_message -> sendmessage)
         if tool_info is None and "_" in tool_name:
-            collapsed = tool_name.replace("_", "")
-            tool_info = self._tools.get(collapsed)
+            matched = tool_name.replace("_", "")
+            tool_info = self._tools.get(matched)
+
+        if tool_info is not None and matched in self._collisions:
+            owners = self._collisions[matched]
+            warnings.warn(
+                f"Tool '{matched}' is defined by connectors {', '.join(owners)}; "
+                f"using {owners[-1]}'s. Call fastn.<connector>.{tool_name}(connection_id=...) "
+                f"to pick one.",
+                UserWarning,
+                stacklevel=3,
+            )
 
         # Check if this is a deprecated (removed) tool with a migration
         if tool_info is None:
@@ -223,7 +270,7 @@ class DynamicConnector(_BaseDynamicConnector):
     _class_label = "DynamicConnector"
 
     def __getattr__(self, tool_name: str) -> Callable[..., Any]:
-        """Resolve a tool name to a sync callable."""
+        """Resolve a tool name to a sync callable (first access only)."""
         (tool_id, tool_info, tool_migrations, connection_id,
          connector_id, connector_name, is_deprecated, dep_message) = \
             self._resolve_tool_call(tool_name)
@@ -239,7 +286,7 @@ class DynamicConnector(_BaseDynamicConnector):
                 )
             deprecated_tool_method.__name__ = tool_name
             deprecated_tool_method.__qualname__ = f"{connector_name}.{tool_name}"
-            return deprecated_tool_method
+            return self._memoize(tool_name, deprecated_tool_method)
 
         def tool_method(**kwargs: Any) -> Any:
             if tool_migrations:
@@ -252,7 +299,7 @@ class DynamicConnector(_BaseDynamicConnector):
             )
         tool_method.__name__ = tool_name
         tool_method.__qualname__ = f"{connector_name}.{tool_name}"
-        return tool_method
+        return self._memoize(tool_name, tool_method)
 
 
 class AsyncDynamicConnector(_BaseDynamicConnector):
@@ -261,7 +308,7 @@ class AsyncDynamicConnector(_BaseDynamicConnector):
     _class_label = "AsyncDynamicConnector"
 
     def __getattr__(self, tool_name: str) -> Callable[..., Any]:
-        """Resolve a tool name to an async callable."""
+        """Resolve a tool name to an async callable (first access only)."""
         (tool_id, tool_info, tool_migrations, connection_id,
          connector_id, connector_name, is_deprecated, dep_message) = \
             self._resolve_tool_call(tool_name)
@@ -277,7 +324,7 @@ class AsyncDynamicConnector(_BaseDynamicConnector):
                 )
             deprecated_tool_method.__name__ = tool_name
             deprecated_tool_method.__qualname__ = f"{connector_name}.{tool_name}"
-            return deprecated_tool_method
+            return self._memoize(tool_name, deprecated_tool_method)
 
         async def tool_method(**kwargs: Any) -> Any:
             if tool_migrations:
@@ -290,4 +337,4 @@ class AsyncDynamicConnector(_BaseDynamicConnector):
             )
         tool_method.__name__ = tool_name
         tool_method.__qualname__ = f"{connector_name}.{tool_name}"
-        return tool_method
+        return self._memoize(tool_name, tool_method)
@@ -0,0 +1,258 @@
+"""Request instrumentation hooks for the Fastn SDK.
+
+Every HTTP call made by ``FastnClient`` / ``AsyncFastnClient`` goes through
+the helpers in ``fastn._http``. Those helpers report each request and
+response to an optional :class:`Instrumentation` sink. When no sink is
+installed (the default) the hot path does a single ``is None`` check and
+nothing is serialized, decoded, or timed.
+
+Usage:
+    from fastn import FastnClient, Instrumentation
+
+    class Metrics(Instrumentation):
+        def on_response(self, method, url, response, elapsed):
+            statsd.timing("fastn.call", elapsed * 1000, tags=[url])
+
+        def on_retry(self, method, url, attempt, delay, reason):
+            statsd.increment("fastn.retry", tags=[url, reason])
+
+    fastn = FastnClient(instrumentation=Metrics())
+
+    # Standard-library logging — payloads are only serialized when the
+    # "fastn" logger is enabled for DEBUG.
+    fastn = FastnClient(instrumentation=LoggingInstrumentation())
+
+    # verbose=True installs a sink that prints requests and responses.
+    fastn = FastnClient(verbose=True)
+
+Hooks receive the raw objects (header mapping, payload, ``httpx.Response``)
+so any expensive formatting happens inside the sink, only when it needs it.
+Hooks must not raise; exceptions propagate to the caller.
+
+Classes:
+    Instrumentation          Base class. Override the hooks you need.
+    LoggingInstrumentation   Sink that writes to a ``logging.Logger``.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from typing import Any, Callable, List, Mapping, Optional
+
+from fastn._http import _redact_headers
+
+# Response bodies are truncated in log output to keep lines readable.
+_MAX_LOGGED_BODY = 2000
+
+
+class Instrumentation:
+    """Base class for request/response hooks.
+
+    All hooks are no-ops by default, so subclasses only override what they
+    need.
+    """
+
+    def on_request(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        payload: Any,
+    ) -> None:
+        """Called once before a request is sent (not repeated for retries)."""
+
+    def on_response(
+        self,
+        method: str,
+        url: str,
+        response: Any,
+        elapsed: float,
+    ) -> None:
+        """Called for every HTTP response received.
+
+        Args:
+            method: HTTP method.
+            url: Request URL.
+            response: The ``httpx.Response``. Reading ``response.text``
+                decodes the body, so only do it when needed.
+            elapsed: Wall-clock seconds spent on this attempt.
+        """
+
+    def on_retry(
+        self,
+        method: str,
+        url: str,
+        attempt: int,
+        delay: float,
+        reason: str,
+    ) -> None:
+        """Called before each retry sleep.
+
+        Args:
+            method: HTTP method.
+            url: Request URL.
+            attempt: Retry number, starting at 1.
+            delay: Seconds the client will sleep before retrying.
+            reason: What failed, e.g. ``"HTTP 503"`` or ``"ConnectError"``.
+        """
+
+
+class LoggingInstrumentation(Instrumentation):
+    """Write requests and responses to a standard-library logger.
+
+    Serialization is skipped entirely unless the logger is enabled for
+    *level*, so leaving this installed in production costs one
+    ``isEnabledFor`` check per hook.
+    """
+
+    def __init__(
+        self,
+        logger: Optional[logging.Logger] = None,
+        level: int = logging.DEBUG,
+    ) -> None:
+        self._logger = logger or logging.getLogger("fastn")
+        self._level = level
+
+    def on_request(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        payload: Any,
+    ) -> None:
+        if not self._logger.isEnabledFor(self._level):
+            return
+        self._logger.log(
+            self._level, "%s %s headers=%s payload=%s",
+            method, url,
+            json.dumps(_redact_headers(dict(headers))),
+            json.dumps(payload or {}, default=str),
+        )
+
+    def on_response(
+        self,
+        method: str,
+        url: str,
+        response: Any,
+        elapsed: float,
+    ) -> None:
+        if not self._logger.isEnabledFor(self._level):
+            return
+        self._logger.log(
+            self._level, "%s %s -> %s in %.1fms: %s",
+            method, url, response.status_code, elapsed * 1000,
+            response.text[:_MAX_LOGGED_BODY],
+        )
+
+    def on_retry(
+        self,
+        method: str,
+        url: str,
+        attempt: int,
+        delay: float,
+        reason: str,
+    ) -> None:
+        if not self._logger.isEnabledFor(self._level):
+            return
+        self._logger.log(
+            self._level, "%s %s retry %d in %.2fs after %s",
+            method, url, attempt, delay, reason,
+        )
+
+
+class _VerboseInstrumentation(Instrumentation):
+    """Sink installed by ``verbose=True`` — prints through ``client._log``."""
+
+    def __init__(self, log: Callable[..., None]) -> None:
+        self._log = log
+
+    def on_request(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        payload: Any,
+    ) -> None:
+        self._log(f"{method} {url}")
+        self._log(f"Headers: {json.dumps(_redact_headers(dict(headers)), indent=2)}")
+        self._log(f"Payload: {json.dumps(payload or {}, indent=2, default=str)}")
+
+    def on_response(
+        self,
+        method: str,
+        url: str,
+        response: Any,
+        elapsed: float,
+    ) -> None:
+        self._log(f"Response {response.status_code}: {response.text[:_MAX_LOGGED_BODY]}")
+
+    def on_retry(
+        self,
+        method: str,
+        url: str,
+        attempt: int,
+        delay: float,
+        reason: str,
+    ) -> None:
+        self._log(f"Retry {attempt} in {delay:.2f}s after {reason}")
+
+
+class _CompositeInstrumentation(Instrumentation):
+    """Fan a hook call out to several sinks, in order."""
+
+    def __init__(self, sinks: List[Instrumentation]) -> None:
+        self._sinks = sinks
+
+    def on_request(
+        self,
+        method: str,
+        url: str,
+        headers: Mapping[str, str],
+        payload: Any,
+    ) -> None:
+        for sink in self._sinks:
+            sink.on_request(method, url, headers, payload)
+
+    def on_response(
+        self,
+        method: str,
+        url: str,
+        response: Any,
+        elapsed: float,
+    ) -> None:
+        for sink in self._sinks:
+            sink.on_response(method, url, response, elapsed)
+
+    def on_retry(
+        self,
+        method: str,
+        url: str,
+        attempt: int,
+        delay: float,
+        reason: str,
+    ) -> None:
+        for sink in self._sinks:
+            sink.on_retry(method, url, attempt, delay, reason)
+
+
+def _resolve_instrumentation(
+    instrumentation: Optional[Instrumentation],
+    verbose: bool,
+    log: Callable[..., None],
+) -> Optional[Instrumentation]:
+    """Combine the user's sink with the verbose printer.
+
+    Returns None when nothing is enabled, which is what keeps the request
+    helpers free of logging overhead.
+    """
+    sinks: List[Instrumentation] = []
+    if verbose:
+        sinks.append(_VerboseInstrumentation(log))
+    if instrumentation is not None:
+        sinks.append(instrumentation)
+    if not sinks:
+        return None
+    if len(sinks) == 1:
+        return sinks[0]
+    return _CompositeInstrumentation(sinks)
@@ -42,6 +42,9 @@ USERINFO_URL = (
 GRANT_TYPE_DEVICE = "urn:ietf:params:oauth:grant-type:device_code"
 GRANT_TYPE_REFRESH = "refresh_token"
 
+# Tokens this close to expiry are treated as expired.
+TOKEN_EXPIRY_BUFFER = 30.0
+
 
 @dataclass
 class DeviceCodeResponse:
@@ -242,6 +245,46 @@ def poll_for_token(
             client.close()
 
 
+def _refresh_request(refresh_token: str) -> httpx.Request:
+    """Build the token-endpoint request for a refresh grant.
+
+    The request is sent with ``client.send()`` so none of the caller's
+    default headers (API key, stale bearer token) leak to Keycloak when an
+    SDK client's connection pool is reused.
+    """
+    return httpx.Request(
+        "POST",
+        TOKEN_URL,
+        data={
+            "grant_type": GRANT_TYPE_REFRESH,
+            "client_id": CLIENT_ID,
+            "refresh_token": refresh_token,
+        },
+        extensions={"timeout": httpx.Timeout(30.0).as_dict()},
+    )
+
+
+def _parse_refresh_response(response: Any, refresh_token: str) -> TokenResponse:
+    """Turn a token-endpoint response into a TokenResponse.
+
+    Raises:
+        OAuthError: If the refresh was rejected.
+    """
+    if response.status_code != 200:
+        raise OAuthError(
+            "Session expired. Run `fastn login` to re-authenticate.",
+            error_code="invalid_grant",
+        )
+
+    data = response.json()
+    return TokenResponse(
+        access_token=data["access_token"],
+        refresh_token=data.get("refresh_token", refresh_token),
+        expires_in=data.get("expires_in", 3600),
+        token_type=data.get("token_type", "Bearer"),
+    )
+
+
 def refresh_access_token(
     refresh_token: str,
     client: Optional[httpx.Client] = None,
@@ -250,7 +293,7 @@ def refresh_access_token(
 
     Args:
         refresh_token: The refresh token from a previous login.
-        client: Optional httpx.Client.
+        client: Optional httpx.Client. Its default headers are not sent.
 
     Returns:
         TokenResponse with new access_token and refresh_token.
@@ -263,31 +306,32 @@ def refresh_access_token(
         client = httpx.Client(timeout=30.0)
 
     try:
-        response = client.post(
-            TOKEN_URL,
-            data={
-                "grant_type": GRANT_TYPE_REFRESH,
-                "client_id": CLIENT_ID,
-                "refresh_token": refresh_token,
-            },
-        )
+        response = client.send(_refresh_request(refresh_token))
+        return _parse_refresh_response(response, refresh_token)
+    finally:
+        if should_close:
+            client.close()
 
-        if response.status_code != 200:
-            raise OAuthError(
-                "Session expired. Run `fastn login` to re-authenticate.",
-                error_code="invalid_grant",
-            )
 
-        data = response.json()
-        return TokenResponse(
-            access_token=data["access_token"],
-            refresh_token=data.get("refresh_token", refresh_token),
-            expires_in=data.get("expires_in", 3600),
-            token_type=data.get("token_type", "Bearer"),
-        )
+async def refresh_access_token_async(
+    refresh_token: str,
+    client: Optional[httpx.AsyncClient] = None,
+) -> TokenResponse:
+    """Refresh an expired access token without blocking the event loop.
+
+    Async equivalent of :func:`refresh_access_token`. Pass the SDK's
+    ``httpx.AsyncClient`` to reuse its connection pool.
+    """
+    should_close = client is None
+    if client is None:
+        client = httpx.AsyncClient(timeout=30.0)
+
+    try:
+        response = await client.send(_refresh_request(refresh_token))
+        return _parse_refresh_response(response, refresh_token)
     finally:
         if should_close:
-            client.close()
+            await client.aclose()
 
 
 def _decode_jwt_payload(token: str) -> Dict[str, Any]:
@@ -404,12 +448,30 @@ def is_token_expired(token_expiry: str) -> bool:
         if expiry.tzinfo is None:
             expiry = expiry.replace(tzinfo=timezone.utc)
         now = datetime.now(timezone.utc)
-        buffer = timedelta(seconds=30)
+        buffer = timedelta(seconds=TOKEN_EXPIRY_BUFFER)
         return now >= (expiry - buffer)
     except (ValueError, TypeError):
         return True
 
 
+def seconds_until_expiry(token_expiry: str) -> float:
+    """Return seconds left before a stored expiry timestamp.
+
+    Negative once the timestamp has passed; 0.0 if it is missing or
+    unparseable, matching :func:`is_token_expired` treating those as
+    expired.
+    """
+    if not token_expiry:
+        return 0.0
+    try:
+        expiry = datetime.fromisoformat(token_expiry)
+        if expiry.tzinfo is None:
+            expiry = expiry.replace(tzinfo=timezone.utc)
+        return (expiry - datetime.now(timezone.utc)).total_seconds()
+    except (ValueError, TypeError):
+        return 0.0
+
+
 def compute_token_expiry(expires_in: int) -> str:
     """Compute an ISO-8601 expiry timestamp from expires_in seconds.
 
@@ -0,0 +1,149 @@
+"""Retry policy shared by every HTTP call the Fastn SDK makes.
+
+``FastnClient`` / ``AsyncFastnClient`` route tool execution, GraphQL and
+REST calls through the helpers in ``fastn._http``. All of them retry
+according to one :class:`RetryPolicy`:
+
+* Transient failures are retried: 429, 502, 503, 504, connection errors,
+  connect/read timeouts and connection-pool timeouts.
+* Calls that change state — GraphQL mutations, tool execution, flow
+  generate/update/delete — are only retried on 429 and on failures where
+  the request never left the client (connection errors, connect and pool
+  timeouts). A 5xx or read timeout may come after the server applied the
+  change. ``RetryPolicy(retry_non_idempotent=True)`` opts back in.
+* Sleeps use decorrelated jitter, so many clients backing off from the
+  same outage do not retry in lock-step.
+* A ``Retry-After`` header (seconds or HTTP date) replaces the computed
+  sleep. If the server asks for longer than ``max_delay`` the call fails
+  immediately instead of blocking.
+* Each client keeps a retry budget. Every request deposits
+  ``budget_ratio`` tokens and every retry spends one, so during an outage
+  retries add at most ~``budget_ratio`` extra load on top of a small
+  ``budget_reserve`` burst.
+
+Usage:
+    from fastn import FastnClient, RetryPolicy
+
+    fastn = FastnClient(retry_policy=RetryPolicy(max_retries=5, max_delay=10))
+
+    # Disable retries entirely
+    fastn = FastnClient(max_retries=0)
+
+Retries are reported through ``Instrumentation.on_retry``.
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Any, FrozenSet, Optional
+
+import httpx
+
+from fastn._constants import BACKOFF_FACTOR, MAX_RETRIES
+
+RETRYABLE_STATUS_CODES: FrozenSet[int] = frozenset({429, 502, 503, 504})
+
+# Failures where the request either never reached the server or the
+# server did not answer in time.
+RETRYABLE_EXCEPTIONS = (
+    httpx.ConnectError,
+    httpx.ConnectTimeout,
+    httpx.ReadTimeout,
+    httpx.PoolTimeout,
+)
+
+# The subset of RETRYABLE_EXCEPTIONS where the request provably never
+# reached the server, and the statuses where it was rejected unprocessed:
+# the only failures retried for non-idempotent calls.
+UNSENT_EXCEPTIONS = (
+    httpx.ConnectError,
+    httpx.ConnectTimeout,
+    httpx.PoolTimeout,
+)
+UNPROCESSED_STATUS_CODES: FrozenSet[int] = frozenset({429})
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """How failed calls are retried.
+
+    Attributes:
+        max_retries: Retries after the first attempt (0 disables retrying).
+        base_delay: Smallest sleep between attempts, in seconds.
+        max_delay: Largest sleep between attempts, and the longest
+            ``Retry-After`` the client is willing to wait.
+        retry_statuses: HTTP status codes treated as transient.
+        respect_retry_after: Use the server's ``Retry-After`` header when
+            present instead of the jittered delay.
+        budget_ratio: Retry tokens earned per request. None disables the
+            budget (every call may use all of its ``max_retries``).
+        budget_reserve: Token balance a new client starts with, and the
+            most it can save up.
+        retry_non_idempotent: Also retry calls that change state on
+            every ``retry_statuses`` code and read timeouts. Off by
+            default, since the server may already have applied the call.
+    """
+
+    max_retries: int = MAX_RETRIES
+    base_delay: float = BACKOFF_FACTOR
+    max_delay: float = 20.0
+    retry_statuses: FrozenSet[int] = RETRYABLE_STATUS_CODES
+    respect_retry_after: bool = True
+    budget_ratio: Optional[float] = 0.2
+    budget_reserve: float = 10.0
+    retry_non_idempotent: bool = False
+
+    def next_delay(self, previous: float) -> float:
+        """Decorrelated jitter: uniform between base and 3x the last sleep."""
+        upper = max(self.base_delay, previous * 3)
+        return min(self.max_delay, random.uniform(self.base_delay, upper))
+
+    def retry_after(self, response: Any) -> Optional[float]:
+        """Seconds requested by the response's ``Retry-After`` header, if any."""
+        if not self.respect_retry_after:
+            return None
+        value = response.headers.get("retry-after")
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+
+class _RetryBudget:
+    """Token bucket limiting retries to a fraction of request volume.
+
+    Shared by every call on one client, including across threads.
+    """
+
+    def __init__(self, policy: RetryPolicy) -> None:
+        self._ratio = policy.budget_ratio
+        self._cap = policy.budget_reserve
+        self._tokens = policy.budget_reserve
+        self._lock = threading.Lock()
+
+    def deposit(self) -> None:
+        """Record a new request."""
+        if self._ratio is None:
+            return
+        with self._lock:
+            self._tokens = min(self._cap, self._tokens + self._ratio)
+
+    def withdraw(self) -> bool:
+        """Spend one token for a retry. Returns False when the budget is empty."""
+        if self._ratio is None:
+            return True
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
@@ -14,6 +14,7 @@ import pytest
 
 from fastn.cli.agent_command import (
     _build_action_map,
+    _compact_tools_for_openai,
     _convert_tools_for_openai,
     _detect_api_error,
     _estimate_cost,
@@ -138,6 +139,37 @@ class TestConvertToolsForOpenai:
         assert "query" in params["properties"]
         assert "limit" in params["properties"]
 
+    def test_compact_drops_optional_fields(self):
+        tool_list = [{
+            "toolId": "act_flat",
+            "function": {
+                "name": "flat_tool",
+                "description": "Flat schema tool. Searches everything.",
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "query": {"type": "string", "description": "Search text"},
+                        "limit": {"type": "integer", "default": 10},
+                    },
+                    "required": ["query"],
+                },
+            },
+        }]
+        result, stats = _compact_tools_for_openai(tool_list, "aggressive")
+        fn = result[0]["function"]
+        assert fn["description"] == "Flat schema tool."
+        assert fn["parameters"]["properties"] == {"query": {"type": "string"}}
+        assert stats.tokens_saved > 0
+
+    def test_max_tokens_drops_tools_that_do_not_fit(self):
+        tool = {"name": "send", "description": "Send a message", "inputSchema": {}}
+        _, one = _compact_tools_for_openai([tool])
+        result, stats = _compact_tools_for_openai(
+            [tool, dict(tool, name="post")], max_tokens=one.tokens_after,
+        )
+        assert [t["function"]["name"] for t in result] == ["send"]
+        assert stats.tools_dropped == 1
+
 
 # ===================================================================
 # _build_action_map
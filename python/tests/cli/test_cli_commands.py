@@ -658,6 +658,170 @@ class TestSyncCommand:
         assert "2 connectors available" in result.output
 
 
+def _listing(*names: str, source: str = "community") -> dict:
+    """A connector listing as returned by _fetch_registry_list (no tools)."""
+    return {"version": "1.0.0", "connectors": {
+        name: {"id": f"conn_{name}", "display_name": name.title(), "category": "",
+               "source": source, "connector_type": "GROUP", "tools": {}, "tool_count": 0}
+        for name in names
+    }}
+
+
+def _tool_nodes(config: Any, connector_id: str, source: str) -> list:
+    return [{"id": f"act_{connector_id}", "name": "doThing", "description": "Do it",
+             "inputSchema": {"type": "object", "properties": {}}}]
+
+
+@patch("fastn.cli.registry_commands._save_snapshot_and_generate_package_stubs")
+@patch("fastn.cli.registry_commands._detect_languages", return_value=[])
+@patch("fastn.cli.registry_commands._fetch_tool_actions")
+@patch("fastn.cli.registry_commands._fetch_registry_list")
+@patch("fastn.cli._helpers._ensure_fresh_token")
+class TestIncrementalSync:
+    def _sync(self, runner, mock_list, mock_actions, names, *args):
+        mock_list.return_value = _listing(*names)
+        mock_actions.reset_mock()
+        result = runner.invoke(cli, ["connector", "sync", *args])
+        assert result.exit_code == 0, result.output
+        fetched = sorted(call.args[1] for call in mock_actions.call_args_list)
+        return result, fetched
+
+    def test_second_sync_fetches_only_new_connectors(
+        self, mock_fresh, mock_list, mock_actions, mock_detect, mock_snapshot, runner, tmp_env,
+    ):
+        fastn_dir = _make_fastn_dir(tmp_env)
+        mock_actions.side_effect = _tool_nodes
+        _, fetched = self._sync(runner, mock_list, mock_actions, ["slack", "jira"])
+        assert fetched == ["conn_jira", "conn_slack"]
+
+        result, fetched = self._sync(runner, mock_list, mock_actions, ["slack", "jira", "github"])
+        assert fetched == ["conn_github"]
+        assert "1 new, 0 changed, 0 unchanged, 2 cached" in result.output
+        registry = json.loads((fastn_dir / "registry.json").read_text())
+        assert registry["connectors"]["slack"]["tools"]["do_thing"]["toolId"] == "act_conn_slack"
+        assert registry["connectors"]["slack"]["synced_at"]
+        assert not (fastn_dir / "sync_checkpoint.jsonl").exists()
+
+    def test_stale_or_relisted_connectors_are_refetched(
+        self, mock_fresh, mock_list, mock_actions, mock_detect, mock_snapshot, runner, tmp_env,
+    ):
+        fastn_dir = _make_fastn_dir(tmp_env)
+        mock_actions.side_effect = _tool_nodes
+        self._sync(runner, mock_list, mock_actions, ["slack", "jira"])
+
+        registry = json.loads((fastn_dir / "registry.json").read_text())
+        registry["connectors"]["slack"]["synced_at"] = "2020-01-01T00:00:00+00:00"
+        registry["connectors"]["jira"]["id"] = "conn_jira_old"
+        (fastn_dir / "registry.json").write_text(json.dumps(registry))
+        # Age alone does not trigger a fetch unless --max-age is given.
+        result, fetched = self._sync(runner, mock_list, mock_actions, ["slack", "jira"])
+        assert fetched == ["conn_jira"]
+        assert "0 new, 1 changed, 0 unchanged, 1 cached" in result.output
+
+        registry = json.loads((fastn_dir / "registry.json").read_text())
+        registry["connectors"]["slack"]["synced_at"] = "2020-01-01T00:00:00+00:00"
+        (fastn_dir / "registry.json").write_text(json.dumps(registry))
+        result, fetched = self._sync(runner, mock_list, mock_actions, ["slack", "jira"], "--max-age", "7")
+        assert fetched == ["conn_slack"]
+        assert "0 changed, 1 unchanged" in result.output
+
+        _, fetched = self._sync(runner, mock_list, mock_actions, ["slack", "jira"], "--max-age", "0")
+        assert fetched == ["conn_jira", "conn_slack"]
+        _, fetched = self._sync(runner, mock_list, mock_actions, ["slack", "jira"], "--force")
+        assert fetched == ["conn_jira", "conn_slack"]
+
+    def test_undated_entries_with_matching_hash_are_fresh(
+        self, mock_fresh, mock_list, mock_actions, mock_detect, mock_snapshot, runner, tmp_env,
+    ):
+        fastn_dir = _make_fastn_dir(tmp_env)
+        mock_actions.side_effect = _tool_nodes
+        self._sync(runner, mock_list, mock_actions, ["slack", "jira"])
+
+        # As written before sync recorded synced_at; jira's hash is stale.
+        registry = json.loads((fastn_dir / "registry.json").read_text())
+        for cdata in registry["connectors"].values():
+            del cdata["synced_at"]
+        registry["connectors"]["jira"]["schema_hash"] = "outdated"
+        (fastn_dir / "registry.json").write_text(json.dumps(registry))
+        _, fetched = self._sync(runner, mock_list, mock_actions, ["slack", "jira"], "--max-age", "7")
+        assert fetched == ["conn_jira"]
+        registry = json.loads((fastn_dir / "registry.json").read_text())
+        assert registry["connectors"]["slack"]["synced_at"]
+
+    def test_interrupted_sync_resumes(
+        self, mock_fresh, mock_list, mock_actions, mock_detect, mock_snapshot, runner, tmp_env,
+    ):
+        fastn_dir = _make_fastn_dir(tmp_env)
+        names = ["a", "b", "c", "d"]
+
+        def fail_on_c(config: Any, connector_id: str, source: str) -> list:
+            if connector_id == "conn_c":
+                raise KeyboardInterrupt
+            return _tool_nodes(config, connector_id, source)
+
+        mock_actions.side_effect = fail_on_c
+        mock_list.return_value = _listing(*names)
+        with patch("concurrent.futures.ThreadPoolExecutor", _InlineExecutor):
+            runner.invoke(cli, ["connector", "sync"])
+        checkpoint = (fastn_dir / "sync_checkpoint.jsonl").read_text().splitlines()
+        assert [json.loads(line)["name"] for line in checkpoint] == ["a", "b"]
+
+        mock_actions.side_effect = _tool_nodes
+        result, fetched = self._sync(runner, mock_list, mock_actions, names)
+        assert fetched == ["conn_c", "conn_d"]
+        assert "Resuming interrupted sync: 2 connectors already fetched" in result.output
+        registry = json.loads((fastn_dir / "registry.json").read_text())
+        assert all(registry["connectors"][n]["tools"] for n in names)
+        assert not (fastn_dir / "sync_checkpoint.jsonl").exists()
+
+
+class TestSyncCheckpoint:
+    def test_torn_line_and_stale_entries_are_skipped(self, tmp_env):
+        from datetime import datetime, timezone
+
+        from fastn.cli._registry import _SyncCheckpoint
+
+        fastn_dir = _make_fastn_dir(tmp_env)
+        checkpoint = _SyncCheckpoint(fastn_dir)
+        now = datetime.now(timezone.utc).isoformat()
+        checkpoint.record("a", {"id": "conn_a", "synced_at": now, "tools": {"x": {}}})
+        checkpoint.record("b", {"id": "conn_b", "synced_at": "2020-01-01T00:00:00", "tools": {}})
+        with open(checkpoint.path, "a") as f:
+            f.write('{"name": "c", "id": "conn_')
+
+        # A later run appends after the torn record without losing its own.
+        resumed = _SyncCheckpoint(fastn_dir)
+        resumed.record("d", {"id": "conn_d", "synced_at": now, "tools": {}})
+
+        registry = _listing("a", "b", "c", "d")
+        remaining = resumed.resume(registry, ["a", "b", "c", "d"], 7.0, datetime.now(timezone.utc))
+        assert remaining == ["b", "c"]
+        assert registry["connectors"]["a"]["tools"] == {"x": {}}
+        checkpoint.clear()
+        resumed.clear()
+        assert not checkpoint.path.exists()
+
+
+class _InlineExecutor:
+    """Runs submitted calls in order on the calling thread."""
+
+    def __init__(self, max_workers: int = 1) -> None:
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def submit(self, fn, *args):
+        from concurrent.futures import Future
+
+        future: Future = Future()
+        future.set_result(fn(*args))
+        return future
+
+
 # ===================================================================
 # ADD command
 # ===================================================================
@@ -817,6 +981,35 @@ class TestAgentCommand:
         assert result.exit_code != 0
         assert "Connector discovery failed" in result.output
 
+    @patch("fastn.cli.agent_command._agent_loop_openai")
+    @patch("fastn.cli.agent_command._verbose_post")
+    @patch("fastn.cli.agent_command._ensure_fresh_token")
+    def test_agent_compact_reports_tokens_saved(self, mock_fresh, mock_post, mock_loop, runner, tmp_env):
+        _make_fastn_dir(tmp_env, config={
+            "api_key": "key",
+            "project_id": "proj",
+            "llm_provider": "openai",
+            "llm_api_key": "sk-test",
+            "llm_model": "gpt-4o",
+        })
+
+        mock_resp = MagicMock()
+        mock_resp.status_code = 200
+        mock_resp.json.return_value = [{"toolId": "act_test", "function": {
+            "name": "test_tool",
+            "description": "Test tool. " + "Long explanation of the tool. " * 20,
+            "parameters": {"type": "object", "properties": {"text": {"type": "string", "title": "Text"}}},
+        }}]
+        mock_resp.text = "[]"
+        mock_post.return_value = mock_resp
+        mock_loop.return_value = ("done", [])
+
+        result = runner.invoke(cli, ["agent", "test task", "--compact", "light"])
+        assert result.exit_code == 0, result.output
+        assert "Tool schemas:" in result.output
+        llm_tools = mock_loop.call_args[0][3]
+        assert llm_tools[0]["function"]["description"] == "Test tool."
+
 
 # ===================================================================
 # LOGIN command
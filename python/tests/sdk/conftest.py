@@ -1,13 +1,47 @@
-"""Auto-apply the 'sdk' marker to all tests in tests/sdk/."""
+"""Shared fixtures, and the 'sdk' marker auto-applied to all tests in tests/sdk/."""
 
+import json
 from pathlib import Path
+from typing import Any, Callable, Dict, Optional
 
 import pytest
 
 _THIS_DIR = str(Path(__file__).resolve().parent)
 
+_DEFAULT_CONFIG: Dict[str, Any] = {
+    "api_key": "test-api-key-that-is-long-enough",
+    "project_id": "test-project-id",
+}
+
 
 def pytest_collection_modifyitems(items):
     for item in items:
         if str(Path(item.fspath).resolve()).startswith(_THIS_DIR):
             item.add_marker(pytest.mark.sdk)
+
+
+@pytest.fixture
+def fastn_env() -> Callable[..., str]:
+    """Factory writing a ``.fastn`` dir into *tmpdir*; returns its config.json path.
+
+    ``fastn_env(tmpdir)`` gives an API-key config and an empty registry.
+    Keyword arguments override config.json keys (``None`` drops a key), and
+    ``connectors=`` fills the registry.
+    """
+
+    def create(
+        tmpdir: str,
+        connectors: Optional[Dict[str, Any]] = None,
+        **config: Any,
+    ) -> str:
+        fastn_dir = Path(tmpdir) / ".fastn"
+        fastn_dir.mkdir()
+        merged = {**_DEFAULT_CONFIG, **config}
+        (fastn_dir / "config.json").write_text(json.dumps(
+            {k: v for k, v in merged.items() if v is not None}
+        ))
+        registry = {"version": "1" if connectors else "", "connectors": connectors or {}}
+        (fastn_dir / "registry.json").write_text(json.dumps(registry))
+        return str(fastn_dir / "config.json")
+
+    return create
@@ -0,0 +1,123 @@
+"""Tests for the cached per-token auth context (fastn._auth_context)."""
+
+from __future__ import annotations
+
+import base64
+import json
+import math
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from fastn import oauth
+from fastn._auth_context import _build_auth_context
+from fastn._constants import GRAPHQL_URL
+from fastn.client import FastnClient
+from fastn.config import FastnConfig
+
+
+def _make_jwt(payload: dict) -> str:
+    """Build a fake 3-part JWT with the given payload (no signature)."""
+    header = base64.urlsafe_b64encode(json.dumps({"alg": "none"}).encode()).rstrip(b"=").decode()
+    body = base64.urlsafe_b64encode(json.dumps(payload).encode()).rstrip(b"=").decode()
+    return f"{header}.{body}.fakesig"
+
+
+_CLAIMS = {
+    "sub": "user-1",
+    "realm_access": {"roles": ["ORG#org-9#admin", "PROJECT#ws-42", "offline_access"]},
+}
+
+
+def _login(expires_in: float = 3600) -> Dict[str, Any]:
+    """config.json keys for a login session whose token carries _CLAIMS."""
+    expiry = datetime.now(timezone.utc) + timedelta(seconds=expires_in)
+    return {
+        "api_key": None,
+        "project_id": None,
+        "auth_token": _make_jwt(_CLAIMS),
+        "refresh_token": "rt",
+        "token_expiry": expiry.isoformat(),
+    }
+
+
+class TestBuildAuthContext:
+    def test_ids_from_token_roles(self) -> None:
+        auth = _build_auth_context(FastnConfig(auth_token=_make_jwt(_CLAIMS)))
+        assert auth.workspace_id == "ws-42"
+        assert auth.org_id == "org-9"
+        assert auth.claims["sub"] == "user-1"
+
+    def test_explicit_project_id_wins(self) -> None:
+        auth = _build_auth_context(
+            FastnConfig(project_id="explicit", auth_token=_make_jwt(_CLAIMS)),
+        )
+        assert auth.workspace_id == "explicit"
+        assert auth.headers["x-fastn-space-id"] == "explicit"
+
+    def test_api_key_auth_never_expires(self) -> None:
+        auth = _build_auth_context(FastnConfig(api_key="k" * 30, project_id="p"))
+        assert auth.claims == {}
+        assert auth.expires_at == math.inf
+        assert auth.refresh_at == math.inf
+
+    def test_deadlines_are_monotonic(self) -> None:
+        expiry = (datetime.now(timezone.utc) + timedelta(seconds=600)).isoformat()
+        auth = _build_auth_context(FastnConfig(
+            auth_token=_make_jwt(_CLAIMS), refresh_token="rt", token_expiry=expiry,
+        ))
+        remaining = auth.expires_at - time.monotonic()
+        assert 560 < remaining <= 570  # 600s minus the 30s buffer
+        assert auth.refresh_at < auth.expires_at
+
+    def test_headers_are_read_only(self) -> None:
+        auth = _build_auth_context(FastnConfig(auth_token=_make_jwt(_CLAIMS)))
+        with pytest.raises(TypeError):
+            auth.headers["Authorization"] = "x"  # type: ignore[index]
+
+
+class TestClientUsesContext:
+    def test_calls_do_not_decode_or_parse(self, httpx_mock: HTTPXMock, monkeypatch, fastn_env) -> None:
+        httpx_mock.add_response(url=GRAPHQL_URL, json={"data": {"listUCLAgents": []}}, is_reusable=True)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = FastnClient(config_path=fastn_env(tmpdir, **_login()))
+
+            def fail(*args, **kwargs):
+                raise AssertionError("token decoded or expiry parsed on the request path")
+
+            monkeypatch.setattr(oauth, "_decode_jwt_payload", fail)
+            monkeypatch.setattr(oauth, "is_token_expired", fail)
+            monkeypatch.setattr(oauth, "seconds_until_expiry", fail)
+            for _ in range(5):
+                client.skills.list()
+
+        variables = json.loads(httpx_mock.get_requests()[0].content)["variables"]
+        assert variables == {"input": {"projectId": "ws-42"}}
+
+    def test_refresh_rebuilds_context(self, fastn_env) -> None:
+        new_claims = {"sub": "user-1", "realm_access": {"roles": ["PROJECT#ws-43"]}}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if str(request.url) == oauth.TOKEN_URL:
+                return httpx.Response(200, json={
+                    "access_token": _make_jwt(new_claims), "expires_in": 3600,
+                })
+            return httpx.Response(200, json={"data": {"listUCLAgents": []}})
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = FastnClient(
+                config_path=fastn_env(tmpdir, **_login(-10)),
+                transport=httpx.MockTransport(handler),
+            )
+            before = client._auth
+            client.skills.list()
+
+        assert client._auth is not before
+        assert client._auth.workspace_id == "ws-43"
+        assert client._auth.expires_at > time.monotonic() + 3000
+        assert client._headers["Authorization"] == f"Bearer {_make_jwt(new_claims)}"
@@ -0,0 +1,218 @@
+"""Tests for execute_many / execute_as_completed (fastn._batch)."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import tempfile
+import threading
+import time
+from typing import List
+
+import httpx
+import pytest
+
+from fastn import APIError, ExecuteResult, RetryPolicy
+from fastn.client import AsyncFastnClient, FastnClient
+
+
+class _Server:
+    """MockTransport handler: echoes ``n`` after ``n`` ms, tracks peak concurrency."""
+
+    def __init__(self, fail=()) -> None:
+        self.fail = set(fail)
+        self.active = 0
+        self.peak = 0
+        self.lock = threading.Lock()
+
+    def _body(self, request: httpx.Request) -> int:
+        return json.loads(request.content)["input"]["parameters"]["n"]
+
+    def _enter(self) -> None:
+        with self.lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+
+    def _leave(self) -> None:
+        with self.lock:
+            self.active -= 1
+
+    def _respond(self, n: int) -> httpx.Response:
+        if n in self.fail:
+            return httpx.Response(400, json={"error": "bad"})
+        return httpx.Response(200, json={"body": {"n": n}})
+
+    def sync(self, request: httpx.Request) -> httpx.Response:
+        n = self._body(request)
+        self._enter()
+        time.sleep(n / 1000)
+        self._leave()
+        return self._respond(n)
+
+    async def async_(self, request: httpx.Request) -> httpx.Response:
+        n = self._body(request)
+        self._enter()
+        try:
+            await asyncio.sleep(n / 1000)
+        finally:
+            self._leave()
+        return self._respond(n)
+
+
+# Slowest first, so completion order differs from input order.
+_DELAYS = [40, 30, 20, 10, 5, 1]
+
+
+class TestExecuteManySync:
+    def _client(self, config_path: str, server: _Server) -> FastnClient:
+        return FastnClient(
+            config_path=config_path, max_retries=0,
+            transport=httpx.MockTransport(server.sync),
+        )
+
+    def test_results_in_input_order(self, fastn_env) -> None:
+        server = _Server()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = self._client(fastn_env(tmpdir), server)
+            results = client.execute_many(
+                [("act_x", {"n": n}) for n in _DELAYS], concurrency=3,
+            )
+
+        assert [r.result for r in results] == [{"n": n} for n in _DELAYS]
+        assert [r.index for r in results] == list(range(len(_DELAYS)))
+        assert all(isinstance(r, ExecuteResult) and r.ok for r in results)
+        assert results[0].elapsed >= 0.04
+        assert server.peak == 3
+
+    def test_as_completed_streams_fastest_first(self, fastn_env) -> None:
+        server = _Server()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = self._client(fastn_env(tmpdir), server)
+            calls = ({"tool": "act_x", "params": {"n": n}} for n in (50, 1))
+            order = [r.index for r in client.execute_as_completed(calls, concurrency=2)]
+        assert order == [1, 0]
+
+    def test_first_error_raised(self, fastn_env) -> None:
+        server = _Server(fail={20})
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = self._client(fastn_env(tmpdir), server)
+            with pytest.raises(APIError):
+                client.execute_many([("act_x", {"n": n}) for n in _DELAYS])
+
+    def test_return_exceptions(self, fastn_env) -> None:
+        server = _Server(fail={20})
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = self._client(fastn_env(tmpdir), server)
+            results = client.execute_many(
+                [("act_x", {"n": n}) for n in _DELAYS], return_exceptions=True,
+            )
+        failed = [r for r in results if not r.ok]
+        assert [r.index for r in failed] == [2]
+        assert isinstance(failed[0].error, APIError)
+        assert failed[0].result is None
+
+    def test_malformed_specs_are_results(self, fastn_env) -> None:
+        server = _Server()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = self._client(fastn_env(tmpdir), server)
+            results = client.execute_many(
+                [{"params": {"n": 1}}, ("act_x", {"n": 1}), ("act_x",)],
+                return_exceptions=True,
+            )
+            with pytest.raises(ValueError, match="no 'tool'"):
+                client.execute_many([{"params": {}}])
+        assert [r.ok for r in results] == [False, True, False]
+        assert isinstance(results[0].error, ValueError)
+        assert isinstance(results[2].error, ValueError)
+        assert results[0].tool == ""
+
+    def test_calls_use_retry_policy(self, fastn_env) -> None:
+        attempts: List[int] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            attempts.append(1)
+            if len(attempts) == 1:
+                return httpx.Response(429)
+            return httpx.Response(200, json={"ok": True})
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = FastnClient(
+                config_path=fastn_env(tmpdir),
+                retry_policy=RetryPolicy(base_delay=0.0),
+                transport=httpx.MockTransport(handler),
+            )
+            results = client.execute_many([("act_x", {})], concurrency=1)
+        assert results[0].result == {"ok": True}
+        assert len(attempts) == 2
+
+    def test_rejects_zero_concurrency(self, fastn_env) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = self._client(fastn_env(tmpdir), _Server())
+            with pytest.raises(ValueError, match="concurrency"):
+                client.execute_many([], concurrency=0)
+
+
+class TestExecuteManyAsync:
+    def _client(self, config_path: str, server: _Server) -> AsyncFastnClient:
+        return AsyncFastnClient(
+            config_path=config_path, max_retries=0,
+            transport=httpx.MockTransport(server.async_),
+        )
+
+    async def test_results_in_input_order_with_bounded_concurrency(self, fastn_env) -> None:
+        server = _Server()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = self._client(fastn_env(tmpdir), server)
+            results = await client.execute_many(
+                [("act_x", {"n": n}) for n in _DELAYS * 5], concurrency=4,
+            )
+            await client.close()
+
+        assert [r.result["n"] for r in results] == _DELAYS * 5
+        assert server.peak == 4
+
+    async def test_as_completed_streams(self, fastn_env) -> None:
+        server = _Server()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = self._client(fastn_env(tmpdir), server)
+            order = [
+                r.index async for r in client.execute_as_completed(
+                    [("act_x", {"n": 50}), ("act_x", {"n": 1})], concurrency=2,
+                )
+            ]
+            await client.close()
+        assert order == [1, 0]
+
+    async def test_first_error_cancels_remaining(self, fastn_env) -> None:
+        server = _Server(fail={1})
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = self._client(fastn_env(tmpdir), server)
+            with pytest.raises(APIError):
+                await client.execute_many(
+                    [("act_x", {"n": 1})] + [("act_x", {"n": 500})] * 3, concurrency=4,
+                )
+            await asyncio.sleep(0)
+            # The 500 ms calls were cancelled rather than awaited.
+            assert server.active == 0
+            await client.close()
+
+    async def test_return_exceptions(self, fastn_env) -> None:
+        server = _Server(fail={5})
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = self._client(fastn_env(tmpdir), server)
+            results = await client.execute_many(
+                [("act_x", {"n": n}) for n in _DELAYS], return_exceptions=True,
+            )
+            await client.close()
+        assert [r.ok for r in results] == [True, True, True, True, False, True]
+
+    async def test_malformed_specs_are_results(self, fastn_env) -> None:
+        server = _Server()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = self._client(fastn_env(tmpdir), server)
+            results = await client.execute_many(
+                ["act_x", ("act_x", {"n": 1})], return_exceptions=True,
+            )
+            await client.close()
+        assert [r.ok for r in results] == [False, True]
+        assert isinstance(results[0].error, ValueError)
@@ -0,0 +1,320 @@
+"""Tests for the opt-in response and tool-discovery caches (fastn._cache)."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import tempfile
+import time
+from typing import Any, Dict, List
+
+import httpx
+import pytest
+
+from fastn import CacheStats
+from fastn._cache import _MISSING, _TTLCache
+from fastn._constants import DISCOVERY_CACHE_STALE_TTL
+from fastn.client import AsyncFastnClient, FastnClient
+
+_DATA: Dict[str, Any] = {
+    "widgetMetadata": {"showLabels": True},
+    "saveWidgetMetadata": {"showLabels": False},
+    "listUCLAgents": [{"id": "skill_1"}],
+    "connector": {"id": "kit_1"},
+    "api": {"id": "flow_1", "name": "Daily report"},
+    "deployApiToStage": {"id": "flow_1"},
+    "apis": {"pageInfo": {"totalCount": 1}, "edges": [
+        {"node": {"id": "flow_1", "name": "Daily report", "status": "DEPLOYED"}},
+    ]},
+}
+
+
+class _Server:
+    """Answers each known top-level field and records which were asked for."""
+
+    def __init__(self) -> None:
+        self.fields: List[str] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        query = json.loads(request.content)["query"]
+        field = next(f for f in _DATA if f + "(" in query)
+        self.fields.append(field)
+        return httpx.Response(200, json={"data": {field: _DATA[field]}})
+
+
+def _client(config_path: str, server: _Server, **kwargs: Any) -> FastnClient:
+    return FastnClient(
+        config_path=config_path, transport=httpx.MockTransport(server), **kwargs,
+    )
+
+
+class _Clock:
+    def __init__(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        self.now = 1000.0
+        monkeypatch.setattr("fastn._cache.time.monotonic", lambda: self.now)
+
+
+class TestTTLCache:
+    def test_lru_eviction(self) -> None:
+        cache = _TTLCache(maxsize=2, ttl=60)
+        cache.store("a", 1)
+        cache.store("b", 2)
+        assert cache.lookup("a") == (1, False)
+        cache.store("c", 3)
+        assert cache.lookup("b") == (_MISSING, False)
+        assert cache.stats() == CacheStats(hits=1, misses=1, evictions=1, size=2)
+
+    def test_expiry_and_stale_window(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        clock = _Clock(monkeypatch)
+        cache = _TTLCache(maxsize=8, ttl=10, stale_ttl=5)
+        cache.store("a", 1, cost=0.25)
+        clock.now += 12
+        assert cache.lookup("a") == (1, True)
+        clock.now += 5
+        assert cache.lookup("a") == (_MISSING, False)
+        stats = cache.stats()
+        assert (stats.hits, stats.stale_hits, stats.misses, stats.size) == (1, 1, 1, 0)
+        assert stats.saved_seconds == 0.25
+
+    def test_store_after_invalidation_is_dropped(self) -> None:
+        cache = _TTLCache(maxsize=8, ttl=60)
+        generation = cache.generation
+        cache.discard(lambda key: True)
+        cache.store("a", 1, generation=generation)
+        assert cache.lookup("a") == (_MISSING, False)
+
+    def test_invalid_settings(self) -> None:
+        with pytest.raises(ValueError, match="size"):
+            _TTLCache(maxsize=0, ttl=1)
+        with pytest.raises(ValueError, match="TTL"):
+            _TTLCache(maxsize=1, ttl=0)
+
+
+class TestResponseCache:
+    def test_off_by_default(self, fastn_env) -> None:
+        server = _Server()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = _client(fastn_env(tmpdir), server)
+            client.kit.get()
+            client.kit.get()
+        assert server.fields == ["widgetMetadata", "widgetMetadata"]
+        assert client.cache_stats() == CacheStats()
+
+    def test_reads_are_served_from_cache(self, fastn_env) -> None:
+        server = _Server()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = _client(fastn_env(tmpdir), server, response_cache_ttl=60)
+            for _ in range(3):
+                assert client.kit.get() == {"showLabels": True}
+                assert client.kit.get_connector("kit_1") == {"id": "kit_1"}
+                assert client.skills.list() == [{"id": "skill_1"}]
+                assert client.flows.get("flow_1")["name"] == "Daily report"
+                assert client.flows.list(fields=["flow_id"]) == [{"flow_id": "flow_1"}]
+
+        assert len(server.fields) == 5
+        stats = client.cache_stats()
+        assert (stats.hits, stats.misses, stats.size) == (10, 5, 5)
+        assert stats.hit_rate == pytest.approx(10 / 15)
+
+    def test_callers_get_copies(self, fastn_env) -> None:
+        server = _Server()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = _client(fastn_env(tmpdir), server, response_cache_ttl=60)
+            client.skills.list().append({"id": "mine"})
+            client.skills.list()[0]["id"] = "changed"
+            assert client.skills.list() == [{"id": "skill_1"}]
+
+    def test_arguments_workspace_and_tenant_are_part_of_the_key(self, fastn_env) -> None:
+        server = _Server()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = _client(fastn_env(tmpdir), server, response_cache_ttl=60)
+            client.flows.list()
+            client.flows.list(status="DEPLOYED")
+            client._config.tenant_id = "acme"
+            client.flows.list()
+        assert server.fields == ["apis", "apis", "apis"]
+
+    def test_mutations_invalidate_their_namespace(self, fastn_env) -> None:
+        server = _Server()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = _client(fastn_env(tmpdir), server, response_cache_ttl=60)
+            client.kit.get()
+            client.skills.list()
+            client.flows.list()
+            client.kit.update({"showLabels": False})
+            client.flows.deploy("flow_1")
+            client.kit.get()
+            client.skills.list()
+            client.flows.list()
+
+        assert server.fields == [
+            "widgetMetadata", "listUCLAgents", "apis",
+            "saveWidgetMetadata", "deployApiToStage",
+            "widgetMetadata", "apis",
+        ]
+
+    def test_entries_expire(self, monkeypatch: pytest.MonkeyPatch, fastn_env) -> None:
+        clock = _Clock(monkeypatch)
+        server = _Server()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = _client(fastn_env(tmpdir), server, response_cache_ttl=30)
+            client.kit.get()
+            clock.now += 29
+            client.kit.get()
+            clock.now += 2
+            client.kit.get()
+            client.clear_cache()
+            client.kit.get()
+        assert server.fields == ["widgetMetadata"] * 3
+
+
+class TestAsyncResponseCache:
+    async def test_reads_and_invalidation(self, fastn_env) -> None:
+        server = _Server()
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            return server(request)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = AsyncFastnClient(
+                config_path=fastn_env(tmpdir), transport=httpx.MockTransport(handler),
+                response_cache_ttl=60,
+            )
+            assert await client.flows.list() == await client.flows.list()
+            await client.flows.get("flow_1")
+            await client.flows.get("flow_1")
+            await client.flows.deploy("flow_1")
+            await client.flows.get("flow_1")
+            await client.close()
+
+        assert server.fields == ["apis", "api", "deployApiToStage", "api"]
+        assert client.cache_stats().hits == 2
+
+
+class _ToolsServer:
+    """Answers ``/getTools`` and ``/executeTool``; can be told to fail discovery."""
+
+    def __init__(self) -> None:
+        self.prompts: List[Any] = []
+        self.executed = 0
+        self.fail = False
+        self.tool = "act_slack_send_message"
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/executeTool"):
+            self.executed += 1
+            return httpx.Response(200, json={"ok": True})
+        body = json.loads(request.content)["input"]
+        self.prompts.append((body["prompt"], body["limit"]))
+        if self.fail:
+            return httpx.Response(400, json={"message": "bad"})
+        time.sleep(0.002)
+        return httpx.Response(200, json={"tools": [{
+            "actionId": self.tool, "name": self.tool, "description": "Send",
+            "parameters": {"type": "object", "properties": {}},
+        }]})
+
+
+def _wait_for(condition: Any, timeout: float = 2.0) -> bool:
+    deadline = time.perf_counter() + timeout
+    while not condition():
+        if time.perf_counter() > deadline:
+            return False
+        time.sleep(0.005)
+    return True
+
+
+class TestDiscoveryCache:
+    def test_off_by_default(self, fastn_env) -> None:
+        server = _ToolsServer()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = FastnClient(config_path=fastn_env(tmpdir), transport=httpx.MockTransport(server))
+            client.get_tools_for("send a message")
+            client.get_tools_for("send a message")
+        assert len(server.prompts) == 2
+        assert client.discovery_cache_stats() == CacheStats()
+
+    def test_normalized_prompts_share_an_entry(self, fastn_env) -> None:
+        server = _ToolsServer()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = FastnClient(
+                config_path=fastn_env(tmpdir), transport=httpx.MockTransport(server),
+                discovery_cache_ttl=60,
+            )
+            openai = client.get_tools_for("Send a message")
+            anthropic = client.get_tools_for("  send   A MESSAGE ", format="anthropic")
+            client.get_tools_for("send a message", limit=3)
+            client.run("send a message")
+            client.run("Send a message")
+
+        assert openai[0]["function"]["name"] == "act_slack_send_message"
+        assert anthropic[0]["name"] == "act_slack_send_message"
+        assert server.prompts == [("Send a message", 5), ("send a message", 3), ("send a message", 1)]
+        assert server.executed == 2
+        stats = client.discovery_cache_stats()
+        assert (stats.hits, stats.misses) == (2, 3)
+        assert stats.saved_seconds > 0
+        assert client.cache_stats() == CacheStats()
+
+    def test_stale_entry_is_served_while_refreshing(self, monkeypatch: pytest.MonkeyPatch, fastn_env) -> None:
+        clock = _Clock(monkeypatch)
+        server = _ToolsServer()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = FastnClient(
+                config_path=fastn_env(tmpdir), transport=httpx.MockTransport(server),
+                discovery_cache_ttl=60,
+            )
+            client.get_tools_for("send", format="raw")
+            clock.now += 61
+            server.tool = "act_teams_send_message"
+            assert client.get_tools_for("send", format="raw")[0]["actionId"] == "act_slack_send_message"
+            assert _wait_for(lambda: not client._discovery_cache._refreshing)
+            assert client.get_tools_for("send", format="raw")[0]["actionId"] == "act_teams_send_message"
+
+            # Past the stale window the lookup is a plain miss.
+            clock.now += 60 + DISCOVERY_CACHE_STALE_TTL
+            client.get_tools_for("send", format="raw")
+        assert len(server.prompts) == 3
+        assert client.discovery_cache_stats().stale_hits == 1
+
+    def test_failed_refresh_keeps_the_stale_entry(self, monkeypatch: pytest.MonkeyPatch, fastn_env) -> None:
+        clock = _Clock(monkeypatch)
+        server = _ToolsServer()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = FastnClient(
+                config_path=fastn_env(tmpdir), transport=httpx.MockTransport(server),
+                discovery_cache_ttl=60,
+            )
+            client.get_tools_for("send")
+            clock.now += 61
+            server.fail = True
+            client.get_tools_for("send")
+            assert _wait_for(lambda: not client._discovery_cache._refreshing)
+            assert client.get_tools_for("send")[0]["function"]["name"] == "act_slack_send_message"
+            client.clear_cache()
+            server.fail = False
+            client.get_tools_for("send")
+        assert len(server.prompts) == 4
+
+    async def test_async_refresh_runs_as_a_task(self, monkeypatch: pytest.MonkeyPatch, fastn_env) -> None:
+        clock = _Clock(monkeypatch)
+        server = _ToolsServer()
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            return server(request)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = AsyncFastnClient(
+                config_path=fastn_env(tmpdir), transport=httpx.MockTransport(handler),
+                discovery_cache_ttl=60,
+            )
+            await client.run("send")
+            await client.run("send")
+            clock.now += 61
+            await client.get_tools_for("send", limit=1)
+            await asyncio.gather(*client._discovery_cache.tasks)
+            await client.close()
+
+        assert server.prompts == [("send", 1), ("send", 1)]
+        assert server.executed == 2
+        assert client.discovery_cache_stats().hits == 2
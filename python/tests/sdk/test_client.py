@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import sys
 import tempfile
 from pathlib import Path
 
@@ -11,6 +12,7 @@ import httpx
 from pytest_httpx import HTTPXMock
 
 from fastn.client import AsyncFastnClient, FastnClient
+from fastn._http import _http_client_options
 from fastn.exceptions import (
     APIError,
     AuthError,
@@ -362,10 +364,186 @@ class TestFastnClient:
                 client.connectors.get("nonexistent")
 
 
+# ---------------------------------------------------------------------------
+# Connection pool configuration
+# ---------------------------------------------------------------------------
+
+class TestConnectionPool:
+    def test_default_options_keep_httpx_limits(self) -> None:
+        options = _http_client_options(30.0)
+        assert options["timeout"] == httpx.Timeout(30.0)
+        assert "limits" not in options
+        assert "http2" not in options
+
+    def test_split_timeouts_fall_back_to_timeout(self) -> None:
+        options = _http_client_options(30.0, connect_timeout=2.0, pool_timeout=1.0)
+        timeout = options["timeout"]
+        assert (timeout.connect, timeout.read, timeout.write, timeout.pool) == (2.0, 30.0, 30.0, 1.0)
+
+    def test_pool_limits(self) -> None:
+        options = _http_client_options(
+            30.0, max_connections=200, max_keepalive_connections=50,
+        )
+        assert options["limits"] == httpx.Limits(
+            max_connections=200, max_keepalive_connections=50, keepalive_expiry=5.0,
+        )
+
+    def test_transport_rejects_pool_options(self) -> None:
+        with pytest.raises(ConfigError, match="max_connections"):
+            _http_client_options(
+                30.0, max_connections=10, transport=httpx.HTTPTransport(),
+            )
+
+    def test_http2_without_h2_raises(self, monkeypatch) -> None:
+        monkeypatch.setitem(sys.modules, "h2", None)
+        with pytest.raises(ConfigError, match="fastn-ai\\[http2\\]"):
+            _http_client_options(30.0, http2=True)
+
+    def test_shared_transport_survives_close(self) -> None:
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.headers["x-fastn-space-tenantid"])
+            return httpx.Response(200, json={"ok": True})
+
+        class _TrackingTransport(httpx.MockTransport):
+            closed = False
+
+            def close(self) -> None:
+                self.closed = True
+
+        transport = _TrackingTransport(handler)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = _create_test_env(tmpdir)
+            acme = FastnClient(config_path=config_path, tenant_id="acme", transport=transport)
+            globex = FastnClient(config_path=config_path, tenant_id="globex", transport=transport)
+
+            acme.execute("act_slack_send_message", {})
+            acme.close()
+            globex.execute("act_slack_send_message", {})
+            globex.close()
+
+        assert calls == ["acme", "globex"]
+        assert not transport.closed
+
+
 # ---------------------------------------------------------------------------
 # execute() tests
 # ---------------------------------------------------------------------------
 
+class TestConnectIndex:
+    def test_index_built_once_and_shared(self, monkeypatch) -> None:
+        from fastn import client as client_module
+
+        builds = []
+        real = client_module._build_tool_index
+        monkeypatch.setattr(
+            client_module, "_build_tool_index", lambda r: builds.append(1) or real(r),
+        )
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = FastnClient(config_path=_create_multi_connector_env(tmpdir))
+            a = client.connect("conn_a")
+            b = client.connect("conn_b")
+
+        assert len(builds) == 1
+        assert a._tools is b._tools
+        assert sorted(a._tools) == ["create_channel", "create_issue", "send_message"]
+        with pytest.raises(TypeError):
+            a._tools["x"] = {}  # type: ignore[index]
+
+    def test_bound_proxies_reused_with_lru_bound(self, monkeypatch) -> None:
+        from fastn import client as client_module
+
+        monkeypatch.setattr(client_module, "BOUND_PROXY_CACHE_SIZE", 2)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = FastnClient(config_path=_create_test_env(tmpdir))
+            a = client.connect("conn_a")
+            assert client.connect("conn_a") is a
+            client.connect("conn_b")
+            client.connect("conn_a")  # refresh a; b is now oldest
+            client.connect("conn_c")
+
+        assert list(client._bound_proxies) == ["conn_a", "conn_c"]
+        assert client.connect("conn_a") is a
+
+    def test_collision_warns_and_last_connector_wins(self, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_response(
+            url="https://live.fastn.ai/api/ucl/executeTool", json={"ok": True}, is_reusable=True,
+        )
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = _create_multi_connector_env(tmpdir)
+            registry_path = Path(config_path).parent / "registry.json"
+            registry = json.loads(registry_path.read_text())
+            registry["connectors"]["jira"]["tools"]["send_message"] = {"toolId": "act_jira_send"}
+            registry_path.write_text(json.dumps(registry))
+
+            client = FastnClient(config_path=config_path, max_retries=0)
+            proxy = client.connect("conn_a")
+            assert client._tool_collisions == {"send_message": ("slack", "jira")}
+            with pytest.warns(UserWarning, match="slack, jira; using jira's"):
+                proxy.send_message(text="hi")
+            proxy.create_channel(name="x")
+
+        tool_ids = [json.loads(r.content)["input"]["toolId"] for r in httpx_mock.get_requests()]
+        assert tool_ids == ["act_jira_send", "act_slack_create_channel"]
+
+
+class TestReloadRegistry:
+    def _rewrite_registry(self, config_path: str, mutate) -> None:
+        path = Path(config_path).parent / "registry.json"
+        registry = json.loads(path.read_text())
+        mutate(registry["connectors"])
+        path.write_text(json.dumps(registry))
+
+    def test_reload_rebinds_existing_proxies(self, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_response(
+            url="https://live.fastn.ai/api/ucl/executeTool", json={"ok": True}, is_reusable=True,
+        )
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = _create_multi_connector_env(tmpdir)
+            client = FastnClient(config_path=config_path, max_retries=0)
+            slack = client.slack
+            bound = client.connect("conn_abc")
+            send = slack.send_message
+            assert slack.send_message is send
+
+            def mutate(connectors):
+                connectors["slack"]["tools"]["send_message"]["toolId"] = "act_v2"
+                del connectors["jira"]
+
+            jira = client.jira
+            self._rewrite_registry(config_path, mutate)
+            client.reload_registry()
+
+            assert client._registry_generation == 1
+            assert slack._generation == bound._generation == 1
+            assert client.slack is slack
+            assert slack.send_message is not send
+            slack.send_message(channel="general")
+            bound.send_message(channel="general")
+            with pytest.raises(ConnectorNotFoundError):
+                _ = client.jira
+            with pytest.raises(ToolNotFoundError):
+                jira.create_issue(summary="x")
+            assert [c["name"] for c in client.connectors.list()] == ["slack"]
+
+        tool_ids = [json.loads(r.content)["input"]["toolId"] for r in httpx_mock.get_requests()]
+        assert tool_ids == ["act_v2", "act_v2"]
+
+    def test_reload_picks_up_new_connector(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = _create_test_env(tmpdir)
+            client = FastnClient(config_path=config_path)
+            with pytest.raises(ConnectorNotFoundError):
+                _ = client.jira
+
+            self._rewrite_registry(config_path, lambda c: c.update(
+                jira={"id": "conn_jira_001", "tools": {"create_issue": {"toolId": "act_j"}}},
+            ))
+            client.reload_registry()
+            assert "create_issue" in dir(client.jira)
+
+
 class TestExecute:
     def test_execute_by_tool(self, httpx_mock: HTTPXMock) -> None:
         """execute() calls executeTool with the given tool and params."""
@@ -1079,12 +1257,13 @@ class TestFlowsNamespace:
                 status_code=404,
                 json={"error": "FLOW_NOT_FOUND"},
             )
-            # Resolution lists flows → no match found → FlowNotFoundError
-            httpx_mock.add_response(
-                url="https://live.fastn.ai/api/graphql",
-                method="POST",
-                json={"data": {"apis": {"pageInfo": {"totalCount": 0}, "edges": []}}},
-            )
+            # Resolution searches, then scans all flows → no match → FlowNotFoundError
+            for _ in range(2):
+                httpx_mock.add_response(
+                    url="https://live.fastn.ai/api/graphql",
+                    method="POST",
+                    json={"data": {"apis": {"pageInfo": {"totalCount": 0}, "edges": []}}},
+                )
 
             with pytest.raises(FlowNotFoundError):
                 client.flows.delete(flow_id="nonexistent")
@@ -215,3 +215,52 @@ class TestAsyncDynamicConnector:
 
         with pytest.raises(ToolNotFoundError):
             await connector.nonexistent()
+
+
+class TestMemoizedTools:
+    def test_callable_resolved_once(self, monkeypatch) -> None:
+        connector = DynamicConnector(
+            connector_name="slack",
+            tools=_make_tools("send_message"),
+            execute_fn=lambda *a, **kw: {"ok": True},
+        )
+        calls = []
+        real = connector._resolve_tool_call
+        monkeypatch.setattr(
+            connector, "_resolve_tool_call", lambda name: calls.append(name) or real(name),
+        )
+
+        first = connector.send_message
+        assert connector.send_message is first
+        assert connector.send_message() == {"ok": True}
+        assert calls == ["send_message"]
+
+    def test_rebind_drops_memoized(self) -> None:
+        connector = DynamicConnector(
+            connector_name="slack",
+            tools=_make_tools("send_message"),
+            execute_fn=lambda tool_id, *a, **kw: tool_id,
+        )
+        assert connector.send_message() == "act_send_message"
+
+        connector._rebind(
+            {"send_message": {"toolId": "act_v2", "inputSchema": {}}}, "", None, generation=1,
+        )
+        assert connector._generation == 1
+        assert connector.send_message() == "act_v2"
+
+        connector._rebind({}, "", None, generation=2)
+        with pytest.raises(ToolNotFoundError):
+            connector.send_message()
+
+    async def test_async_callable_memoized(self) -> None:
+        async def mock_execute(*args, **kwargs):
+            return {"ok": True}
+
+        connector = AsyncDynamicConnector(
+            connector_name="slack",
+            tools=_make_tools("send_message"),
+            execute_fn=mock_execute,
+        )
+        assert connector.send_message is connector.send_message
+        assert await connector.send_message() == {"ok": True}
@@ -0,0 +1,130 @@
+"""Tests for local tool discovery over the registry (fastn._discovery)."""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict
+
+import httpx
+import pytest
+
+from fastn._discovery import _LocalIndex, _tokenize
+from fastn.client import AsyncFastnClient, FastnClient
+from fastn.exceptions import ConnectorNotFoundError
+
+_CONNECTORS: Dict[str, Any] = {
+    "slack": {"id": "c1", "display_name": "Slack", "tools": {
+        "send_message": {
+            "toolId": "act_slack_send_message",
+            "description": "Send a message to a channel",
+            "inputSchema": {"type": "object", "properties": {
+                "channel": {"type": "string"}, "text": {"type": "string"},
+            }},
+        },
+        "list_channels": {"toolId": "act_slack_list_channels", "description": "List channels"},
+    }},
+    "jira": {"id": "c2", "display_name": "Jira", "tools": {
+        "create_issue": {"toolId": "act_jira_create_issue", "description": "Create an issue (ticket)"},
+        "add_comment": {"toolId": "act_jira_add_comment", "description": "Add a comment to an issue"},
+    }},
+    "teams": {"id": "c3", "display_name": "Microsoft Teams", "tools": {
+        "sendChannelMessage": {"actionId": "act_teams_send", "description": "Post a message"},
+    }},
+}
+
+
+def _write_registry(fastn_dir: Path, connectors: Dict[str, Any]) -> None:
+    path = fastn_dir / "registry.json"
+    path.write_text(json.dumps({"version": "1", "connectors": connectors}))
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def _offline(request: httpx.Request) -> httpx.Response:
+    raise AssertionError(f"unexpected request to {request.url}")
+
+
+class TestLocalIndex:
+    def test_tokenize(self) -> None:
+        assert _tokenize("Send the sendChannelMessages to #general!") == [
+            "send", "send", "channel", "message", "general",
+        ]
+
+    def test_bm25_ranking(self) -> None:
+        index = _LocalIndex({"connectors": _CONNECTORS})
+        assert len(index) == 5
+        assert [t["name"] for t in index.search("create a jira ticket", 2)] == [
+            "create_issue", "add_comment",
+        ]
+        top = index.search("send a slack message", 1)[0]
+        assert top == {
+            "name": "send_message",
+            "description": "Send a message to a channel",
+            "toolId": "act_slack_send_message",
+            "inputSchema": _CONNECTORS["slack"]["tools"]["send_message"]["inputSchema"],
+            "outputSchema": {},
+        }
+
+    def test_unmatched_prompt_and_connector_filter(self) -> None:
+        index = _LocalIndex({"connectors": _CONNECTORS})
+        assert index.search("weather forecast", 5) == []
+        assert [t["toolId"] for t in index.search("send message", 5, ["teams"])] == ["act_teams_send"]
+
+    def test_tfidf_matches_bm25_on_clear_prompts(self) -> None:
+        pytest.importorskip("numpy")
+        index = _LocalIndex({"connectors": _CONNECTORS})
+        for prompt in ("create a jira ticket", "comment on an issue", "list slack channels"):
+            assert (
+                index.search(prompt, 1, scoring="tfidf")[0]["name"]
+                == index.search(prompt, 1)[0]["name"]
+            )
+
+
+class TestLocalMode:
+    def test_get_tools_for_makes_no_request(self, fastn_env) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = FastnClient(
+                config_path=fastn_env(tmpdir, connectors=_CONNECTORS), transport=httpx.MockTransport(_offline),
+            )
+            tools = client.get_tools_for("post a message in slack", mode="local", limit=2)
+            raw = client.get_tools_for("comment on an issue", mode="local", format="raw", connector="jira")
+
+        assert tools[0]["function"]["name"] == "send_message"
+        assert len(tools) == 2
+        assert [t["name"] for t in raw] == ["add_comment", "create_issue"]
+
+    def test_index_is_rebuilt_after_reload(self, fastn_env) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = FastnClient(config_path=fastn_env(tmpdir, connectors=_CONNECTORS))
+            assert client.get_tools_for("weather", mode="local") == []
+            index = client._local_index
+            assert client.get_tools_for("slack", mode="local", limit=1)
+            assert client._local_index is index
+
+            _write_registry(Path(tmpdir) / ".fastn", {"weather": {"id": "c9", "tools": {
+                "get_forecast": {"toolId": "act_weather", "description": "Weather forecast"},
+            }}})
+            client.reload_registry()
+            assert [t["toolId"] for t in client.get_tools_for("weather", mode="local", format="raw")] == [
+                "act_weather",
+            ]
+
+    def test_invalid_mode_and_connector(self, fastn_env) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = FastnClient(config_path=fastn_env(tmpdir, connectors=_CONNECTORS))
+            with pytest.raises(ValueError, match="Unsupported mode"):
+                client.get_tools_for("send", mode="fuzzy")
+            with pytest.raises(ConnectorNotFoundError):
+                client.get_tools_for("send", mode="local", connector="discord")
+
+    async def test_async_client(self, fastn_env) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = AsyncFastnClient(
+                config_path=fastn_env(tmpdir, connectors=_CONNECTORS), transport=httpx.MockTransport(_offline),
+            )
+            tools = await client.get_tools_for("open a ticket", mode="local", format="anthropic")
+            await client.close()
+        assert tools[0]["name"] == "create_issue"
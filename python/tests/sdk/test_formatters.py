@@ -0,0 +1,233 @@
+"""Tests for LLM tool format conversion and its memoization (fastn._formatters)."""
+
+from __future__ import annotations
+
+import copy
+import json
+import tempfile
+from typing import Any, Dict, Iterator, List
+
+import pytest
+
+from fastn._formatters import (
+    _FORMAT_CONVERTERS,
+    CompactionStats,
+    _compact_tools,
+    _format_cache,
+    _FormatCache,
+    _shorten,
+    _tools_json,
+)
+from fastn.client import AsyncFastnClient, FastnClient
+
+_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {"body": {
+        "type": "object",
+        "properties": {"channel": {"type": "string"}, "text": {"type": "string", "description": "Message – text"}},
+        "required": ["channel"],
+    }},
+}
+
+
+def _tools() -> List[Dict[str, Any]]:
+    return [
+        {"name": "send_message", "description": "Send a message", "toolId": "act_1", "inputSchema": _SCHEMA},
+        {"name": "list_channels", "description": "List channels", "toolId": "act_2"},
+    ]
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache() -> Iterator[None]:
+    _format_cache.clear()
+    yield
+    _format_cache.clear()
+
+
+class TestFormatCache:
+    def test_reuses_encodings_for_the_same_schema(self) -> None:
+        tools = _tools()
+        first = _tools_json(tools, "openai")
+        assert _tools_json(tools, "openai") == first
+        # An equal schema decoded from a fresh /getTools response also hits.
+        assert _tools_json(copy.deepcopy(tools), "openai") == first
+        assert (_format_cache.hits, _format_cache.misses) == (4, 2)
+        _tools_json(tools, "anthropic")
+        assert _format_cache.misses == 4
+
+    def test_changed_schema_or_description_is_reencoded(self) -> None:
+        tools = _tools()
+        _tools_json(tools, "openai")
+        changed = copy.deepcopy(tools[0])
+        changed["inputSchema"]["properties"]["body"]["properties"]["thread"] = {"type": "string"}
+        assert "thread" in json.loads(_tools_json([changed], "openai"))[0]["function"]["parameters"]["properties"]
+        renamed = dict(tools[0], description="Post a message")
+        assert json.loads(_tools_json([renamed], "openai"))[0]["function"]["description"] == "Post a message"
+        assert _format_cache.hits == 0
+
+    def test_schema_edited_in_place_is_reencoded(self) -> None:
+        tools = copy.deepcopy(_tools())
+        _tools_json(tools, "openai")
+        tools[0]["inputSchema"]["properties"]["body"]["properties"]["thread"] = {"type": "string"}
+        encoded = json.loads(_tools_json(tools, "openai"))
+        assert "thread" in encoded[0]["function"]["parameters"]["properties"]
+        assert (_format_cache.hits, _format_cache.misses) == (1, 3)
+
+    def test_size_bound(self) -> None:
+        cache = _FormatCache(maxsize=2)
+        for i in range(3):
+            cache.encoded({"name": f"t{i}", "toolId": f"act_{i}"}, "gemini")
+        assert len(cache._entries) == 2
+        cache.encoded({"name": "t0", "toolId": "act_0"}, "gemini")
+        assert cache.misses == 4
+
+
+class TestToolsJson:
+    @pytest.mark.parametrize("format", ["openai", "anthropic", "gemini", "bedrock", "raw"])
+    def test_decodes_to_the_converted_tools(self, format: str) -> None:
+        expected = _tools() if format == "raw" else _FORMAT_CONVERTERS[format](_tools())
+        encoded = _tools_json(_tools(), format)
+        assert isinstance(encoded, bytes)
+        assert json.loads(encoded) == expected
+
+    def test_empty_and_non_ascii(self) -> None:
+        assert _tools_json([], "openai") == b"[]"
+        assert "Message – text".encode("utf-8") in _tools_json(_tools(), "anthropic")
+
+
+_ADDRESS: Dict[str, Any] = {
+    "type": "object",
+    "description": "A postal address. Used for billing and shipping.",
+    "properties": {
+        "street": {"type": "string", "description": "Street and number"},
+        "city": {"type": "string", "title": "City"},
+        "zip": {"type": "string", "default": "00000", "x-format": "zip"},
+    },
+}
+_ORDER: Dict[str, Any] = {"name": "create_order", "description": "Create an order. " + "Details. " * 30, "inputSchema": {
+    "type": "object",
+    "properties": {"body": {"type": "object", "required": ["customer"], "properties": {
+        "customer": {"type": "string", "description": "Customer id, e.g. Cus_1. Must exist."},
+        "billing": _ADDRESS,
+        "shipping": _ADDRESS,
+        "title": {"type": "string", "title": "Title"},
+    }}},
+}}
+
+
+def _params(tool: Dict[str, Any]) -> Dict[str, Any]:
+    return tool["function"]["parameters"]
+
+
+class TestCompaction:
+    def test_shorten(self) -> None:
+        assert _shorten("Customer id, e.g. Cus_1. Must exist.", 100) == "Customer id, e.g. Cus_1."
+        assert _shorten("one two three four", 12) == "one two..."
+
+    def test_light_strips_annotations_not_properties(self) -> None:
+        (tool,), stats = _compact_tools([_ORDER], "openai", "light")
+        params = _params(tool)
+        assert tool["function"]["description"] == "Create an order."
+        assert params["properties"]["customer"]["description"] == "Customer id, e.g. Cus_1."
+        assert params["properties"]["billing"]["properties"]["zip"] == {"type": "string"}
+        # A property named like an annotation keyword is kept.
+        assert params["properties"]["title"] == {"type": "string"}
+        assert 0 < stats.tokens_after < stats.tokens_before
+        assert stats.tokens_saved == stats.tokens_before - stats.tokens_after
+
+    def test_standard_moves_repeated_sub_schemas_to_defs(self) -> None:
+        (tool,), _ = _compact_tools([_ORDER], "anthropic", "standard")
+        schema = tool["input_schema"]
+        assert schema["properties"]["billing"] == {"$ref": "#/$defs/billing"}
+        assert schema["properties"]["shipping"] == {"$ref": "#/$defs/billing"}
+        assert schema["$defs"]["billing"]["properties"]["city"] == {"type": "string"}
+        # Gemini has no $ref support, so its schemas stay inline.
+        (gemini,), _ = _compact_tools([_ORDER], "gemini", "standard")
+        assert "$defs" not in gemini["parameters"]
+
+    def test_duplicate_defs_become_references(self) -> None:
+        action = {"name": "ship", "description": "Ship", "inputSchema": {
+            "type": "object",
+            "properties": {"to": {"$ref": "#/$defs/B"}},
+            "$defs": {"A": _ADDRESS, "B": copy.deepcopy(_ADDRESS)},
+        }}
+        (tool,), _ = _compact_tools([action], "openai", "standard")
+        defs = _params(tool)["$defs"]
+        assert defs["B"] == {"$ref": "#/$defs/A"}
+        assert defs["A"]["properties"]["city"] == {"type": "string"}
+
+    def test_aggressive_keeps_only_required_properties(self) -> None:
+        (tool,), _ = _compact_tools([_ORDER], "openai", "aggressive")
+        assert _params(tool) == {
+            "type": "object", "properties": {"customer": {"type": "string"}}, "required": ["customer"],
+        }
+
+    def test_source_schema_is_not_modified(self) -> None:
+        before = json.dumps(_ORDER, sort_keys=True)
+        _compact_tools([_ORDER], "bedrock", "standard")
+        assert json.dumps(_ORDER, sort_keys=True) == before
+
+    def test_max_tokens_compacts_then_drops(self) -> None:
+        small = {"name": "ping", "description": "Ping", "inputSchema": {}}
+        _, aggressive = _compact_tools([_ORDER], "openai", "aggressive")
+        tools, stats = _compact_tools([_ORDER, small], "openai", max_tokens=aggressive.tokens_after)
+        assert _params(tools[0])["properties"].keys() == {"customer"}
+        assert stats.tools_dropped == 1
+        assert stats.tokens_after <= aggressive.tokens_after
+        tools, stats = _compact_tools([_ORDER, small], "openai", max_tokens=30)
+        assert [t["function"]["name"] for t in tools] == ["ping"]
+
+    def test_stats_add_up(self) -> None:
+        total = CompactionStats(1, 100, 60, 0) + CompactionStats(1, 50, 20, 2)
+        assert total == CompactionStats(2, 150, 80, 2)
+        assert total.tokens_saved == 70
+
+
+_SLACK = {"slack": {"id": "c1", "tools": {
+    "send_message": {"toolId": "act_1", "description": "Send a message", "inputSchema": _SCHEMA},
+}}}
+
+
+class TestClient:
+    def test_get_tools_json(self, fastn_env) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = FastnClient(config_path=fastn_env(tmpdir, connectors=_SLACK))
+            tools = client.get_tools_for("slack", connector="slack", format="bedrock")
+            encoded = client.get_tools_json("slack", connector="slack", format="bedrock")
+            again = client.get_tools_json("slack", connector="slack", format="bedrock")
+
+        assert encoded == again
+        assert _format_cache.hits == 1
+        assert json.loads(encoded) == tools
+        assert tools[0]["toolSpec"]["inputSchema"]["json"]["required"] == ["channel"]
+
+    def test_compaction_is_counted(self, fastn_env) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = FastnClient(config_path=fastn_env(tmpdir, connectors=_SLACK))
+            plain = client.get_tools_for("slack", connector="slack")
+            compact = client.get_tools_for("slack", connector="slack", compact="aggressive")
+            encoded = client.get_tools_json("slack", connector="slack", max_tokens=1)
+            stats = client.compaction_stats()
+            with pytest.raises(ValueError, match="Unsupported compact level"):
+                client.get_tools_for("slack", compact="tiny")
+            with pytest.raises(ValueError, match="not 'raw'"):
+                client.get_tools_for("slack", format="raw", max_tokens=100)
+
+        assert _params(compact[0])["properties"].keys() == {"channel"}
+        assert _params(plain[0])["properties"]["text"]["description"] == "Message – text"
+        assert encoded == b"[]"
+        assert (stats.calls, stats.tools_dropped) == (2, 1)
+        assert stats.tokens_saved > 0
+
+    def test_get_tools_json_validates_format(self, fastn_env) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = FastnClient(config_path=fastn_env(tmpdir, connectors=_SLACK))
+            with pytest.raises(ValueError, match="Unsupported format"):
+                client.get_tools_json("slack", format="cohere")
+
+    async def test_async_get_tools_json(self, fastn_env) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = AsyncFastnClient(config_path=fastn_env(tmpdir, connectors=_SLACK))
+            encoded = await client.get_tools_json("send a message", mode="local")
+            await client.close()
+        assert json.loads(encoded)[0]["function"]["name"] == "send_message"
@@ -0,0 +1,233 @@
+"""Tests for GraphQL request batching (fastn._gql_batch)."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import re
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
+
+import httpx
+import pytest
+
+from fastn import _gql_batch, _queries
+from fastn._gql_batch import _merge, _operation
+from fastn.client import AsyncFastnClient, FastnClient
+from fastn.exceptions import APIError
+
+_FIELDS: Dict[str, Any] = {
+    "widgetMetadata": {"showLabels": True},
+    "listUCLAgents": [{"id": "skill_1"}],
+    "apis": {"edges": [{"node": {"id": "flow_1", "name": "Daily report"}}]},
+    "saveWidgetMetadata": {"showLabels": False},
+}
+_TOP_LEVEL = re.compile(r"(?:(\w+):)?(" + "|".join(_FIELDS) + r")\(")
+
+
+class _GqlServer:
+    """Answers any mix of known top-level fields, aliased or not."""
+
+    def __init__(self, fail: Any = (), null_data: bool = False, status: int = 200) -> None:
+        self.fail = set(fail)
+        self.null_data = null_data
+        self.status = status
+        self.bodies: List[Dict[str, Any]] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        self.bodies.append(body)
+        fields = _TOP_LEVEL.findall(body["query"])
+        if self.status != 200 and len(fields) > 1:
+            return httpx.Response(self.status, json={"errors": [{"message": "invalid"}]})
+        data: Dict[str, Any] = {}
+        errors = []
+        for alias, field in fields:
+            key = alias or field
+            if field in self.fail:
+                data[key] = None
+                errors.append({"message": f"{field} failed", "path": [key]})
+            else:
+                data[key] = _FIELDS[field]
+        if errors and self.null_data:
+            data = None
+        reply: Dict[str, Any] = {"data": data}
+        if errors:
+            reply["errors"] = errors
+        return httpx.Response(200, json=reply)
+
+
+def _client(config_path: str, server: _GqlServer, **kwargs: Any) -> FastnClient:
+    return FastnClient(
+        config_path=config_path, transport=httpx.MockTransport(server), **kwargs,
+    )
+
+
+class TestMerge:
+    def test_aliases_fields_and_prefixes_variables(self) -> None:
+        merged = _merge((_queries.LIST_SKILLS_QUERY, _queries.LIST_SKILLS_QUERY))
+        assert merged.startswith(
+            "query($b0_input:ListUCLAgentsInput!$b1_input:ListUCLAgentsInput!)"
+            "{b0_listUCLAgents:listUCLAgents(input:$b0_input){"
+        )
+        assert "b1_listUCLAgents:listUCLAgents(input:$b1_input){" in merged
+
+    def test_only_plain_queries_are_mergeable(self) -> None:
+        assert _operation(_queries.GET_FLOW_QUERY) is not None
+        assert _operation(_queries.SAVE_KIT_METADATA_MUTATION) is None
+        assert _operation("query A{a}fragment F on T{id}") is None
+        assert _operation("{...F}") is None
+
+    def test_caches_are_bounded_under_concurrent_use(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(_gql_batch, "_operations", {})
+        monkeypatch.setattr(_gql_batch, "_merged", {})
+        monkeypatch.setattr(_gql_batch, "_OPERATION_CACHE_SIZE", 4)
+        monkeypatch.setattr(_gql_batch, "_MERGED_CACHE_SIZE", 4)
+
+        def work(worker: int) -> None:
+            for i in range(200):
+                query = f"query{{w{worker}_{i}:a}}"
+                _merge((query, _queries.LIST_SKILLS_QUERY))
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(work, range(8)))
+        assert len(_gql_batch._operations) <= 4 + 8
+        assert len(_gql_batch._merged) <= 4 + 8
+
+
+class TestSyncBatch:
+    def test_submitted_queries_share_one_request(self, fastn_env) -> None:
+        server = _GqlServer()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = _client(fastn_env(tmpdir), server)
+            with client.batch(window=5.0) as batch:
+                kit = batch.submit(client.kit.get)
+                skills = batch.submit(client.skills.list)
+                flows = batch.submit(client.flows.list)
+
+        assert len(server.bodies) == 1
+        assert set(server.bodies[0]["variables"]) == {"b0_input", "b1_input", "b2_input"}
+        assert kit.result() == {"showLabels": True}
+        assert skills.result() == [{"id": "skill_1"}]
+        assert [f["flow_id"] for f in flows.result()] == ["flow_1"]
+
+    def test_waiting_on_a_future_inside_the_block_runs_it(self, fastn_env) -> None:
+        server = _GqlServer()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = _client(fastn_env(tmpdir), server)
+            with client.batch() as batch:
+                skills = batch.submit(client.skills.list)
+                assert skills.result() == [{"id": "skill_1"}]
+        assert len(server.bodies) == 1
+
+    def test_errors_stay_with_their_operation(self, fastn_env) -> None:
+        server = _GqlServer(fail={"listUCLAgents"})
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = _client(fastn_env(tmpdir), server)
+            with client.batch() as batch:
+                kit = batch.submit(client.kit.get)
+                skills = batch.submit(client.skills.list)
+
+        assert len(server.bodies) == 1
+        assert kit.result() == {"showLabels": True}
+        with pytest.raises(APIError, match="listUCLAgents failed"):
+            skills.result()
+
+    def test_nulled_data_resends_the_other_operations(self, fastn_env) -> None:
+        server = _GqlServer(fail={"listUCLAgents"}, null_data=True)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = _client(fastn_env(tmpdir), server)
+            with client.batch() as batch:
+                kit = batch.submit(client.kit.get)
+                skills = batch.submit(client.skills.list)
+
+        assert len(server.bodies) == 2
+        assert "b0_" not in server.bodies[1]["query"]
+        assert kit.result() == {"showLabels": True}
+        with pytest.raises(APIError, match="listUCLAgents failed"):
+            skills.result()
+
+    def test_rejected_document_falls_back_to_single_requests(self, fastn_env) -> None:
+        server = _GqlServer(status=400)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = _client(fastn_env(tmpdir), server)
+            with client.batch() as batch:
+                kit = batch.submit(client.kit.get)
+                skills = batch.submit(client.skills.list)
+
+        assert len(server.bodies) == 3
+        assert kit.result() == {"showLabels": True}
+        assert skills.result() == [{"id": "skill_1"}]
+
+    def test_mutations_are_sent_on_their_own(self, fastn_env) -> None:
+        server = _GqlServer()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = _client(fastn_env(tmpdir), server)
+            with client.batch() as batch:
+                saved = batch.submit(client.kit.update, {"showLabels": False})
+                batch.submit(client.skills.list)
+                batch.submit(client.kit.get)
+
+        assert saved.result() == {"showLabels": False}
+        assert sorted(len(_TOP_LEVEL.findall(b["query"])) for b in server.bodies) == [1, 2]
+
+    def test_window_merges_queries_from_threads(self, fastn_env) -> None:
+        server = _GqlServer()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = _client(fastn_env(tmpdir), server, graphql_batch_window=0.3)
+            with ThreadPoolExecutor(max_workers=3) as pool:
+                results = list(pool.map(lambda f: f(), [client.kit.get, client.skills.list]))
+
+        assert len(server.bodies) == 1
+        assert results == [{"showLabels": True}, [{"id": "skill_1"}]]
+
+    def test_no_batching_by_default(self, fastn_env) -> None:
+        server = _GqlServer()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = _client(fastn_env(tmpdir), server)
+            client.kit.get()
+            client.skills.list()
+        assert len(server.bodies) == 2
+        assert client._batch_window() is None
+
+
+class TestAsyncBatch:
+    async def test_gathered_queries_share_one_request(self, fastn_env) -> None:
+        server = _GqlServer(fail={"apis"})
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            return server(request)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = AsyncFastnClient(
+                config_path=fastn_env(tmpdir), transport=httpx.MockTransport(handler),
+            )
+            async with client.batch():
+                kit, skills, flows = await asyncio.gather(
+                    client.kit.get(), client.skills.list(), client.flows.list(),
+                    return_exceptions=True,
+                )
+            await client.close()
+
+        assert len(server.bodies) == 1
+        assert kit == {"showLabels": True}
+        assert skills == [{"id": "skill_1"}]
+        assert isinstance(flows, APIError)
+        assert client._batch_scopes == []
+
+    async def test_sequential_awaits_are_not_delayed(self, fastn_env) -> None:
+        server = _GqlServer()
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            return server(request)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = AsyncFastnClient(
+                config_path=fastn_env(tmpdir), transport=httpx.MockTransport(handler),
+            )
+            with client.batch():
+                assert await client.skills.list() == [{"id": "skill_1"}]
+                assert await client.kit.get() == {"showLabels": True}
+            await client.close()
+        assert len(server.bodies) == 2
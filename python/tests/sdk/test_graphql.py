@@ -0,0 +1,175 @@
+"""Tests for GraphQL document minification and persisted queries (fastn._graphql)."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+import httpx
+import pytest
+
+from fastn import _graphql, _queries
+from fastn._graphql import _document, _minify
+from fastn.client import AsyncFastnClient, FastnClient
+
+# Reference lexer: punctuators, names/numbers, strings. Whitespace,
+# commas and comments are insignificant.
+_TOKEN = re.compile(r'"""(?:\\"""|[^"]|"(?!""))*"""|"(?:\\.|[^"\\])*"|\.\.\.|[A-Za-z0-9_]+|[^\s,#]|#[^\n]*')
+
+
+def _tokens(document: str) -> List[str]:
+    return [t for t in _TOKEN.findall(document) if not t.startswith("#")]
+
+
+_DOCUMENTS = [name for name in dir(_queries) if name.endswith(("_QUERY", "_MUTATION"))]
+
+
+class TestMinify:
+    @pytest.mark.parametrize("name", _DOCUMENTS)
+    def test_preserves_tokens(self, name: str) -> None:
+        source = getattr(_queries, name)
+        minified = _minify(source)
+        assert _tokens(minified) == _tokens(source)
+        assert _minify(minified) == minified
+
+    def test_strings_comments_and_spacing(self) -> None:
+        source = '''
+        # leading comment
+        query q($a: Int = 1, $b: [String!]) {
+          f(s: "a  b, # not a comment", t: """ x "quoted" """) { ...Frag ... on T { id } }
+          g(n: 1 , m: 2, r: 1 ...on)
+        }
+        '''
+        assert _minify(source) == (
+            'query q($a:Int=1$b:[String!]){f(s:"a  b, # not a comment"'
+            't:""" x "quoted" """){...Frag...on T{id}}g(n:1 m:2 r:1 ...on)}'
+        )
+
+    def test_get_flow_query_shrinks(self) -> None:
+        doc = _document(_queries.GET_FLOW_QUERY)
+        assert len(doc.text) < len(_queries.GET_FLOW_QUERY) * 0.6
+        assert doc.sha256 == hashlib.sha256(doc.text.encode()).hexdigest()
+        assert _document(_queries.GET_FLOW_QUERY) is doc
+
+    def test_document_cache_is_bounded(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        # Merged batch documents vary with every combination of queries.
+        monkeypatch.setattr(_graphql, "_documents", {})
+        monkeypatch.setattr(_graphql, "_DOCUMENT_CACHE_SIZE", 8)
+        for i in range(20):
+            _document(f"query q{i} {{ a{i} }}")
+        assert len(_graphql._documents) == 8
+        assert "query q19 { a19 }" in _graphql._documents
+        assert "query q0 { a0 }" not in _graphql._documents
+
+    def test_document_cache_evicts_safely_across_threads(
+        self, monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(_graphql, "_documents", {})
+        monkeypatch.setattr(_graphql, "_DOCUMENT_CACHE_SIZE", 4)
+
+        def work(worker: int) -> None:
+            for i in range(500):
+                _document(f"query q{worker}_{i} {{ a }}")
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(work, range(8)))
+        assert len(_graphql._documents) <= 4 + 8
+
+
+class _ApqServer:
+    """Stand-in GraphQL server with an APQ store."""
+
+    def __init__(self, supported: bool = True) -> None:
+        self.supported = supported
+        self.store = {}
+        self.bodies: List[dict] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        self.bodies.append(body)
+        apq = body.get("extensions", {}).get("persistedQuery")
+        if apq and not self.supported:
+            return httpx.Response(200, json={"errors": [{"message": "PersistedQueryNotSupported"}]})
+        if apq and "query" not in body:
+            if apq["sha256Hash"] not in self.store:
+                return httpx.Response(200, json={"errors": [{"message": "PersistedQueryNotFound"}]})
+        elif apq:
+            self.store[apq["sha256Hash"]] = body["query"]
+        return httpx.Response(200, json={"data": {"listUCLAgents": []}})
+
+
+class TestPersistedQueries:
+    def test_default_sends_minified_text(self, fastn_env) -> None:
+        server = _ApqServer()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = FastnClient(config_path=fastn_env(tmpdir), transport=httpx.MockTransport(server))
+            client.skills.list()
+        assert server.bodies[0]["query"] == _document(_queries.LIST_SKILLS_QUERY).text
+        assert "extensions" not in server.bodies[0]
+
+    def test_hash_then_register_then_hash_only(self, fastn_env) -> None:
+        server = _ApqServer()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = FastnClient(
+                config_path=fastn_env(tmpdir), persisted_queries=True,
+                transport=httpx.MockTransport(server),
+            )
+            assert client.skills.list() == []
+            assert client.skills.list() == []
+
+        assert ["query" in b for b in server.bodies] == [False, True, False]
+        assert server.store == {
+            _document(_queries.LIST_SKILLS_QUERY).sha256: _document(_queries.LIST_SKILLS_QUERY).text,
+        }
+
+    def test_unsupported_server_falls_back_for_good(self, fastn_env) -> None:
+        server = _ApqServer(supported=False)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = FastnClient(
+                config_path=fastn_env(tmpdir), persisted_queries=True,
+                transport=httpx.MockTransport(server),
+            )
+            assert client.skills.list() == []
+            assert client.skills.list() == []
+
+        assert [sorted(b) for b in server.bodies] == [
+            ["extensions", "variables"], ["query", "variables"], ["query", "variables"],
+        ]
+        assert client._persisted_queries is False
+
+    async def test_async_hash_then_register(self, fastn_env) -> None:
+        server = _ApqServer()
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            return server(request)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = AsyncFastnClient(
+                config_path=fastn_env(tmpdir), persisted_queries=True,
+                transport=httpx.MockTransport(handler),
+            )
+            assert await client.skills.list() == []
+            assert await client.skills.list() == []
+            await client.close()
+        assert ["query" in b for b in server.bodies] == [False, True, False]
+
+    def test_marker_in_data_is_not_a_miss(self, fastn_env) -> None:
+        bodies = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            bodies.append(json.loads(request.content))
+            return httpx.Response(200, json={"data": {"listUCLAgents": [
+                {"id": "s", "name": "PersistedQueryNotFound"},
+            ]}})
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = FastnClient(
+                config_path=fastn_env(tmpdir), persisted_queries=True,
+                transport=httpx.MockTransport(handler),
+            )
+            client.skills.list()
+        assert len(bodies) == 1
@@ -0,0 +1,73 @@
+"""Import-time regression tests for ``import fastn``."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+import tempfile
+
+from fastn.client import AsyncFastnClient, FastnClient
+
+# Modules that must not load until a control-plane namespace is used.
+_LAZY_MODULES = {
+    "fastn._queries", "fastn._flows", "fastn._kit", "fastn._auth_ns",
+    "fastn._projects", "fastn._skills", "fastn._catalog",
+}
+
+# Budget for fastn's own modules (self time, excluding httpx and the
+# standard library). They take ~40 ms today; the budget leaves room for
+# slow CI machines while catching a large eager import creeping back in.
+_FASTN_SELF_TIME_BUDGET_US = 150_000
+
+
+def _run(code: str, *flags: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code],
+        capture_output=True, text=True, check=True,
+    )
+
+
+def _fastn_self_time_us() -> int:
+    """Sum the ``-X importtime`` self times of fastn.* modules."""
+    stderr = _run("import fastn", "-X", "importtime").stderr
+    total = 0
+    for line in stderr.splitlines():
+        parts = line.split("|")
+        if len(parts) == 3 and parts[2].strip().startswith("fastn"):
+            total += int(parts[0].split(":")[1])
+    return total
+
+
+class TestImportFastn:
+    def test_control_plane_modules_not_imported(self) -> None:
+        out = _run("import fastn, sys, json; print(json.dumps(sorted(sys.modules)))").stdout
+        loaded = set(json.loads(out))
+        assert "fastn.client" in loaded
+        assert not (_LAZY_MODULES & loaded)
+
+    def test_self_time_within_budget(self) -> None:
+        best = min(_fastn_self_time_us() for _ in range(3))
+        assert best < _FASTN_SELF_TIME_BUDGET_US, f"fastn import took {best / 1000:.1f} ms"
+
+    def test_old_query_imports_still_work(self) -> None:
+        from fastn import _queries
+        from fastn._constants import GET_FLOW_QUERY, LIST_SKILLS_QUERY
+
+        assert GET_FLOW_QUERY is _queries.GET_FLOW_QUERY
+        assert "listUCLAgents" in LIST_SKILLS_QUERY
+
+
+class TestLazyNamespaces:
+    def test_built_once_per_client(self, fastn_env) -> None:
+        from fastn._flows import _FlowsAsync, _FlowsSync
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            sync = FastnClient(config_path=fastn_env(tmpdir))
+            async_client = AsyncFastnClient(config_path=str(sync._fastn_dir / "config.json"))
+
+        assert "flows" not in vars(sync)
+        assert isinstance(sync.flows, _FlowsSync)
+        assert sync.flows is sync.flows
+        assert isinstance(async_client.flows, _FlowsAsync)
+        assert sync.flows._client is sync
@@ -0,0 +1,123 @@
+"""Tests for request instrumentation hooks (fastn.instrumentation)."""
+
+from __future__ import annotations
+
+import logging
+import tempfile
+from typing import Any, List
+
+from pytest_httpx import HTTPXMock
+
+from fastn import Instrumentation, LoggingInstrumentation
+from fastn._constants import GRAPHQL_URL
+from fastn.client import AsyncFastnClient, FastnClient
+
+_EXECUTE_URL = "https://live.fastn.ai/api/ucl/executeTool"
+
+
+class _Recorder(Instrumentation):
+    def __init__(self) -> None:
+        self.events: List[Any] = []
+
+    def on_request(self, method, url, headers, payload) -> None:
+        self.events.append(("request", method, url, dict(headers), payload))
+
+    def on_response(self, method, url, response, elapsed) -> None:
+        self.events.append(("response", method, url, response.status_code, elapsed))
+
+
+class TestHooks:
+    def test_no_sink_by_default(self, fastn_env) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = FastnClient(config_path=fastn_env(tmpdir))
+            assert client._instrumentation is None
+
+    def test_execute_reports_request_and_response(self, httpx_mock: HTTPXMock, fastn_env) -> None:
+        httpx_mock.add_response(url=_EXECUTE_URL, json={"ok": True})
+        recorder = _Recorder()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = FastnClient(
+                config_path=fastn_env(tmpdir), max_retries=0,
+                instrumentation=recorder,
+            )
+            client.execute("act_x", {"a": 1}, tenant_id="acme")
+
+        assert [e[0] for e in recorder.events] == ["request", "response"]
+        _, method, url, headers, payload = recorder.events[0]
+        assert (method, url) == ("POST", _EXECUTE_URL)
+        assert headers["x-fastn-space-tenantid"] == "acme"
+        assert payload["input"]["toolId"] == "act_x"
+        _, _, _, status, elapsed = recorder.events[1]
+        assert status == 200
+        assert elapsed >= 0
+
+    def test_gql_call_reports(self, httpx_mock: HTTPXMock, fastn_env) -> None:
+        httpx_mock.add_response(url=GRAPHQL_URL, json={"data": {"listUCLAgents": []}})
+        recorder = _Recorder()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = FastnClient(config_path=fastn_env(tmpdir), instrumentation=recorder)
+            client.skills.list()
+
+        assert recorder.events[0][2] == GRAPHQL_URL
+        assert "query" in recorder.events[0][4]
+
+    async def test_async_client_reports(self, httpx_mock: HTTPXMock, fastn_env) -> None:
+        httpx_mock.add_response(url=_EXECUTE_URL, json={"ok": True})
+        recorder = _Recorder()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = AsyncFastnClient(
+                config_path=fastn_env(tmpdir), max_retries=0,
+                instrumentation=recorder,
+            )
+            await client.execute("act_x", {})
+            await client.close()
+
+        assert [e[0] for e in recorder.events] == ["request", "response"]
+
+
+class TestVerbose:
+    def test_verbose_prints_redacted_request(self, httpx_mock: HTTPXMock, capsys, fastn_env) -> None:
+        httpx_mock.add_response(url=_EXECUTE_URL, json={"ok": True})
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = FastnClient(config_path=fastn_env(tmpdir), max_retries=0, verbose=True)
+            client.execute("act_x", {})
+
+        out = capsys.readouterr().out
+        assert f"[fastn] POST {_EXECUTE_URL}" in out
+        assert "Response 200" in out
+        assert "test-api-key-that-is-long-enough" not in out
+
+    def test_verbose_and_custom_sink_both_run(self, httpx_mock: HTTPXMock, capsys, fastn_env) -> None:
+        httpx_mock.add_response(url=_EXECUTE_URL, json={"ok": True})
+        recorder = _Recorder()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = FastnClient(
+                config_path=fastn_env(tmpdir), max_retries=0,
+                verbose=True, instrumentation=recorder,
+            )
+            client.execute("act_x", {})
+
+        assert "Response 200" in capsys.readouterr().out
+        assert len(recorder.events) == 2
+
+
+class _Exploding:
+    """Payload value that fails the test if anything tries to serialize it."""
+
+    def __str__(self) -> str:
+        raise AssertionError("payload was serialized while logging was disabled")
+
+
+class TestLoggingInstrumentation:
+    def test_skips_serialization_when_disabled(self) -> None:
+        logger = logging.getLogger("fastn.test.disabled")
+        logger.setLevel(logging.WARNING)
+        sink = LoggingInstrumentation(logger)
+        sink.on_request("POST", "https://x", {}, {"value": _Exploding()})
+
+    def test_logs_when_enabled(self, caplog) -> None:
+        sink = LoggingInstrumentation(logging.getLogger("fastn.test.enabled"))
+        with caplog.at_level(logging.DEBUG, logger="fastn.test.enabled"):
+            sink.on_request("POST", "https://x", {"Authorization": "Bearer " + "t" * 40}, {"a": 1})
+        assert "POST https://x" in caplog.text
+        assert "t" * 40 not in caplog.text
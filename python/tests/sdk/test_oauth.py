@@ -20,7 +20,9 @@ from fastn.oauth import (
     is_token_expired,
     poll_for_token,
     refresh_access_token,
+    refresh_access_token_async,
     request_device_code,
+    seconds_until_expiry,
 )
 
 
@@ -212,6 +214,19 @@ class TestRefreshAccessToken:
         with pytest.raises(OAuthError, match="Session expired"):
             refresh_access_token("expired_rt")
 
+    async def test_async_success(self, httpx_mock: HTTPXMock) -> None:
+        httpx_mock.add_response(
+            url=TOKEN_URL,
+            method="POST",
+            json={"access_token": "new_at", "expires_in": 300},
+        )
+
+        result = await refresh_access_token_async("old_rt")
+        assert result.access_token == "new_at"
+        # Keycloak may omit a rotated refresh token
+        assert result.refresh_token == "old_rt"
+        assert "refresh_token=old_rt" in httpx_mock.get_request().content.decode()
+
 
 def _make_test_jwt(payload: dict) -> str:
     """Create a fake JWT with the given payload (no signature verification)."""
@@ -319,6 +334,11 @@ class TestTokenExpiry:
         diff = (expiry - now).total_seconds()
         assert 3590 < diff < 3610
 
+    def test_seconds_until_expiry(self) -> None:
+        future = (datetime.now(timezone.utc) + timedelta(seconds=90)).isoformat()
+        assert 85 < seconds_until_expiry(future) <= 90
+        assert seconds_until_expiry("not-a-date") == 0.0
+
 
 class TestOAuthError:
     def test_with_error_code(self) -> None:
@@ -0,0 +1,268 @@
+"""Tests for paged iteration over flows, kit connectors and connectors (fastn._pages)."""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import gc
+import json
+import tempfile
+import threading
+import time
+from typing import Any, Dict, List
+
+import httpx
+import pytest
+
+from fastn._constants import CONNECTOR_LIST_STALE_TTL, CONNECTOR_LIST_TTL
+from fastn._pages import _iter_pages_async
+from fastn.client import AsyncFastnClient, FastnClient
+from fastn.exceptions import APIError
+
+
+def _flow(i: int) -> Dict[str, Any]:
+    return {"id": f"flow_{i}", "name": f"Flow {i}", "status": "DEPLOYED" if i % 2 else "DRAFT"}
+
+
+class _ListServer:
+    """Serves ``apis``, ``widgetConnectors`` and ``searchDataSourceGroups`` by offset."""
+
+    def __init__(self, flows: int = 0, kit: int = 0, scopes: Any = None) -> None:
+        self.flows = [_flow(i) for i in range(flows)]
+        self.kit = [{"id": f"kit_{i}"} for i in range(kit)]
+        self.scopes: Dict[str, List[str]] = scopes or {}
+        self.pages: List[Any] = []
+        self.lock = threading.Lock()
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        variables = body["variables"]["input"]
+        window = json.loads(variables["query"])["input"]
+        offset, limit = window["offset"], window["limit"]
+        with self.lock:
+            self.pages.append((variables.get("clientId") or "kit", offset, limit))
+        if "apis(" in body["query"]:
+            edges = [{"node": f} for f in self.flows[offset:offset + limit]]
+            return httpx.Response(200, json={"data": {"apis": {
+                "pageInfo": {"totalCount": len(self.flows)}, "edges": edges,
+            }}})
+        if "widgetConnectors(" in body["query"]:
+            edges = [{"node": c} for c in self.kit[offset:offset + limit]]
+            return httpx.Response(200, json={"data": {"widgetConnectors": {
+                "pageInfo": {"hasNextPage": offset + limit < len(self.kit)}, "edges": edges,
+            }}})
+        names = self.scopes[variables["clientId"]]
+        edges = [{"node": {"id": n, "name": n}} for n in names[offset:offset + limit]]
+        return httpx.Response(200, json={"data": {"searchDataSourceGroups": {
+            "pageInfo": {"totalCount": len(names)}, "edges": edges,
+        }}})
+
+
+@pytest.fixture
+def fastn_env(fastn_env):
+    """The shared factory, for workspace "ws" (the key ``_ListServer`` scopes use)."""
+    return functools.partial(fastn_env, project_id="ws")
+
+
+def _wait_for(condition: Any, timeout: float = 2.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.005)
+    return True
+
+
+class TestSyncIterators:
+    def test_flows_iter_pages_through_everything(self, fastn_env) -> None:
+        server = _ListServer(flows=5)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = FastnClient(config_path=fastn_env(tmpdir), transport=httpx.MockTransport(server))
+            flows = [f["flow_id"] for f in client.flows.iter(page_size=2)]
+
+        assert flows == [f"flow_{i}" for i in range(5)]
+        assert [offset for _, offset, _ in server.pages] == [0, 2, 4]
+
+    def test_next_page_is_prefetched(self, fastn_env) -> None:
+        server = _ListServer(flows=6)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = FastnClient(config_path=fastn_env(tmpdir), transport=httpx.MockTransport(server))
+            flows = client.flows.iter(page_size=2)
+            next(flows)
+            assert _wait_for(lambda: len(server.pages) == 2)
+            flows.close()
+        assert len(server.pages) == 2
+
+    def test_status_filter_keeps_paging_by_raw_offset(self, fastn_env) -> None:
+        server = _ListServer(flows=5)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = FastnClient(config_path=fastn_env(tmpdir), transport=httpx.MockTransport(server))
+            deployed = [f["flow_id"] for f in client.flows.iter(status="DEPLOYED", page_size=2)]
+        assert deployed == ["flow_1", "flow_3"]
+        assert [offset for _, offset, _ in server.pages] == [0, 2, 4]
+
+    def test_list_is_no_longer_truncated(self, fastn_env) -> None:
+        server = _ListServer(flows=501)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = FastnClient(config_path=fastn_env(tmpdir), transport=httpx.MockTransport(server))
+            assert len(client.flows.list()) == 501
+        assert server.pages == [("ws", 0, 500), ("ws", 500, 500)]
+
+    def test_kit_iter_follows_has_next_page(self, fastn_env) -> None:
+        server = _ListServer(kit=5)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = FastnClient(config_path=fastn_env(tmpdir), transport=httpx.MockTransport(server))
+            ids = [c["id"] for c in client.kit.iter(page_size=3)]
+            assert [c["id"] for c in client.kit.list(limit=2, offset=1)] == ["kit_1", "kit_2"]
+        assert ids == [f"kit_{i}" for i in range(5)]
+
+    def test_invalid_page_size(self, fastn_env) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = FastnClient(config_path=fastn_env(tmpdir))
+            with pytest.raises(ValueError, match="page_size"):
+                client.flows.iter(page_size=0)
+
+
+class TestAsyncIterators:
+    def _client(self, config_path: str, server: _ListServer) -> AsyncFastnClient:
+        async def handler(request: httpx.Request) -> httpx.Response:
+            return server(request)
+
+        return AsyncFastnClient(
+            config_path=config_path, transport=httpx.MockTransport(handler),
+        )
+
+    async def test_flows_iter(self, fastn_env) -> None:
+        server = _ListServer(flows=5)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = self._client(fastn_env(tmpdir), server)
+            flows = [f["flow_id"] async for f in client.flows.iter(page_size=2)]
+            await client.close()
+        assert flows == [f"flow_{i}" for i in range(5)]
+        assert [offset for _, offset, _ in server.pages] == [0, 2, 4]
+
+    async def test_connectors_iter_pages_each_scope_and_dedupes(self, fastn_env) -> None:
+        server = _ListServer(scopes={
+            "ws": ["slack", "jira", "custom"],
+            "community": ["github", "slack", "notion", "jira", "linear"],
+        })
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = self._client(fastn_env(tmpdir), server)
+            names = [c["name"] async for c in client.connectors.iter(page_size=2)]
+            listed = [c["name"] for c in await client.connectors.list()]
+            await client.close()
+
+        assert names == ["slack", "jira", "custom", "github", "notion", "linear"]
+        assert listed == names
+        assert server.pages[:5] == [
+            ("ws", 0, 2), ("ws", 2, 2),
+            ("community", 0, 2), ("community", 2, 2), ("community", 4, 2),
+        ]
+
+    async def test_failed_prefetch_is_not_reported_as_unretrieved(self) -> None:
+        async def fetch(offset: int) -> Any:
+            if not offset:
+                return ["a", "b"], 2
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                raise APIError("page 2 aborted") from None
+
+        errors: List[Dict[str, Any]] = []
+        loop = asyncio.get_running_loop()
+        loop.set_exception_handler(lambda _, context: errors.append(context))
+        try:
+            pages = _iter_pages_async(fetch)
+            assert await pages.__anext__() == "a"
+            await asyncio.sleep(0)  # the prefetch is now in flight
+            await pages.aclose()
+            del pages
+            for _ in range(3):
+                await asyncio.sleep(0)
+            gc.collect()
+        finally:
+            loop.set_exception_handler(None)
+        assert errors == []
+
+
+class TestAsyncConnectorListing:
+    @staticmethod
+    def _server() -> _ListServer:
+        return _ListServer(scopes={"ws": ["slack", "custom"], "community": ["github", "slack"]})
+
+    def _client(self, config_path: str, server: _ListServer, fail: str = "") -> AsyncFastnClient:
+        in_flight = [0]
+        server.peak = 0  # type: ignore[attr-defined]
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            in_flight[0] += 1
+            server.peak = max(server.peak, in_flight[0])  # type: ignore[attr-defined]
+            await asyncio.sleep(0.02)
+            in_flight[0] -= 1
+            if fail and fail in request.content.decode():
+                return httpx.Response(500, json={"errors": [{"message": "down"}]})
+            return server(request)
+
+        return AsyncFastnClient(
+            config_path=config_path, transport=httpx.MockTransport(handler),
+        )
+
+    async def test_scopes_are_fetched_concurrently(self, fastn_env) -> None:
+        server = self._server()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = self._client(fastn_env(tmpdir), server)
+            names = [c["name"] for c in await client.connectors.list()]
+            await client.close()
+        assert names == ["slack", "custom", "github"]
+        assert server.peak == 2  # type: ignore[attr-defined]
+
+    async def test_listing_is_cached_then_revalidated(self, fastn_env) -> None:
+        server = self._server()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = self._client(fastn_env(tmpdir), server)
+            catalog = client.connectors
+            first = await catalog.list()
+            first[0]["name"] = "changed"
+            assert (await catalog.list())[0]["name"] == "slack"
+            assert len(server.pages) == 2
+
+            # Stale: served at once, refreshed in the background.
+            catalog._listed_at -= CONNECTOR_LIST_TTL
+            server.scopes["ws"] = ["slack", "custom", "jira"]
+            assert len(await catalog.list()) == 3
+            await catalog._refresh
+            assert len(server.pages) == 4
+            assert len(await catalog.list()) == 4
+
+            # Too old to serve: fetched before returning.
+            catalog._listed_at -= CONNECTOR_LIST_STALE_TTL
+            assert len(await catalog.list()) == 4
+            assert len(server.pages) == 6
+            await catalog.list(refresh=True)
+            assert len(server.pages) == 8
+            await client.close()
+
+    async def test_concurrent_first_calls_share_one_fetch(self, fastn_env) -> None:
+        server = self._server()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = self._client(fastn_env(tmpdir), server)
+            a, b = await asyncio.gather(client.connectors.list(), client.connectors.list())
+            await client.close()
+        assert a == b
+        assert len(server.pages) == 2
+
+    async def test_community_failure_is_ignored(self, fastn_env) -> None:
+        server = self._server()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = self._client(fastn_env(tmpdir), server, fail='"clientId":"community"')
+            names = [c["name"] for c in await client.connectors.list()]
+            await client.close()
+        assert names == ["slack", "custom"]
+
+    async def test_workspace_failure_raises(self, fastn_env) -> None:
+        server = self._server()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = self._client(fastn_env(tmpdir), server, fail='"clientId":"ws"')
+            with pytest.raises(APIError):
+                await client.connectors.list()
+            await client.close()
@@ -0,0 +1,88 @@
+"""Tests for compiled parameter-routing plans (fastn._params)."""
+
+from __future__ import annotations
+
+import logging
+
+import pytest
+
+from fastn import _params
+from fastn._params import _compile_plan, _plan_for
+from fastn.client import _build_params_from_schema
+
+
+def _obj(*fields: str) -> dict:
+    return {"type": "object", "properties": {f: {"type": "string"} for f in fields}}
+
+
+_MULTI = {
+    "inputSchema": {
+        "properties": {
+            "param": _obj("id", "shared"),
+            "body": _obj("text", "shared"),
+            "limit": {"type": "integer"},
+        },
+    },
+}
+
+
+class TestRouting:
+    def test_no_schema_wraps_in_body(self) -> None:
+        assert _build_params_from_schema({}, {"a": 1}) == {"body": {"a": 1}}
+        assert _build_params_from_schema({"inputSchema": {}}, {}) == {}
+
+    def test_flat_schema_passes_kwargs_through(self) -> None:
+        tool = {"inputSchema": {"properties": {"offset": {"type": "integer"}}}}
+        kwargs = {"offset": 5, "extra": 1}
+        assert _build_params_from_schema(tool, kwargs) is kwargs
+
+    def test_multi_wrapper(self) -> None:
+        result = _build_params_from_schema(
+            _MULTI, {"id": "x", "text": "hi", "limit": 3, "shared": True},
+        )
+        assert result == {
+            "param": {"id": "x", "shared": True},
+            "body": {"text": "hi", "shared": True},
+            "limit": 3,
+        }
+
+    def test_empty_groups_omitted(self) -> None:
+        assert _build_params_from_schema(_MULTI, {"limit": 1}) == {"limit": 1}
+
+    def test_unknown_kwargs_go_to_first_group(self, caplog) -> None:
+        with caplog.at_level(logging.DEBUG, logger="fastn"):
+            result = _build_params_from_schema(_MULTI, {"text": "hi", "mystery": 1})
+        assert result == {"body": {"text": "hi"}, "param": {"mystery": 1}}
+        assert "['mystery']" in caplog.text
+
+
+class TestPlanCache:
+    def test_compiled_once_per_schema(self, monkeypatch) -> None:
+        compiled = []
+        real = _params._compile_plan
+        monkeypatch.setattr(_params, "_plan_cache", {})
+        monkeypatch.setattr(_params, "_compile_plan", lambda s: compiled.append(s) or real(s))
+
+        schema = {"properties": {"body": _obj("text")}}
+        for _ in range(100):
+            _build_params_from_schema({"inputSchema": schema}, {"text": "x"})
+        assert compiled == [schema]
+
+        # An equal but distinct schema object gets its own plan.
+        _build_params_from_schema({"inputSchema": dict(schema)}, {"text": "x"})
+        assert len(compiled) == 2
+
+    def test_cache_is_bounded(self, monkeypatch) -> None:
+        monkeypatch.setattr(_params, "_plan_cache", {})
+        monkeypatch.setattr(_params, "_PLAN_CACHE_SIZE", 8)
+        schemas = [{"properties": {"body": _obj(f"f{i}")}} for i in range(20)]
+        for schema in schemas:
+            _plan_for(schema)
+        assert len(_params._plan_cache) == 8
+        assert _plan_for(schemas[-1]) is _params._plan_cache[id(schemas[-1])][1]
+
+    @pytest.mark.parametrize("props", [None, [], ["a", "b"]])
+    def test_tolerates_odd_inner_properties(self, props) -> None:
+        plan = _compile_plan({"properties": {"g": {"type": "object", "properties": props}}})
+        assert plan.fallback == "g"
+        assert set(plan.routes) == set(props or ())
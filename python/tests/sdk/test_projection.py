@@ -0,0 +1,177 @@
+"""Tests for filter pushdown and field projection in list queries."""
+
+from __future__ import annotations
+
+import json
+import tempfile
+from typing import Any, Dict, List
+
+import httpx
+import pytest
+
+from fastn._flows import _resolve_flow_id_async, _resolve_flow_id_sync
+from fastn._graphql import _minify, _project
+from fastn._queries import GET_KIT_CONNECTORS_QUERY, LIST_FLOWS_QUERY
+from fastn.client import AsyncFastnClient, FastnClient
+
+_NODES = [
+    {"id": "flow_1", "name": "Daily report", "status": "DEPLOYED", "description": "d",
+     "metaData": {"flowType": "API", "architecture": "x", "isAsync": False}},
+    {"id": "flow_2", "name": "Weekly report", "status": "DRAFT", "description": "d"},
+    {"id": "flow_3", "name": "Sync users", "status": "DEPLOYED", "description": "d"},
+]
+
+
+class _Server:
+    """Records each request and answers ``apis``/``widgetConnectors`` with ``_NODES``."""
+
+    def __init__(self) -> None:
+        self.bodies: List[Dict[str, Any]] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        self.bodies.append(body)
+        edges = [{"node": dict(n)} for n in _NODES]
+        field = "apis" if "apis(" in body["query"] else "widgetConnectors"
+        return httpx.Response(200, json={"data": {field: {
+            "pageInfo": {"totalCount": len(edges), "hasNextPage": False}, "edges": edges,
+        }}})
+
+    def search(self, i: int = 0) -> Dict[str, Any]:
+        return json.loads(self.bodies[i]["variables"]["input"]["query"])["input"]
+
+
+class _SearchMissServer(_Server):
+    """Like ``_Server``, but its name search never matches anything."""
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        response = super().__call__(request)
+        if self.search(len(self.bodies) - 1).get("query"):
+            return httpx.Response(200, json={"data": {"apis": {
+                "pageInfo": {"totalCount": 0, "hasNextPage": False}, "edges": [],
+            }}})
+        return response
+
+
+class TestProject:
+    def test_keeps_only_requested_node_fields(self) -> None:
+        query = _project(LIST_FLOWS_QUERY, ("apis", "edges", "node"), ("id", "name"))
+        assert "node{id name}" in query
+        assert "description" not in query
+        assert "pageInfo{" in query
+
+    def test_kept_fields_keep_their_selection(self) -> None:
+        query = _project(LIST_FLOWS_QUERY, ("apis", "edges", "node"), ("metaData",))
+        assert "node{metaData{" in query
+
+    def test_projection_shrinks_the_document(self) -> None:
+        query = _project(GET_KIT_CONNECTORS_QUERY, ("widgetConnectors", "edges", "node"), ("id",))
+        assert len(query) < len(_minify(GET_KIT_CONNECTORS_QUERY))
+
+    def test_unknown_field_and_path(self) -> None:
+        with pytest.raises(ValueError, match="nope"):
+            _project(LIST_FLOWS_QUERY, ("apis", "edges", "node"), ("nope",))
+        with pytest.raises(ValueError):
+            _project(LIST_FLOWS_QUERY, ("apis", "missing"), ("id",))
+        with pytest.raises(ValueError):
+            _project(LIST_FLOWS_QUERY, ("apis", "edges", "node"), ())
+
+
+class TestFlowsPushdown:
+    def test_filters_are_sent_with_the_query(self, fastn_env) -> None:
+        server = _Server()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = FastnClient(config_path=fastn_env(tmpdir), transport=httpx.MockTransport(server))
+            flows = client.flows.list(status="DEPLOYED", name="report")
+
+        assert [f["flow_id"] for f in flows] == ["flow_1"]
+        search = server.search()
+        assert search["filter"] == {"status": "DEPLOYED"}
+        assert search["query"] == "report"
+
+    def test_fields_trim_the_query_and_the_result(self, fastn_env) -> None:
+        server = _Server()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = FastnClient(config_path=fastn_env(tmpdir), transport=httpx.MockTransport(server))
+            flows = client.flows.list(fields=["flow_id", "name"])
+
+        assert flows[0] == {"flow_id": "flow_1", "name": "Daily report"}
+        query = server.bodies[0]["query"]
+        assert "node{id name}" in query
+        assert "metaData" not in query
+
+    def test_filter_fields_are_selected_even_when_not_returned(self, fastn_env) -> None:
+        server = _Server()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = FastnClient(config_path=fastn_env(tmpdir), transport=httpx.MockTransport(server))
+            flows = client.flows.list(status="DRAFT", fields=["flow_id"])
+
+        assert flows == [{"flow_id": "flow_2"}]
+        assert "node{id status}" in server.bodies[0]["query"]
+
+    def test_unknown_flow_field(self, fastn_env) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = FastnClient(config_path=fastn_env(tmpdir))
+            with pytest.raises(ValueError, match="Unknown flow fields: owner"):
+                client.flows.list(fields=["owner"])
+
+    async def test_async_list_with_fields(self, fastn_env) -> None:
+        server = _Server()
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            return server(request)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = AsyncFastnClient(
+                config_path=fastn_env(tmpdir), transport=httpx.MockTransport(handler),
+            )
+            flows = await client.flows.list(name="sync", fields=["name"])
+            await client.close()
+
+        assert flows == [{"name": "Sync users"}]
+        assert server.search()["query"] == "sync"
+
+
+class TestResolveFlowId:
+    def test_uses_the_name_search(self, fastn_env) -> None:
+        server = _Server()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = FastnClient(config_path=fastn_env(tmpdir), transport=httpx.MockTransport(server))
+            assert _resolve_flow_id_sync(client, "Sync users") == "flow_3"
+        assert len(server.bodies) == 1
+        assert server.search()["query"] == "Sync users"
+
+    def test_falls_back_to_a_full_scan(self, fastn_env) -> None:
+        server = _SearchMissServer()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = FastnClient(config_path=fastn_env(tmpdir), transport=httpx.MockTransport(server))
+            assert _resolve_flow_id_sync(client, "Sync users") == "flow_3"
+        assert len(server.bodies) == 2
+        assert server.search(1)["query"] == ""
+
+    async def test_async_falls_back_to_a_full_scan(self, fastn_env) -> None:
+        server = _SearchMissServer()
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            return server(request)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = AsyncFastnClient(
+                config_path=fastn_env(tmpdir), transport=httpx.MockTransport(handler),
+            )
+            assert await _resolve_flow_id_async(client, "Sync users") == "flow_3"
+            await client.close()
+        assert len(server.bodies) == 2
+
+
+class TestKitProjection:
+    def test_fields_trim_the_kit_query(self, fastn_env) -> None:
+        server = _Server()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = FastnClient(config_path=fastn_env(tmpdir), transport=httpx.MockTransport(server))
+            client.kit.list(query="slack", fields=["id", "name"])
+            list(client.kit.iter(fields=["id"]))
+
+        assert "node{id name}" in server.bodies[0]["query"]
+        assert "node{id}" in server.bodies[1]["query"]
+        assert server.search()["query"] == "slack"
@@ -0,0 +1,112 @@
+"""Tests for the memory-mapped binary registry (fastn._registry_bin)."""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from fastn import _registry_cache
+from fastn._registry_bin import REGISTRY_BIN_FILE, _LazyConnectors, open_registry_bin
+from fastn.client import FastnClient
+from fastn.config import load_registry, save_registry
+
+_REGISTRY = {
+    "version": "2025.02.14",
+    "connectors": {
+        "slack": {
+            "id": "conn_slack",
+            "display_name": "Slack",
+            "category": "communication",
+            "tools": {
+                "send_message": {
+                    "toolId": "act_slack_send",
+                    "inputSchema": {"properties": {"body": {
+                        "type": "object", "properties": {"text": {"type": "string"}},
+                    }}},
+                },
+            },
+        },
+        "jira": {"id": "conn_jira", "tools": {"create_issue": {"toolId": "act_jira"}}},
+    },
+}
+
+
+def _fastn_dir(tmpdir: str) -> Path:
+    fastn_dir = Path(tmpdir) / ".fastn"
+    fastn_dir.mkdir()
+    (fastn_dir / "config.json").write_text(json.dumps({
+        "api_key": "test-api-key-that-is-long-enough",
+        "project_id": "test-project-id",
+    }))
+    save_registry(_REGISTRY, fastn_dir)
+    return fastn_dir
+
+
+class TestRegistryBin:
+    def test_round_trip(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fastn_dir = _fastn_dir(tmpdir)
+            assert (fastn_dir / REGISTRY_BIN_FILE).exists()
+            registry = load_registry(fastn_dir, lazy=True)
+
+            connectors = registry["connectors"]
+            assert isinstance(connectors, _LazyConnectors)
+            assert registry["version"] == "2025.02.14"
+            assert list(connectors) == ["slack", "jira"]
+            assert dict(connectors) == _REGISTRY["connectors"]
+
+    def test_decodes_only_what_is_used(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            connectors = load_registry(_fastn_dir(tmpdir), lazy=True)["connectors"]
+            assert "jira" in connectors
+            assert connectors.summary("slack") == {
+                "display_name": "Slack", "category": "communication", "tool_count": 1,
+            }
+            assert connectors._decoded == {}
+            assert connectors["jira"] is connectors.get("jira")
+            assert list(connectors._decoded) == ["jira"]
+
+    def test_default_load_is_plain_json(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            registry = load_registry(_fastn_dir(tmpdir))
+            assert type(registry["connectors"]) is dict
+
+    def test_stale_bin_falls_back_to_json(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fastn_dir = _fastn_dir(tmpdir)
+            edited = dict(_REGISTRY, connectors={"github": {"tools": {}}})
+            (fastn_dir / "registry.json").write_text(json.dumps(edited, indent=2))
+
+            assert open_registry_bin(fastn_dir) is None
+            assert list(load_registry(fastn_dir, lazy=True)["connectors"]) == ["github"]
+
+    @pytest.mark.parametrize("content", [b"", b"FNRG\x09\x00\x00\x00\x00", b"{}"])
+    def test_corrupt_bin_is_ignored(self, content: bytes) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fastn_dir = _fastn_dir(tmpdir)
+            (fastn_dir / REGISTRY_BIN_FILE).write_bytes(content)
+            assert open_registry_bin(fastn_dir) is None
+            assert "slack" in load_registry(fastn_dir, lazy=True)["connectors"]
+
+    def test_bin_alone_is_a_full_registry(self) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fastn_dir = _fastn_dir(tmpdir)
+            os.remove(fastn_dir / "registry.json")
+            assert "slack" in load_registry(fastn_dir, lazy=True)["connectors"]
+
+
+class TestClientOnRegistryBin:
+    def test_client_reads_lazily(self, monkeypatch) -> None:
+        monkeypatch.setattr(_registry_cache, "_cache", {})
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fastn_dir = _fastn_dir(tmpdir)
+            client = FastnClient(config_path=str(fastn_dir / "config.json"))
+
+            assert [c["name"] for c in client.connectors.list()] == ["slack", "jira"]
+            assert client.slack._tools["send_message"]["toolId"] == "act_slack_send"
+            assert client.get_tool("slack", "send_message")["name"] == "send_message"
+            assert list(client._registry["connectors"]._decoded) == ["slack"]
@@ -0,0 +1,97 @@
+"""Tests for the process-wide registry cache (fastn._registry_cache)."""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import threading
+from pathlib import Path
+
+import pytest
+
+from fastn import _registry_cache
+from fastn.client import AsyncFastnClient, FastnClient
+
+_SLACK = {"slack": {"id": "c1", "tools": {"send_message": {"toolId": "a1"}}}}
+
+
+def _write_registry(fastn_dir: Path, connectors: dict) -> None:
+    path = fastn_dir / "registry.json"
+    path.write_text(json.dumps({"version": "1", "connectors": connectors}))
+    # Force a visible mtime change even on coarse-grained filesystems.
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+@pytest.fixture
+def parses(monkeypatch):
+    """Count registry loads done by the cache."""
+    monkeypatch.setattr(_registry_cache, "_cache", {})
+    calls = []
+    real = _registry_cache.load_registry
+
+    def counting_load(fastn_dir, lazy=False):
+        calls.append(str(fastn_dir / "registry.json"))
+        return real(fastn_dir, lazy=lazy)
+
+    monkeypatch.setattr(_registry_cache, "load_registry", counting_load)
+    return calls
+
+
+class TestSharedRegistry:
+    def test_construction_does_not_load(self, parses, fastn_env) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            FastnClient(config_path=fastn_env(tmpdir, connectors=_SLACK))
+        assert parses == []
+
+    def test_clients_share_one_parsed_copy(self, parses, fastn_env) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = fastn_env(tmpdir, connectors=_SLACK)
+            a = FastnClient(config_path=config_path)
+            b = AsyncFastnClient(config_path=config_path)
+            assert a.connectors.get("slack")["name"] == "slack"
+            assert "send_message" in dir(b.slack)
+            assert a._registry is b._registry
+        assert [Path(p).name for p in parses] == ["registry.json"]
+
+    def test_changed_file_is_reloaded(self, parses, fastn_env) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = fastn_env(tmpdir, connectors=_SLACK)
+            client = FastnClient(config_path=config_path)
+            before = client._registry
+
+            _write_registry(Path(config_path).parent, {"jira": {"id": "c2", "tools": {}}})
+            # Existing clients keep their snapshot until reload_registry().
+            assert client._registry is before
+            assert "jira" in FastnClient(config_path=config_path)._registry["connectors"]
+            client.reload_registry()
+            assert "jira" in client._registry["connectors"]
+        assert len(parses) == 2
+
+    def test_concurrent_first_use_parses_once(self, parses, fastn_env) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = fastn_env(tmpdir, connectors=_SLACK)
+            clients = [FastnClient(config_path=config_path) for _ in range(16)]
+            barrier = threading.Barrier(len(clients))
+            seen = []
+
+            def use(client: FastnClient) -> None:
+                barrier.wait()
+                seen.append(client._registry)
+
+            threads = [threading.Thread(target=use, args=(c,)) for c in clients]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+        assert len(parses) == 1
+        assert all(r is seen[0] for r in seen)
+
+    def test_missing_registry_is_empty(self, parses, fastn_env) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            config_path = fastn_env(tmpdir, connectors=_SLACK)
+            os.remove(Path(config_path).parent / "registry.json")
+            client = FastnClient(config_path=config_path)
+            assert client.connectors.list() == []
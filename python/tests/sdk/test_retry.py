@@ -0,0 +1,252 @@
+"""Tests for the shared retry policy (fastn.retry / fastn._http)."""
+
+from __future__ import annotations
+
+import tempfile
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from typing import Any, List
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from fastn import APIError, Instrumentation, RetryPolicy
+from fastn._constants import FLOWS_API_URL, GRAPHQL_URL
+from fastn.client import AsyncFastnClient, FastnClient
+from fastn.retry import _RetryBudget
+
+_EXECUTE_URL = "https://live.fastn.ai/api/ucl/executeTool"
+_RUN_URL = f"{FLOWS_API_URL}/get_run"
+
+# No sleeping in tests: decorrelated jitter between 0 and 0 is always 0.
+_FAST = RetryPolicy(max_retries=3, base_delay=0.0)
+
+
+class _RetryRecorder(Instrumentation):
+    def __init__(self) -> None:
+        self.retries: List[Any] = []
+
+    def on_retry(self, method, url, attempt, delay, reason) -> None:
+        self.retries.append((attempt, delay, reason))
+
+
+class TestRetryPolicy:
+    def test_jitter_stays_within_bounds(self) -> None:
+        policy = RetryPolicy(base_delay=0.5, max_delay=4.0)
+        previous = 0.0
+        for _ in range(50):
+            delay = policy.next_delay(previous)
+            assert 0.5 <= delay <= max(0.5, min(4.0, previous * 3))
+            previous = delay
+
+    def test_retry_after_seconds(self) -> None:
+        response = httpx.Response(429, headers={"Retry-After": "2"})
+        assert RetryPolicy().retry_after(response) == 2.0
+
+    def test_retry_after_http_date(self) -> None:
+        when = datetime.now(timezone.utc) + timedelta(seconds=30)
+        response = httpx.Response(503, headers={"Retry-After": format_datetime(when, usegmt=True)})
+        assert 25 < RetryPolicy().retry_after(response) <= 30
+
+    def test_retry_after_ignored_when_disabled(self) -> None:
+        response = httpx.Response(429, headers={"Retry-After": "2"})
+        assert RetryPolicy(respect_retry_after=False).retry_after(response) is None
+
+    def test_budget_limits_retries_to_ratio(self) -> None:
+        budget = _RetryBudget(RetryPolicy(budget_ratio=0.5, budget_reserve=1.0))
+        assert budget.withdraw() is True
+        assert budget.withdraw() is False
+        budget.deposit()
+        budget.deposit()
+        assert budget.withdraw() is True
+
+    def test_budget_disabled(self) -> None:
+        budget = _RetryBudget(RetryPolicy(budget_ratio=None, budget_reserve=0.0))
+        assert all(budget.withdraw() for _ in range(100))
+
+
+class TestSyncRetries:
+    def test_get_run_retries_503(self, httpx_mock: HTTPXMock, fastn_env) -> None:
+        httpx_mock.add_response(url=_RUN_URL, status_code=503)
+        httpx_mock.add_response(url=_RUN_URL, json={"status": "SUCCESS"})
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = FastnClient(config_path=fastn_env(tmpdir), retry_policy=_FAST)
+            assert client.flows.get_run("run-1") == {"status": "SUCCESS"}
+
+    def test_graphql_retries_connection_error(self, httpx_mock: HTTPXMock, fastn_env) -> None:
+        httpx_mock.add_exception(httpx.ConnectError("refused"), url=GRAPHQL_URL)
+        httpx_mock.add_response(url=GRAPHQL_URL, json={"data": {"listUCLAgents": []}})
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = FastnClient(config_path=fastn_env(tmpdir), retry_policy=_FAST)
+            client.skills.list()
+        assert len(httpx_mock.get_requests()) == 2
+
+    def test_api_call_retries_pool_timeout(self, httpx_mock: HTTPXMock, fastn_env) -> None:
+        httpx_mock.add_exception(httpx.PoolTimeout("pool full"), url=_RUN_URL)
+        httpx_mock.add_response(url=_RUN_URL, json={"status": "SUCCESS"})
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = FastnClient(config_path=fastn_env(tmpdir), retry_policy=_FAST)
+            client.flows.get_run("run-1")
+        assert len(httpx_mock.get_requests()) == 2
+
+    def test_500_is_not_retried(self, httpx_mock: HTTPXMock, fastn_env) -> None:
+        httpx_mock.add_response(url=_EXECUTE_URL, status_code=500)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = FastnClient(config_path=fastn_env(tmpdir), retry_policy=_FAST)
+            with pytest.raises(APIError) as exc_info:
+                client.execute("act_x", {})
+        assert exc_info.value.status_code == 500
+        assert len(httpx_mock.get_requests()) == 1
+
+    def test_exhausted_retries_raise_last_status(self, httpx_mock: HTTPXMock, fastn_env) -> None:
+        for _ in range(3):
+            httpx_mock.add_response(url=_RUN_URL, status_code=502)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = FastnClient(
+                config_path=fastn_env(tmpdir),
+                retry_policy=RetryPolicy(max_retries=2, base_delay=0.0),
+            )
+            with pytest.raises(APIError) as exc_info:
+                client.flows.get_run("run-1")
+        assert exc_info.value.status_code == 502
+        assert len(httpx_mock.get_requests()) == 3
+
+    def test_exhausted_connection_errors_raise_api_error(self, httpx_mock: HTTPXMock, fastn_env) -> None:
+        httpx_mock.add_exception(httpx.ConnectError("refused"), url=_EXECUTE_URL)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = FastnClient(config_path=fastn_env(tmpdir), max_retries=0)
+            with pytest.raises(APIError, match="after 1 attempts"):
+                client.execute("act_x", {})
+
+    def test_retry_after_is_slept(self, httpx_mock: HTTPXMock, monkeypatch, fastn_env) -> None:
+        sleeps: List[float] = []
+        monkeypatch.setattr("fastn._http.time.sleep", sleeps.append)
+        httpx_mock.add_response(url=_EXECUTE_URL, status_code=429, headers={"Retry-After": "3"})
+        httpx_mock.add_response(url=_EXECUTE_URL, json={"ok": True})
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = FastnClient(config_path=fastn_env(tmpdir), retry_policy=_FAST)
+            client.execute("act_x", {})
+        assert sleeps == [3.0]
+
+    def test_retry_after_beyond_max_delay_fails_fast(self, httpx_mock: HTTPXMock, fastn_env) -> None:
+        httpx_mock.add_response(url=_EXECUTE_URL, status_code=429, headers={"Retry-After": "3600"})
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = FastnClient(config_path=fastn_env(tmpdir), retry_policy=_FAST)
+            with pytest.raises(APIError) as exc_info:
+                client.execute("act_x", {})
+        assert exc_info.value.status_code == 429
+        assert len(httpx_mock.get_requests()) == 1
+
+    def test_budget_shared_across_calls(self, httpx_mock: HTTPXMock, fastn_env) -> None:
+        for _ in range(4):
+            httpx_mock.add_response(url=_RUN_URL, status_code=503)
+        policy = RetryPolicy(max_retries=3, base_delay=0.0, budget_ratio=0.0, budget_reserve=2.0)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = FastnClient(config_path=fastn_env(tmpdir), retry_policy=policy)
+            with pytest.raises(APIError):
+                client.flows.get_run("run-1")
+            with pytest.raises(APIError):
+                client.flows.get_run("run-1")
+        # 1 + 2 budgeted retries for the first call, no retries for the second
+        assert len(httpx_mock.get_requests()) == 4
+
+    def test_retries_reported_to_instrumentation(self, httpx_mock: HTTPXMock, fastn_env) -> None:
+        httpx_mock.add_response(url=_RUN_URL, status_code=503)
+        httpx_mock.add_exception(httpx.ReadTimeout("slow"), url=_RUN_URL)
+        httpx_mock.add_response(url=_RUN_URL, json={"status": "SUCCESS"})
+        recorder = _RetryRecorder()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = FastnClient(
+                config_path=fastn_env(tmpdir), retry_policy=_FAST,
+                instrumentation=recorder,
+            )
+            client.flows.get_run("run-1")
+        assert [(a, r) for a, _, r in recorder.retries] == [(1, "HTTP 503"), (2, "ReadTimeout")]
+
+    def test_max_retries_sets_policy(self, fastn_env) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = FastnClient(config_path=fastn_env(tmpdir), max_retries=5)
+        assert client._retry_policy.max_retries == 5
+
+
+class TestNonIdempotentRetries:
+    """Calls that change state are not re-sent once the server may have acted."""
+
+    def test_execute_502_is_not_retried(self, httpx_mock: HTTPXMock, fastn_env) -> None:
+        httpx_mock.add_response(url=_EXECUTE_URL, status_code=502)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = FastnClient(config_path=fastn_env(tmpdir), retry_policy=_FAST)
+            with pytest.raises(APIError) as exc_info:
+                client.execute("act_x", {})
+        assert exc_info.value.status_code == 502
+        assert len(httpx_mock.get_requests()) == 1
+
+    def test_execute_read_timeout_is_not_retried(self, httpx_mock: HTTPXMock, fastn_env) -> None:
+        httpx_mock.add_exception(httpx.ReadTimeout("slow"), url=_EXECUTE_URL)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = FastnClient(config_path=fastn_env(tmpdir), retry_policy=_FAST)
+            with pytest.raises(APIError, match="after 1 attempts"):
+                client.execute("act_x", {})
+        assert len(httpx_mock.get_requests()) == 1
+
+    def test_execute_retries_429_and_connect_error(self, httpx_mock: HTTPXMock, fastn_env) -> None:
+        httpx_mock.add_response(url=_EXECUTE_URL, status_code=429)
+        httpx_mock.add_exception(httpx.ConnectError("refused"), url=_EXECUTE_URL)
+        httpx_mock.add_response(url=_EXECUTE_URL, json={"ok": True})
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = FastnClient(config_path=fastn_env(tmpdir), retry_policy=_FAST)
+            assert client.execute("act_x", {}) == {"ok": True}
+        assert len(httpx_mock.get_requests()) == 3
+
+    def test_mutation_502_is_not_retried(self, httpx_mock: HTTPXMock, fastn_env) -> None:
+        httpx_mock.add_response(url=GRAPHQL_URL, status_code=502)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = FastnClient(config_path=fastn_env(tmpdir), retry_policy=_FAST)
+            with pytest.raises(APIError):
+                client.flows.deploy("flow-1")
+        assert len(httpx_mock.get_requests()) == 1
+
+    def test_flow_delete_503_is_not_retried(self, httpx_mock: HTTPXMock, fastn_env) -> None:
+        httpx_mock.add_response(url=f"{FLOWS_API_URL}/delete", status_code=503)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = FastnClient(config_path=fastn_env(tmpdir), retry_policy=_FAST)
+            with pytest.raises(APIError):
+                client.flows.delete("flow-1")
+        assert len(httpx_mock.get_requests()) == 1
+
+    def test_opt_in_retries_execute_502(self, httpx_mock: HTTPXMock, fastn_env) -> None:
+        httpx_mock.add_response(url=_EXECUTE_URL, status_code=502)
+        httpx_mock.add_response(url=_EXECUTE_URL, json={"ok": True})
+        policy = RetryPolicy(max_retries=3, base_delay=0.0, retry_non_idempotent=True)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = FastnClient(config_path=fastn_env(tmpdir), retry_policy=policy)
+            assert client.execute("act_x", {}) == {"ok": True}
+
+    async def test_async_mutation_504_is_not_retried(self, httpx_mock: HTTPXMock, fastn_env) -> None:
+        httpx_mock.add_response(url=GRAPHQL_URL, status_code=504)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = AsyncFastnClient(config_path=fastn_env(tmpdir), retry_policy=_FAST)
+            with pytest.raises(APIError):
+                await client.flows.deploy("flow-1")
+            await client.close()
+        assert len(httpx_mock.get_requests()) == 1
+
+
+class TestAsyncRetries:
+    async def test_graphql_retries_504(self, httpx_mock: HTTPXMock, fastn_env) -> None:
+        httpx_mock.add_response(url=GRAPHQL_URL, status_code=504)
+        httpx_mock.add_response(url=GRAPHQL_URL, json={"data": {"listUCLAgents": []}})
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = AsyncFastnClient(config_path=fastn_env(tmpdir), retry_policy=_FAST)
+            await client.skills.list()
+            await client.close()
+        assert len(httpx_mock.get_requests()) == 2
+
+    async def test_execute_retries_connect_timeout(self, httpx_mock: HTTPXMock, fastn_env) -> None:
+        httpx_mock.add_exception(httpx.ConnectTimeout("slow"), url=_EXECUTE_URL)
+        httpx_mock.add_response(url=_EXECUTE_URL, json={"ok": True})
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = AsyncFastnClient(config_path=fastn_env(tmpdir), retry_policy=_FAST)
+            assert await client.execute("act_x", {}) == {"ok": True}
+            await client.close()
@@ -0,0 +1,333 @@
+"""Tests for OAuth access-token refresh inside the SDK clients."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from fastn import _token_store
+from fastn.client import AsyncFastnClient, FastnClient
+from fastn.exceptions import OAuthError
+from fastn.oauth import TOKEN_URL
+
+_EXECUTE_URL = "https://live.fastn.ai/api/ucl/executeTool"
+
+_NEW_TOKEN = {
+    "access_token": "new-access-token",
+    "refresh_token": "new-refresh-token",
+    "expires_in": 3600,
+}
+
+
+def _login(expires_in: float) -> Dict[str, Any]:
+    """config.json keys for an OAuth login expiring in *expires_in* seconds."""
+    expiry = datetime.now(timezone.utc) + timedelta(seconds=expires_in)
+    return {
+        "api_key": None,
+        "auth_token": "old-access-token",
+        "refresh_token": "old-refresh-token",
+        "token_expiry": expiry.isoformat(),
+    }
+
+
+def _token_requests(httpx_mock: HTTPXMock):
+    return [r for r in httpx_mock.get_requests() if str(r.url) == TOKEN_URL]
+
+
+class TestSyncRefresh:
+    def test_expired_token_refreshed_over_client_pool(self, httpx_mock: HTTPXMock, fastn_env) -> None:
+        httpx_mock.add_response(url=TOKEN_URL, json=_NEW_TOKEN)
+        httpx_mock.add_response(url=_EXECUTE_URL, json={"ok": True})
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = FastnClient(config_path=fastn_env(tmpdir, **_login(-10)))
+            client.execute("act_x", {})
+
+        refresh, execute = httpx_mock.get_requests()
+        assert "authorization" not in refresh.headers
+        assert execute.headers["authorization"] == "Bearer new-access-token"
+
+
+class TestThreadedRefresh:
+    """Hammer one FastnClient from many threads while its token expires."""
+
+    THREADS = 16
+    CALLS = 40
+
+    def test_single_refresh_and_consistent_headers(self, fastn_env) -> None:
+        lock = threading.Lock()
+        refreshes: List[float] = []
+        seen: List[httpx.Headers] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if str(request.url) == TOKEN_URL:
+                time.sleep(0.05)  # widen the window for duplicate refreshes
+                with lock:
+                    refreshes.append(time.monotonic())
+                return httpx.Response(200, json=_NEW_TOKEN)
+            with lock:
+                seen.append(request.headers)
+            return httpx.Response(200, json={"ok": True})
+
+        # 30s is the expiry buffer, so the token turns stale ~0.1s in.
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = FastnClient(
+                config_path=fastn_env(tmpdir, **_login(30.1)),
+                transport=httpx.MockTransport(handler),
+            )
+            errors: List[BaseException] = []
+
+            def worker() -> None:
+                try:
+                    for _ in range(self.CALLS):
+                        client.execute("act_x", {}, tenant_id="t1")
+                        time.sleep(0.005)
+                except BaseException as e:  # pragma: no cover - reported below
+                    errors.append(e)
+
+            interval = sys.getswitchinterval()
+            sys.setswitchinterval(1e-5)
+            try:
+                threads = [threading.Thread(target=worker) for _ in range(self.THREADS)]
+                for t in threads:
+                    t.start()
+                for t in threads:
+                    t.join()
+            finally:
+                sys.setswitchinterval(interval)
+
+        assert errors == []
+        assert len(refreshes) == 1
+        assert len(seen) == self.THREADS * self.CALLS
+        tokens = {h["authorization"] for h in seen}
+        assert tokens == {"Bearer old-access-token", "Bearer new-access-token"}
+        for headers in seen:
+            assert headers["x-fastn-space-id"] == "test-project-id"
+            assert headers["x-fastn-space-tenantid"] == "t1"
+        assert client._headers["Authorization"] == "Bearer new-access-token"
+        assert client._config.token_expiry > datetime.now(timezone.utc).isoformat()
+
+
+def _refresh_in_child(config_path: str, log_path: str) -> None:
+    """Worker process: refresh a shared expired token, logging Keycloak hits."""
+    def handler(request: httpx.Request) -> httpx.Response:
+        if str(request.url) == TOKEN_URL:
+            with open(log_path, "a") as f:
+                f.write("refresh\n")
+            time.sleep(0.1)
+            return httpx.Response(200, json=_NEW_TOKEN)
+        return httpx.Response(200, json={"ok": True})
+
+    client = FastnClient(
+        config_path=config_path, share_token=True,
+        transport=httpx.MockTransport(handler),
+    )
+    client.execute("act_x", {})
+    with open(log_path, "a") as f:
+        f.write(client._headers["Authorization"] + "\n")
+
+
+class TestSharedTokenStore:
+    def _mock_refresh(self, counter: List[str]):
+        def handler(request: httpx.Request) -> httpx.Response:
+            if str(request.url) == TOKEN_URL:
+                counter.append(request.content.decode())
+                return httpx.Response(200, json=_NEW_TOKEN)
+            return httpx.Response(200, json={"ok": True})
+        return httpx.MockTransport(handler)
+
+    def test_second_client_adopts_published_token(self, fastn_env) -> None:
+        refreshes: List[str] = []
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = fastn_env(tmpdir, **_login(-10))
+            first = FastnClient(
+                config_path=path, share_token=True, transport=self._mock_refresh(refreshes),
+            )
+            second = FastnClient(
+                config_path=path, share_token=True, transport=self._mock_refresh(refreshes),
+            )
+            first.execute("act_x", {})
+            second.execute("act_x", {})
+
+            stored = json.loads(Path(path).read_text())
+
+        assert len(refreshes) == 1
+        assert second._headers["Authorization"] == "Bearer new-access-token"
+        assert stored["auth_token"] == "new-access-token"
+        assert stored["refresh_token"] == "new-refresh-token"
+        assert stored["project_id"] == "test-project-id"
+
+    def test_rotated_refresh_token_is_used(self, fastn_env) -> None:
+        refreshes: List[str] = []
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = fastn_env(tmpdir, **_login(-10))
+            client = FastnClient(
+                config_path=path, share_token=True, transport=self._mock_refresh(refreshes),
+            )
+            # Another process refreshed earlier; its access token has expired too.
+            data = json.loads(Path(path).read_text())
+            data.update(auth_token="other-token", refresh_token="rotated-refresh-token")
+            Path(path).write_text(json.dumps(data))
+            client.execute("act_x", {})
+
+        assert "refresh_token=rotated-refresh-token" in refreshes[0]
+
+    def test_not_shared_by_default(self, fastn_env) -> None:
+        refreshes: List[str] = []
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = fastn_env(tmpdir, **_login(-10))
+            before = Path(path).read_text()
+            client = FastnClient(config_path=path, transport=self._mock_refresh(refreshes))
+            client.execute("act_x", {})
+            assert Path(path).read_text() == before
+        assert client._token_store is None
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="fcntl locking")
+    def test_lock_file_closed_when_locking_fails(self, monkeypatch) -> None:
+        locked: List[int] = []
+
+        class _FailingFcntl:
+            LOCK_EX = 0
+
+            @staticmethod
+            def flock(fd: int, op: int) -> None:
+                locked.append(fd)
+                raise OSError("lock failed")
+
+        monkeypatch.setattr(_token_store, "fcntl", _FailingFcntl)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            store = _token_store._SharedTokenStore(Path(tmpdir) / "config.json")
+            with pytest.raises(OSError, match="lock failed") as failure:
+                store.acquire()
+            # Checked while the traceback (and any leaked handle) is alive.
+            with pytest.raises(OSError):
+                os.fstat(locked[0])
+            del failure
+
+    async def test_async_client_adopts_published_token(self, fastn_env) -> None:
+        refreshes: List[str] = []
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = fastn_env(tmpdir, **_login(-10))
+            FastnClient(
+                config_path=path, share_token=True, transport=self._mock_refresh(refreshes),
+            ).execute("act_x", {})
+
+            async def handler(request: httpx.Request) -> httpx.Response:
+                refreshes.append(str(request.url))
+                return httpx.Response(200, json={"ok": True})
+
+            client = AsyncFastnClient(
+                config_path=path, share_token=True, transport=httpx.MockTransport(handler),
+            )
+            # Loaded after the publish, so fake an older in-memory session.
+            client._apply_token(
+                "old-access-token", "old-refresh-token", "2000-01-01T00:00:00+00:00",
+            )
+            await client.execute("act_x", {})
+            await client.close()
+
+        assert refreshes[1:] == [_EXECUTE_URL]
+        assert client._headers["Authorization"] == "Bearer new-access-token"
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="fork-based worker test")
+    def test_worker_processes_refresh_once(self, fastn_env) -> None:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = fastn_env(tmpdir, **_login(-10))
+            log_path = str(Path(tmpdir) / "log.txt")
+            ctx = multiprocessing.get_context("fork")
+            workers = [
+                ctx.Process(target=_refresh_in_child, args=(path, log_path)) for _ in range(8)
+            ]
+            for w in workers:
+                w.start()
+            for w in workers:
+                w.join(timeout=30)
+            lines = Path(log_path).read_text().splitlines()
+
+        assert all(w.exitcode == 0 for w in workers)
+        assert lines.count("refresh") == 1
+        assert lines.count("Bearer new-access-token") == 8
+
+
+class TestAsyncRefresh:
+    async def test_concurrent_calls_share_one_refresh(self, httpx_mock: HTTPXMock, fastn_env) -> None:
+        httpx_mock.add_response(url=TOKEN_URL, json=_NEW_TOKEN)
+        httpx_mock.add_response(url=_EXECUTE_URL, json={"ok": True}, is_reusable=True)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = AsyncFastnClient(config_path=fastn_env(tmpdir, **_login(-10)))
+            await asyncio.gather(*(client.execute("act_x", {}) for _ in range(50)))
+            await client.close()
+
+        assert len(_token_requests(httpx_mock)) == 1
+        executes = [r for r in httpx_mock.get_requests() if str(r.url) == _EXECUTE_URL]
+        assert len(executes) == 50
+        assert {r.headers["authorization"] for r in executes} == {"Bearer new-access-token"}
+
+    async def test_refresh_does_not_send_client_headers(self, httpx_mock: HTTPXMock, fastn_env) -> None:
+        httpx_mock.add_response(url=TOKEN_URL, json=_NEW_TOKEN)
+        httpx_mock.add_response(url=_EXECUTE_URL, json={"ok": True})
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = AsyncFastnClient(config_path=fastn_env(tmpdir, **_login(-10)))
+            await client.execute("act_x", {})
+            await client.close()
+
+        refresh = _token_requests(httpx_mock)[0]
+        assert "authorization" not in refresh.headers
+        assert "x-fastn-space-id" not in refresh.headers
+        assert b"refresh_token=old-refresh-token" in refresh.content
+
+    async def test_refresh_starts_in_background_before_expiry(self, httpx_mock: HTTPXMock, fastn_env) -> None:
+        httpx_mock.add_response(url=TOKEN_URL, json=_NEW_TOKEN)
+        httpx_mock.add_response(url=_EXECUTE_URL, json={"ok": True}, is_reusable=True)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = AsyncFastnClient(config_path=fastn_env(tmpdir, **_login(45)))
+            await client.execute("act_x", {})
+            await client._refresh_task
+            await client.execute("act_x", {})
+            await client.close()
+
+        first, second = [r for r in httpx_mock.get_requests() if str(r.url) == _EXECUTE_URL]
+        # The first call did not wait for the refresh.
+        assert first.headers["authorization"] == "Bearer old-access-token"
+        assert second.headers["authorization"] == "Bearer new-access-token"
+
+    async def test_failed_background_refresh_does_not_fail_calls(
+        self, httpx_mock: HTTPXMock, fastn_env,
+    ) -> None:
+        httpx_mock.add_response(url=TOKEN_URL, status_code=400)
+        httpx_mock.add_response(url=_EXECUTE_URL, json={"ok": True})
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = AsyncFastnClient(config_path=fastn_env(tmpdir, **_login(45)))
+            assert await client.execute("act_x", {}) == {"ok": True}
+            with pytest.raises(OAuthError):
+                await client._refresh_task
+            await client.close()
+
+    async def test_expired_refresh_failure_raises(self, httpx_mock: HTTPXMock, fastn_env) -> None:
+        httpx_mock.add_response(url=TOKEN_URL, status_code=400)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = AsyncFastnClient(config_path=fastn_env(tmpdir, **_login(-10)))
+            with pytest.raises(OAuthError, match="Session expired"):
+                await client.execute("act_x", {})
+            await client.close()
+
+    async def test_valid_token_skips_refresh(self, httpx_mock: HTTPXMock, fastn_env) -> None:
+        httpx_mock.add_response(url=_EXECUTE_URL, json={"ok": True})
+        with tempfile.TemporaryDirectory() as tmpdir:
+            client = AsyncFastnClient(config_path=fastn_env(tmpdir, **_login(3600)))
+            await client.execute("act_x", {})
+            await client.close()
+
+        assert client._refresh_task is None